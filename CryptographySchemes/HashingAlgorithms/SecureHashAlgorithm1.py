@@ -1,4 +1,5 @@
 from HelperFunctions.IntegerHandler import *
+import struct
 
 class SHA1():
     '''
@@ -7,16 +8,32 @@ class SHA1():
     K_hex = ["5a827999","6ed9eba1","8f1bbcdc","ca62c1d6"]
     H_0_hex = ["67452301","efcdab89","98badcfe","10325476","c3d2e1f0"]
 
-    def __init__(self, word_bits = 32, truncate_bit_length = None):
+    def __init__(self, word_bits = 32, truncate_bit_length = None, use_words = True):
+        '''
+        This method initializes the sha 1 object
+
+        Parameters :
+            word_bits : int, optional
+                The size of each word in bits, default is 32
+            truncate_bit_length : int, optional
+                The length in bits to truncate the hash to, default is None
+            use_words : bool, optional
+                Whether blocks are processed on plain integer words (processMessageBlockWords) rather than IntegerHandlers, default is True
+                The IntegerHandler path is kept for tracing intermediate values
+        '''
         self.word_bits:int = word_bits
         self.endian:bool = False
         self.truncate_bit_length = truncate_bit_length
+        self.use_words = use_words
         self.H_0 = []
         self.K = []
         for i in range(0,len(self.H_0_hex)):
             self.H_0.append(IntegerHandler.fromHexString(self.H_0_hex[i],self.endian,self.word_bits))
         for i in range(0,len(self.K_hex)):
             self.K.append(IntegerHandler.fromHexString(self.K_hex[i],self.endian,self.word_bits))
+        self.H_0_words = [int(H_0_hex, 16) for H_0_hex in self.H_0_hex]
+        self.K_words = [int(K_hex, 16) for K_hex in self.K_hex]
+        self.word_mask = (1 << word_bits) - 1
         self.chunk_size = 512
         self.chunk_capacity = 448
         self.length_bits = 64
@@ -34,6 +51,8 @@ class SHA1():
                 The hash for the string as an IntegerHandler
         '''
 
+        if self.use_words:
+            return self.hashBytes(self.messageToBytes(message))
         message_chunks = self.preprocessing_FromString(message=message)
         hash_value = self.H_0
         for i in range(0,len(message_chunks)):
@@ -59,6 +78,8 @@ class SHA1():
                 The hash for the string as an IntegerHandler
         '''
 
+        if self.use_words:
+            return self.hashBytes(self.messageToBytes(message, is_hex=True, byte_length=bytes))
         message_chunks = self.preprocessing_FromString(message=message,is_hex=True,bytes=bytes)
         hash_value = self.H_0
         for i in range(0,len(message_chunks)):
@@ -69,6 +90,153 @@ class SHA1():
             hash = hash.truncateLeft(bit_length=self.truncate_bit_length)
         return hash
 
+    def hashBytes(self, message:bytes) -> IntegerHandler:
+        '''
+        This method hashes bytes using plain integer words for each message block
+
+        Parameters :
+            message : bytes
+                The bytes to be hashed
+
+        Returns :
+            hash : IntegerHandler
+                The hash for the bytes as an IntegerHandler
+        '''
+
+        padded_message = self.padMessageBytes(message)
+        block_format = f">16{'I' if self.word_bits == 32 else 'Q'}"
+        block_bytes = self.chunk_size // 8
+        hash_value = self.H_0_words
+        for offset in range(0, len(padded_message), block_bytes):
+            hash_value = self.processMessageBlockWords(struct.unpack_from(block_format, padded_message, offset), hash_value)
+        return self.wordsToHandler(hash_value)
+
+    def createHasher(self, data:bytes = None):
+        '''
+        This method creates an incremental hasher using this sha variant
+
+        Parameters :
+            data : bytes, optional
+                Initial data to hash, default is None
+
+        Returns :
+            hasher : SHA_Hasher
+                The incremental hasher, with update(), copy(), digest() and hexdigest()
+        '''
+
+        return SHA_Hasher(self, data=data)
+
+    def messageToBytes(self, message:str, is_hex:bool = False, byte_length:int = 0) -> bytes:
+        '''
+        This method converts a string message (utf-8) or hex string to bytes, with the same lengths used by preprocessing_FromString
+
+        Parameters :
+            message : str
+                The message to be hashed as a string (utf-8) or a hex string
+            is_hex : bool, optional
+                Whether the input is a hex string, default is False
+            byte_length : int, optional
+                The number of bytes in the hex string, default is 0
+
+        Returns :
+            message_bytes : bytes
+                The message as bytes
+        '''
+
+        if not is_hex:
+            encoded = message.encode("utf-8")
+            byte_length = len(message)
+        else:
+            hex_string = message.replace(" ","")
+            if len(hex_string) % 2 != 0:
+                hex_string = "0" + hex_string
+            encoded = bytes.fromhex(hex_string)
+        value = int.from_bytes(encoded, "big") % (1 << (8 * byte_length))
+        return value.to_bytes(byte_length, "big")
+
+    def padMessageBytes(self, message:bytes) -> bytes:
+        '''
+        This method adds the padding to a message as bytes
+
+        5.1.1 "SHA-1, SHA-224 and SHA-256" and 5.1.2 "SHA-384, SHA-512, SHA-512/224 and SHA-512/256" of NIST FIPS 180-4
+        https://nvlpubs.nist.gov/nistpubs/FIPS/NIST.FIPS.180-4.pdf
+
+        Parameters :
+            message : bytes
+                The message being padded
+
+        Returns :
+            padded_message : bytes
+                The message followed by a 1 bit, 0 bits and the message length, a multiple of the chunk size
+        '''
+
+        length = 8 * len(message)
+        k = (-length - 1 + self.chunk_capacity) % self.chunk_size
+        return message + b"\x80" + b"\x00" * (k // 8) + length.to_bytes(self.length_bits // 8, "big")
+
+    def wordsToHandler(self, hash_words:list[int]) -> IntegerHandler:
+        '''
+        This method concatenates the hash words into a single IntegerHandler, truncating it if necessary
+
+        Parameters :
+            hash_words : [int]
+                The hash value as a list of words
+
+        Returns :
+            hash : IntegerHandler
+                The hash as an IntegerHandler
+        '''
+
+        value = 0
+        for word in hash_words:
+            value = (value << self.word_bits) | word
+        bit_length = self.word_bits * len(hash_words)
+        if self.truncate_bit_length != None:
+            value >>= bit_length - self.truncate_bit_length
+            bit_length = self.truncate_bit_length
+        return IntegerHandler(value, self.endian, bit_length)
+
+    def processMessageBlockWords(self, message_block:list[int], previous_hash:list[int]) -> list[int]:
+        '''
+        This message hashes a single message block using plain integers masked to the word size
+
+        Parameters :
+            message_block : [int]
+                The message block of 512 bits as a list of 16 32 bit integers
+            previous_hash : [int]
+                The previous hash value as a list of 5 32 bit integers
+
+        Returns
+            hash : [int]
+                The hash value after this message block as a list of 5 32 bit integers
+        '''
+
+        mask = self.word_mask
+        message_schedule = list(message_block)
+        for t in range(16,80):
+            xor_result = message_schedule[t-3] ^ message_schedule[t-8] ^ message_schedule[t-14] ^ message_schedule[t-16]
+            message_schedule.append(((xor_result << 1) | (xor_result >> 31)) & mask)
+
+        a,b,c,d,e = previous_hash
+        K_0, K_1, K_2, K_3 = self.K_words
+
+        for t in range(0,80):
+            if t <= 19:
+                T = ((b & c) ^ (~b & d)) + K_0
+            elif t <= 39:
+                T = (b ^ c ^ d) + K_1
+            elif t <= 59:
+                T = ((b & c) ^ (b & d) ^ (c & d)) + K_2
+            else:
+                T = (b ^ c ^ d) + K_3
+            T = (((a << 5) | (a >> 27)) + T + e + message_schedule[t]) & mask
+            e = d
+            d = c
+            c = ((b << 30) | (b >> 2)) & mask
+            b = a
+            a = T
+        return [(previous_hash[0] + a) & mask, (previous_hash[1] + b) & mask, (previous_hash[2] + c) & mask, (previous_hash[3] + d) & mask, (previous_hash[4] + e) & mask]
+
     def processMessageBlock(self, message_block:list[IntegerHandler],previousHash:list[IntegerHandler]):
         '''
         This message hashes a single message block
@@ -258,6 +426,103 @@ class SHA1():
         y_and_z = bitwiseAnd([y, z], self.endian, self.word_bits)
         maj_result = bitwiseXor([x_and_y,x_and_z,y_and_z], self.endian, self.word_bits)
         return maj_result
+class SHA_Hasher():
+    '''
+    This class implements an incremental hash for sha 1 and the sha 2 family
+    Only a partial message block is buffered and the padding is added when the digest is taken
+    '''
+
+    def __init__(self, hash_object:SHA1, data:bytes = None):
+        '''
+        This method initializes the incremental hasher
+
+        Parameters :
+            hash_object : SHA1
+                The sha variant (SHA1, SHA224, SHA256, SHA384, SHA512, SHA512_224 or SHA512_256) providing the constants and block processing
+            data : bytes, optional
+                Initial data to hash, default is None
+        '''
+
+        self.hash_object = hash_object
+        self.block_bytes = hash_object.chunk_size // 8
+        self.word_format = "I" if hash_object.word_bits == 32 else "Q"
+        self.block_format = f">16{self.word_format}"
+        self.hash_value = hash_object.H_0_words
+        self.message_length = 0
+        self.buffer = bytearray()
+        if data != None:
+            self.update(data)
+
+    def update(self, data:bytes):
+        '''
+        This method hashes more of the message
+
+        Parameters :
+            data : bytes
+                The next part of the message
+        '''
+
+        data = memoryview(data).cast("B")
+        self.message_length += len(data)
+        position = 0
+        if len(self.buffer) > 0:
+            position = min(self.block_bytes - len(self.buffer), len(data))
+            self.buffer += data[:position]
+            if len(self.buffer) < self.block_bytes:
+                return
+            self.hash_value = self.hash_object.processMessageBlockWords(struct.unpack(self.block_format, self.buffer), self.hash_value)
+            self.buffer = bytearray()
+        while len(data) - position >= self.block_bytes:
+            self.hash_value = self.hash_object.processMessageBlockWords(struct.unpack_from(self.block_format, data, position), self.hash_value)
+            position += self.block_bytes
+        self.buffer += data[position:]
+
+    def copy(self):
+        '''
+        This method copies the hasher, so that messages with a common prefix only need to hash it once
+
+        Returns :
+            hasher : SHA_Hasher
+                An independent copy of the current hasher
+        '''
+
+        hasher = SHA_Hasher.__new__(SHA_Hasher)
+        hasher.__dict__.update(self.__dict__)
+        hasher.buffer = self.buffer.copy()
+        return hasher
+
+    def digest(self) -> bytes:
+        '''
+        This method gets the digest of everything hashed so far, further updates can still be made
+
+        Returns :
+            digest : bytes
+                The hash digest as bytes
+        '''
+
+        hash_object = self.hash_object
+        length = 8 * self.message_length
+        k = (-length - 1 + hash_object.chunk_capacity) % hash_object.chunk_size
+        final_blocks = bytes(self.buffer) + b"\x80" + b"\x00" * (k // 8) + length.to_bytes(hash_object.length_bits // 8, "big")
+        hash_value = self.hash_value
+        for offset in range(0, len(final_blocks), self.block_bytes):
+            hash_value = hash_object.processMessageBlockWords(struct.unpack_from(self.block_format, final_blocks, offset), hash_value)
+        digest = struct.pack(f">{len(hash_value)}{self.word_format}", *hash_value)
+        if hash_object.truncate_bit_length != None:
+            digest = digest[:hash_object.truncate_bit_length // 8]
+        return digest
+
+    def hexdigest(self) -> str:
+        '''
+        This method gets the digest of everything hashed so far as a hexadecimal string
+
+        Returns :
+            digest : str
+                The hash digest as a hexadecimal string
+        '''
+
+        return self.digest().hex().upper()
+
 sha1 = SHA1()
 
 if __name__ =="__main__":
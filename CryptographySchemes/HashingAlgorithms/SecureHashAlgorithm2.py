@@ -18,8 +18,11 @@ class SHA256(SHA1):
                "748f82ee", "78a5636f", "84c87814", "8cc70208", "90befffa", "a4506ceb", "bef9a3f7", "c67178f2"]
 
 
-    def __init__(self, word_bits = 32, truncate_bit_length = None):
-        super().__init__(word_bits=word_bits, truncate_bit_length=truncate_bit_length)
+    # The rotations and shifts for Sigma 0, Sigma 1, sigma 0 and sigma 1, used when processing blocks as plain integer words
+    sigma_rotations = ((2, 13, 22), (6, 11, 25), (7, 18, 3), (17, 19, 10))
+
+    def __init__(self, word_bits = 32, truncate_bit_length = None, use_words = True):
+        super().__init__(word_bits=word_bits, truncate_bit_length=truncate_bit_length, use_words=use_words)
         self.number_of_iterations = 64
         
     def sigmaCapitalFromZero(self, x:IntegerHandler):
@@ -106,6 +109,54 @@ class SHA256(SHA1):
         sigma_result = bitwiseXor([rotr_17,rotr_19,shr_10], self.endian, self.word_bits)
         return sigma_result
 
+    def processMessageBlockWords(self, message_block:list[int], previous_hash:list[int]) -> list[int]:
+        '''
+        This message hashes a single message block using plain integers masked to the word size
+
+        Parameters :
+            message_block : [int]
+                The message block as a list of 16 words
+            previous_hash : [int]
+                The previous hash value as a list of 8 words
+
+        Returns
+            hash : [int]
+                The hash value after this message block as a list of 8 words
+        '''
+
+        n = self.word_bits
+        mask = self.word_mask
+        (S0_1, S0_2, S0_3), (S1_1, S1_2, S1_3), (s0_1, s0_2, s0_shift), (s1_1, s1_2, s1_shift) = self.sigma_rotations
+
+        message_schedule = list(message_block)
+        for t in range(16, self.number_of_iterations):
+            W_2 = message_schedule[t-2]
+            W_15 = message_schedule[t-15]
+            sigma_one_2 = ((W_2 >> s1_1) | (W_2 << (n - s1_1))) ^ ((W_2 >> s1_2) | (W_2 << (n - s1_2))) ^ (W_2 >> s1_shift)
+            sigma_zero_15 = ((W_15 >> s0_1) | (W_15 << (n - s0_1))) ^ ((W_15 >> s0_2) | (W_15 << (n - s0_2))) ^ (W_15 >> s0_shift)
+            message_schedule.append((sigma_one_2 + message_schedule[t-7] + sigma_zero_15 + message_schedule[t-16]) & mask)
+
+        a,b,c,d,e,f,g,h = previous_hash
+        K = self.K_words
+
+        # the rotations leave bits above the word size, these only carry upwards so masking the sums is enough
+        for t in range(0, self.number_of_iterations):
+            sigma_big_one_e = ((e >> S1_1) | (e << (n - S1_1))) ^ ((e >> S1_2) | (e << (n - S1_2))) ^ ((e >> S1_3) | (e << (n - S1_3)))
+            T_1 = h + sigma_big_one_e + ((e & f) ^ (~e & g)) + K[t] + message_schedule[t]
+            sigma_big_zero_a = ((a >> S0_1) | (a << (n - S0_1))) ^ ((a >> S0_2) | (a << (n - S0_2))) ^ ((a >> S0_3) | (a << (n - S0_3)))
+            T_2 = sigma_big_zero_a + ((a & b) ^ (a & c) ^ (b & c))
+            h = g
+            g = f
+            f = e
+            e = (d + T_1) & mask
+            d = c
+            c = b
+            b = a
+            a = (T_1 + T_2) & mask
+
+        return [(previous_hash[0] + a) & mask, (previous_hash[1] + b) & mask, (previous_hash[2] + c) & mask, (previous_hash[3] + d) & mask,
+                (previous_hash[4] + e) & mask, (previous_hash[5] + f) & mask, (previous_hash[6] + g) & mask, (previous_hash[7] + h) & mask]
+
     def processMessageBlock(self, message_block:list[IntegerHandler],previousHash:list[IntegerHandler]):
         '''
         This message hashes a single message block
@@ -187,8 +238,8 @@ class SHA256(SHA1):
 
 class SHA224(SHA256):
     H_0_hex = ["c1059ed8", "367cd507", "3070dd17", "f70e5939", "ffc00b31", "68581511", "64f98fa7", "befa4fa4"]
-    def __init__(self):
-        super().__init__(truncate_bit_length=224)
+    def __init__(self, use_words = True):
+        super().__init__(truncate_bit_length=224, use_words=use_words)
     
 class SHA512(SHA256):
 
@@ -216,8 +267,10 @@ class SHA512(SHA256):
                 "28db77f523047d84", "32caab7b40c72493", "3c9ebe0a15c9bebc", "431d67c49c100d4c",
                 "4cc5d4becb3e42b6", "597f299cfc657e2a", "5fcb6fab3ad6faec", "6c44198c4a475817"]
     
-    def __init__(self, truncate_bit_length=None):
-        super().__init__(word_bits=64, truncate_bit_length=truncate_bit_length)
+    sigma_rotations = ((28, 34, 39), (14, 18, 41), (1, 8, 7), (19, 61, 6))
+
+    def __init__(self, truncate_bit_length=None, use_words = True):
+        super().__init__(word_bits=64, truncate_bit_length=truncate_bit_length, use_words=use_words)
         self.number_of_iterations = 80
         self.chunk_size = 1024
         self.chunk_capacity = 896
@@ -311,22 +364,22 @@ class SHA384(SHA512):
     H_0_hex = ["cbbb9d5dc1059ed8", "629a292a367cd507", "9159015a3070dd17", "152fecd8f70e5939",
                "67332667ffc00b31", "8eb44a8768581511", "db0c2e0d64f98fa7", "47b5481dbefa4fa4"]
     
-    def __init__(self):
-        super().__init__(truncate_bit_length=384)
+    def __init__(self, use_words = True):
+        super().__init__(truncate_bit_length=384, use_words=use_words)
     
 class SHA512_224(SHA512):
     H_0_hex = ["8C3D37C819544DA2", "73E1996689DCD4D6", "1DFAB7AE32FF9C82", "679DD514582F9FCF",
                "0F6D2B697BD44DA8", "77E36F7304C48942", "3F9D85A86A1D36C8", "1112E6AD91D692A1"]
     
-    def __init__(self):
-        super().__init__(truncate_bit_length=224)
+    def __init__(self, use_words = True):
+        super().__init__(truncate_bit_length=224, use_words=use_words)
     
 class SHA512_256(SHA512):
     H_0_hex = ["22312194FC2BF72C", "9F555FA3C84C64C2", "2393B86B6F53B151", "963877195940EABD",
                "96283EE2A88EFFE3", "BE5E1E2553863992", "2B0199FC2C85B8AA", "0EB72DDC81C52CA2"]
     
-    def __init__(self):
-        super().__init__(truncate_bit_length=256)
+    def __init__(self, use_words = True):
+        super().__init__(truncate_bit_length=256, use_words=use_words)
     
 sha256 = SHA256()
 sha224 = SHA224()
@@ -1,4 +1,5 @@
 from HelperFunctions.IntegerHandler import *
+import struct
 
 class SHA3_ValueHandler():
     '''
@@ -519,10 +520,142 @@ class Keccak():
         '''
 
         return Keccak.keccak_p(message_chunk, 24)
+
+class Keccak_Lanes():
+    '''
+    This class holds a lane oriented implementation of keccak f[1600] as according to https://nvlpubs.nist.gov/nistpubs/FIPS/NIST.FIPS.202.pdf
+    The state is held as 25 64 bit integers, where lane (x, y) is stored at index x + 5 * y
+    '''
+
+    lane_mask = 0xFFFFFFFFFFFFFFFF
+
+    round_constants = [
+        0x0000000000000001, 0x0000000000008082, 0x800000000000808A, 0x8000000080008000, 0x000000000000808B, 0x0000000080000001,
+        0x8000000080008081, 0x8000000000008009, 0x000000000000008A, 0x0000000000000088, 0x0000000080008009, 0x000000008000000A,
+        0x000000008000808B, 0x800000000000008B, 0x8000000000008089, 0x8000000000008003, 0x8000000000008002, 0x8000000000000080,
+        0x000000000000800A, 0x800000008000000A, 0x8000000080008081, 0x8000000000008080, 0x0000000080000001, 0x8000000080008008]
+
+    # rho and pi combined as (destination, source, offset), A′[x, y] = rot(A[(x + 3y) mod 5, x], offset) using the rho_matrix offsets
+    rho_pi_schedule = [
+        (0, 0, 0), (1, 6, 44), (2, 12, 43), (3, 18, 21), (4, 24, 14),
+        (5, 3, 28), (6, 9, 20), (7, 10, 3), (8, 16, 45), (9, 22, 61),
+        (10, 1, 1), (11, 7, 6), (12, 13, 25), (13, 19, 8), (14, 20, 18),
+        (15, 4, 27), (16, 5, 36), (17, 11, 10), (18, 17, 15), (19, 23, 56),
+        (20, 2, 62), (21, 8, 55), (22, 14, 39), (23, 15, 41), (24, 21, 2)]
+
+    # chi neighbours as (lane, x + 1 lane, x + 2 lane), A′[x, y] = A[x, y] ⊕ ((A[(x+1) mod 5, y] ⊕ 1) ⋅ A[(x+2) mod 5, y])
+    chi_schedule = [
+        (0, 1, 2), (1, 2, 3), (2, 3, 4), (3, 4, 0), (4, 0, 1),
+        (5, 6, 7), (6, 7, 8), (7, 8, 9), (8, 9, 5), (9, 5, 6),
+        (10, 11, 12), (11, 12, 13), (12, 13, 14), (13, 14, 10), (14, 10, 11),
+        (15, 16, 17), (16, 17, 18), (17, 18, 19), (18, 19, 15), (19, 15, 16),
+        (20, 21, 22), (21, 22, 23), (22, 23, 24), (23, 24, 20), (24, 20, 21)]
+
+    @staticmethod
+    def keccak_f(lanes:list[int]) -> list[int]:
+        '''
+        This method implements keccak f[1600] on a lane oriented state, running all 24 rounds of Rnd(A, ir) = ι(χ(π(ρ(θ(A)))), ir)
+
+        Parameters :
+            lanes : [int]
+                The state as 25 64 bit lanes
+
+        Returns :
+            lanes : [int]
+                The state as 25 64 bit lanes after it has been processed
+        '''
+
+        mask = Keccak_Lanes.lane_mask
+        rho_pi_schedule = Keccak_Lanes.rho_pi_schedule
+        chi_schedule = Keccak_Lanes.chi_schedule
+        A = lanes
+        B = [0] * 25
+        for round_constant in Keccak_Lanes.round_constants:
+            # θ
+            C = [A[x] ^ A[x + 5] ^ A[x + 10] ^ A[x + 15] ^ A[x + 20] for x in range(0, 5)]
+            D = [C[(x - 1) % 5] ^ (((C[(x + 1) % 5] << 1) | (C[(x + 1) % 5] >> 63)) & mask) for x in range(0, 5)]
+            # ρ and π
+            for destination, source, offset in rho_pi_schedule:
+                lane = A[source] ^ D[source % 5]
+                B[destination] = ((lane << offset) | (lane >> (64 - offset))) & mask
+            # χ
+            A = [B[i] ^ (~B[j] & B[k]) for i, j, k in chi_schedule]
+            # ι
+            A[0] ^= round_constant
+        return A
+
+    @staticmethod
+    def lanesFromBitArray(bit_array:list[int]) -> list[int]:
+        '''
+        This method converts a bit array (of at most 1600 bits) into 25 lanes, with any missing bits set to 0
+
+        Parameters :
+            bit_array : [int]
+                The bits being converted, index w(5y+x)+z holding bit z of lane (x, y)
+
+        Returns :
+            lanes : [int]
+                The state as 25 64 bit lanes
+        '''
+
+        bit_array = bit_array + [0] * (-len(bit_array) % 64)
+        lanes = [0] * 25
+        for i in range(0, len(bit_array) // 64):
+            lanes[i] = int("".join(str(bit) for bit in reversed(bit_array[i * 64:i * 64 + 64])), 2)
+        return lanes
+
+    @staticmethod
+    def bitArrayFromLanes(lanes:list[int], bit_length:int = 1600) -> list[int]:
+        '''
+        This method converts the lanes of a state into a bit array
+
+        Parameters :
+            lanes : [int]
+                The state as 25 64 bit lanes
+            bit_length : int, optional
+                The number of bits to return, default is the full 1600 bit state
+
+        Returns :
+            bit_array : [int]
+                The bits of the state, index w(5y+x)+z holding bit z of lane (x, y)
+        '''
+
+        bit_array = []
+        for lane in lanes[:ceil(bit_length / 64)]:
+            bit_array += [(lane >> z) & 1 for z in range(0, 64)]
+        return bit_array[:bit_length]
+
+    @staticmethod
+    def sponge(padded_bit_array:list[int], rate:int, output_length:int) -> list[int]:
+        '''
+        This method implements the sponge construction on top of the lane oriented keccak f[1600]
+
+        Parameters :
+            padded_bit_array : [int]
+                The input, already padded to a multiple of the rate
+            rate : int
+                The rate in bits, a multiple of 64
+            output_length : int
+                The number of bits to squeeze out
+
+        Returns :
+            output : [int]
+                The first output_length bits squeezed from the sponge
+        '''
+
+        lanes = [0] * 25
+        for start in range(0, len(padded_bit_array), rate):
+            block_lanes = Keccak_Lanes.lanesFromBitArray(padded_bit_array[start:start + rate])
+            lanes = Keccak_Lanes.keccak_f([lane ^ block_lane for lane, block_lane in zip(lanes, block_lanes)])
+        output = Keccak_Lanes.bitArrayFromLanes(lanes, rate)
+        while output_length > len(output):
+            lanes = Keccak_Lanes.keccak_f(lanes)
+            output += Keccak_Lanes.bitArrayFromLanes(lanes, rate)
+        return output[:output_length]
     
 class SHA3():
 
-    def __init__(self, f, digest_length, is_debug = False):
+    def __init__(self, f, digest_length, is_debug = False, use_lanes = True):
         '''
         This method initializes the SHA 3 object
 
@@ -531,6 +664,8 @@ class SHA3():
                 the function name
             digest_length: int
                 The size of the SHA3 digest in bits
+            use_lanes : bool, optional
+                Whether the sponge uses the lane oriented keccak f (Keccak_Lanes) rather than the bit by bit state array, default is True
         '''
 
         self.function_name = f
@@ -538,6 +673,7 @@ class SHA3():
         self.capacity = digest_length * 2
         self.b = 1600
         self.is_debug = is_debug
+        self.use_lanes = use_lanes
 
     def hashBitArray(self, bit_array:list[int]) -> SHA3_ValueHandler:
         '''
@@ -587,13 +723,30 @@ class SHA3():
         input_handler = input_handler.concatenate(SHA3_ValueHandler([0,1]))
         return self.sponge(input_handler)
 
-    def sponge(self, input_handler:SHA3_ValueHandler) -> SHA3_ValueHandler:
+    def createHasher(self, data:bytes = None):
+        '''
+        This method creates an incremental hasher with the same parameters as this SHA3 object
+
+        Parameters :
+            data : bytes, optional
+                Initial data to absorb, default is None
+
+        Returns :
+            hasher : SHA3_Hasher
+                The incremental hasher, with update(), copy(), digest() and hexdigest()
+        '''
+
+        return SHA3_Hasher(self.function_name, (self.b - self.capacity) // 8, self.digest_length, data=data)
+
+    def sponge(self, input_handler:SHA3_ValueHandler, use_lanes:bool = None) -> SHA3_ValueHandler:
         '''
         This method should implement sponge as according to Algorithm 8 of https://nvlpubs.nist.gov/nistpubs/FIPS/NIST.FIPS.202.pdf
 
         Parameters:
             input_handler : SHA3_ValueHandler
                 The input currently being processessed as a SHA3_ValueHandler
+            use_lanes : bool, optional
+                Whether to use the lane oriented keccak f, default is None which uses self.use_lanes
         
         Returns :
             digest : SHA3_ValueHandler
@@ -601,6 +754,10 @@ class SHA3():
         '''
         r = self.b - self.capacity
         padded_input = input_handler.concatenate(self.addPadding(r, input_handler.bit_length))
+        if use_lanes == None:
+            use_lanes = self.use_lanes
+        if use_lanes:
+            return SHA3_ValueHandler(Keccak_Lanes.sponge(padded_input.bit_array, r, self.digest_length))
         input_chunks:list[SHA3_ValueHandler] = padded_input.splitSegments(r)
         segment_count = len(input_chunks)
         S = SHA3_ValueHandler([0] * self.b)
@@ -640,58 +797,58 @@ class SHA3_224(SHA3):
     This class instantiates a sha 3 object with a 224 bit digest length
     '''
 
-    def __init__(self):
+    def __init__(self, use_lanes = True):
         '''
         method class instantiates a sha 3 object with a 224 bit digest length
         '''
 
-        super().__init__(f="SHA3-224", digest_length=224)
+        super().__init__(f="SHA3-224", digest_length=224, use_lanes=use_lanes)
 
 class SHA3_256(SHA3):
     '''
     This class instantiates a sha 3 object with a 256 bit digest length
     '''
 
-    def __init__(self):
+    def __init__(self, use_lanes = True):
         '''
         This method instantiates a sha 3 object with a 256 bit digest length
         '''
 
-        super().__init__(f="SHA3-256", digest_length=256)
+        super().__init__(f="SHA3-256", digest_length=256, use_lanes=use_lanes)
         
 class SHA3_384(SHA3):
     '''
     This class instantiates a sha 3 object with a 384 bit digest length
     '''
 
-    def __init__(self):
+    def __init__(self, use_lanes = True):
         '''
         This method instantiates a sha 3 object with a 384 bit digest length
         '''
 
-        super().__init__(f="SHA3-384", digest_length=384)
+        super().__init__(f="SHA3-384", digest_length=384, use_lanes=use_lanes)
 
 class SHA3_512(SHA3):
     '''
     This class instantiates a sha 3 object with a 512 bit digest length
     '''
-    def __init__(self):
+    def __init__(self, use_lanes = True):
         '''
         This method instantiates a sha 3 object with a 512 bit digest length
         '''
         
-        super().__init__(f="SHA3-512", digest_length=512)
+        super().__init__(f="SHA3-512", digest_length=512, use_lanes=use_lanes)
 
 class SHAKE_128(SHA3):
     '''
     This class instantiates a sha 3 object with a 512 bit digest length
     '''
-    def __init__(self,f="Shake-128", digest_length:int = 128):
+    def __init__(self,f="Shake-128", digest_length:int = 128, use_lanes = True):
         '''
         This method instantiates a sha 3 object with a 512 bit digest length
         '''
         
-        super().__init__(f=f, digest_length=digest_length)
+        super().__init__(f=f, digest_length=digest_length, use_lanes=use_lanes)
 
     def hashBitArray(self, bit_array:list[int], digest_length:int) -> SHA3_ValueHandler:
         '''
@@ -741,13 +898,32 @@ class SHAKE_128(SHA3):
         input_handler = input_handler.concatenate(SHA3_ValueHandler([1,1,1,1]))
         return self.sponge(input_handler, digest_length)
 
-    def sponge(self, input_handler:SHA3_ValueHandler, d:int) -> SHA3_ValueHandler:
+    def createHasher(self, data:bytes = None):
+        '''
+        This method creates an incremental shake hasher with the same capacity as this SHAKE object
+
+        Parameters :
+            data : bytes, optional
+                Initial data to absorb, default is None
+
+        Returns :
+            hasher : SHAKE_Hasher
+                The incremental hasher, with update(), copy(), digest(length) and hexdigest(length)
+        '''
+
+        return SHAKE_Hasher(self.function_name, (self.b - self.capacity) // 8, data=data)
+
+    def sponge(self, input_handler:SHA3_ValueHandler, d:int, use_lanes:bool = None) -> SHA3_ValueHandler:
         '''
         This method should implement sponge as according to Algorithm 8 of https://nvlpubs.nist.gov/nistpubs/FIPS/NIST.FIPS.202.pdf
 
         Parameters:
             input_handler : SHA3_ValueHandler
                 The input currently being processessed as a SHA3_ValueHandler
+            d : int
+                The length of the digest in bits
+            use_lanes : bool, optional
+                Whether to use the lane oriented keccak f, default is None which uses self.use_lanes
         
         Returns :
             digest : SHA3_ValueHandler
@@ -755,6 +931,10 @@ class SHAKE_128(SHA3):
         '''
         r = self.b - self.capacity
         padded_input = input_handler.concatenate(self.addPadding(r, input_handler.bit_length))
+        if use_lanes == None:
+            use_lanes = self.use_lanes
+        if use_lanes:
+            return SHA3_ValueHandler(Keccak_Lanes.sponge(padded_input.bit_array, r, d))
         input_chunks:list[SHA3_ValueHandler] = padded_input.splitSegments(r)
         segment_count = len(input_chunks)
         S = SHA3_ValueHandler([0] * self.b)
@@ -773,12 +953,266 @@ class SHAKE_256(SHAKE_128):
     '''
     This class instantiates a sha 3 object with a 512 bit digest length
     '''
-    def __init__(self):
+    def __init__(self, use_lanes = True):
         '''
         This method instantiates a sha 3 object with a 512 bit digest length
         '''
         
-        super().__init__(f="Shake-128", digest_length=256)
+        super().__init__(f="Shake-128", digest_length=256, use_lanes=use_lanes)
+
+class SHA3_Hasher():
+    '''
+    This class implements an incremental sha 3 hash on top of the lane oriented keccak f
+    Input is absorbed one rate sized block at a time so only a partial block is ever buffered
+    '''
+
+    def __init__(self, function_name:str, rate:int, digest_length:int, suffix:int = 0x06, data:bytes = None):
+        '''
+        This method initializes the incremental hasher
+
+        Parameters :
+            function_name : str
+                The function name
+            rate : int
+                The rate of the sponge in bytes
+            digest_length : int
+                The size of the digest in bits
+            suffix : int, optional
+                The domain separation bits followed by the first padding bit as a byte, default is 0x06 (01 then 1)
+            data : bytes, optional
+                Initial data to absorb, default is None
+        '''
+
+        self.function_name = function_name
+        self.rate = rate
+        self.digest_length = digest_length
+        self.suffix = suffix
+        self.lanes = [0] * 25
+        self.buffer = bytearray()
+        self.lane_format = f"<{rate // 8}Q"
+        if data != None:
+            self.update(data)
+
+    def absorbBlock(self, block, offset:int = 0):
+        '''
+        This method xors a single rate sized block into the state and runs keccak f
+
+        Parameters :
+            block : bytes | bytearray | memoryview
+                The buffer holding the block
+            offset : int, optional
+                The offset of the block within the buffer, default is 0
+        '''
+
+        lanes = self.lanes
+        for i, block_lane in enumerate(struct.unpack_from(self.lane_format, block, offset)):
+            lanes[i] ^= block_lane
+        self.lanes = Keccak_Lanes.keccak_f(lanes)
+
+    def update(self, data:bytes):
+        '''
+        This method absorbs more of the message
+
+        Parameters :
+            data : bytes
+                The next part of the message
+        '''
+
+        data = memoryview(data).cast("B")
+        position = 0
+        if len(self.buffer) > 0:
+            position = min(self.rate - len(self.buffer), len(data))
+            self.buffer += data[:position]
+            if len(self.buffer) < self.rate:
+                return
+            self.absorbBlock(self.buffer)
+            self.buffer = bytearray()
+        while len(data) - position >= self.rate:
+            self.absorbBlock(data, position)
+            position += self.rate
+        self.buffer += data[position:]
+
+    def copy(self):
+        '''
+        This method copies the hasher, so that messages with a common prefix only need to absorb it once
+
+        Returns :
+            hasher : SHA3_Hasher
+                An independent copy of the current hasher
+        '''
+
+        hasher = self.__class__.__new__(self.__class__)
+        hasher.__dict__.update(self.__dict__)
+        hasher.lanes = self.lanes.copy()
+        hasher.buffer = self.buffer.copy()
+        return hasher
+
+    def finalState(self) -> list[int]:
+        '''
+        This method pads the buffered input with pad10*1 and absorbs it, without changing the hasher
+
+        Returns :
+            lanes : [int]
+                The state as 25 64 bit lanes, ready to be squeezed
+        '''
+
+        final_block = self.buffer + bytes(self.rate - len(self.buffer))
+        final_block[len(self.buffer)] ^= self.suffix
+        final_block[-1] ^= 0x80
+        final_hasher = self.copy()
+        final_hasher.absorbBlock(final_block)
+        return final_hasher.lanes
+
+    def squeeze(self, lanes:list[int], length:int) -> bytes:
+        '''
+        This method squeezes a number of bytes out of a padded state
+
+        Parameters :
+            lanes : [int]
+                The state as 25 64 bit lanes after the final block has been absorbed
+            length : int
+                The number of bytes to squeeze
+
+        Returns :
+            output : bytes
+                The bytes squeezed from the sponge
+        '''
+
+        output = bytearray(struct.pack("<25Q", *lanes)[:self.rate])
+        while len(output) < length:
+            lanes = Keccak_Lanes.keccak_f(lanes)
+            output += struct.pack("<25Q", *lanes)[:self.rate]
+        return bytes(output[:length])
+
+    def digest(self) -> bytes:
+        '''
+        This method gets the digest of everything absorbed so far, further updates can still be made
+
+        Returns :
+            digest : bytes
+                The hash digest as bytes
+        '''
+
+        return self.squeeze(self.finalState(), self.digest_length // 8)
+
+    def hexdigest(self) -> str:
+        '''
+        This method gets the digest of everything absorbed so far as a hexadecimal string
+
+        Returns :
+            digest : str
+                The hash digest as a hexadecimal string
+        '''
+
+        return self.digest().hex().upper()
+
+class SHAKE_Hasher(SHA3_Hasher):
+    '''
+    This class implements an incremental shake hash, where the digest length is chosen when the digest is taken
+    '''
+
+    def __init__(self, function_name:str, rate:int, data:bytes = None):
+        '''
+        This method initializes the incremental shake hasher
+
+        Parameters :
+            function_name : str
+                The function name
+            rate : int
+                The rate of the sponge in bytes
+            data : bytes, optional
+                Initial data to absorb, default is None
+        '''
+
+        super().__init__(function_name, rate, digest_length=None, suffix=0x1F, data=data)
+
+    def digest(self, length:int) -> bytes:
+        '''
+        This method gets a digest of a given length for everything absorbed so far
+
+        Parameters :
+            length : int
+                The length of the digest in bytes
+
+        Returns :
+            digest : bytes
+                The hash digest as bytes
+        '''
+
+        return self.squeeze(self.finalState(), length)
+
+    def hexdigest(self, length:int) -> str:
+        '''
+        This method gets a digest of a given length for everything absorbed so far as a hexadecimal string
+
+        Parameters :
+            length : int
+                The length of the digest in bytes
+
+        Returns :
+            digest : str
+                The hash digest as a hexadecimal string
+        '''
+
+        return self.digest(length).hex().upper()
+
+    def reader(self):
+        '''
+        This method pads everything absorbed so far and returns a reader to squeeze an unbounded amount of output from it
+
+        Returns :
+            reader : SHAKE_Reader
+                The reader, with read(length)
+        '''
+
+        return SHAKE_Reader(self.finalState(), self.rate)
+
+class SHAKE_Reader():
+    '''
+    This class squeezes the output of a shake sponge on demand, running keccak f only when the current rate sized block runs out
+    '''
+
+    def __init__(self, lanes:list[int], rate:int):
+        '''
+        This method initializes the reader from an already padded state
+
+        Parameters :
+            lanes : [int]
+                The state as 25 64 bit lanes after the final block has been absorbed
+            rate : int
+                The rate of the sponge in bytes
+        '''
+
+        self.lanes = lanes
+        self.rate = rate
+        self.block = struct.pack("<25Q", *lanes)[:rate]
+        self.position = 0
+
+    def read(self, length:int) -> bytes:
+        '''
+        This method reads the next bytes of output
+
+        Parameters :
+            length : int
+                The number of bytes to read
+
+        Returns :
+            output : bytes
+                The next bytes squeezed from the sponge
+        '''
+
+        output = bytearray(length)
+        written = 0
+        while written < length:
+            if self.position == self.rate:
+                self.lanes = Keccak_Lanes.keccak_f(self.lanes)
+                self.block = struct.pack("<25Q", *self.lanes)[:self.rate]
+                self.position = 0
+            count = min(self.rate - self.position, length - written)
+            output[written:written + count] = self.block[self.position:self.position + count]
+            self.position += count
+            written += count
+        return bytes(output)
 
 sha3_224 = SHA3_224()
 sha3_256 = SHA3_256()
@@ -2,6 +2,9 @@ from CryptographySchemes.SymmetricEncryptionAlgorithms.TripleDataEncryptionStand
 from CryptographySchemes.SymmetricEncryptionAlgorithms.AES_ModesOfOperation import AES_ECB_128, AES_ECB_192, AES_ECB_256
 from HelperFunctions.IntegerHandler import *
 from math import ceil
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
 
 class CMAC_3DES():
     '''
@@ -10,6 +13,11 @@ class CMAC_3DES():
     https://nvlpubs.nist.gov/nistpubs/SpecialPublications/NIST.SP.800-38b.pdf
     '''
 
+    # The block size of the cypher in bits, so it is known before a key is set
+    block_size = 64
+    # The subkeys K1 and K2 as ints, computed the first time they are needed and then kept for the key
+    subkey_values = None
+
     def __init__(self, key:str):
         '''
         This message initializes CMAC with 3DES and a given key
@@ -37,6 +45,21 @@ class CMAC_3DES():
         encrypted_hex = self.block_encryption.encryptHex(hex_string)
         return encrypted_hex
 
+    def cypherValue(self, value:int) -> int:
+        '''
+        This method uses the symetric block encryption algorithm in order to encrypt a single block as an int
+
+        Parameters :
+            value : int
+                The block to be encrypted
+
+        Returns :
+            encrypted_value : int
+                The encrypted block
+        '''
+
+        return self.block_encryption.encryptBlockValue(value)
+
     def subkeyGeneration(self):
         '''
         This method generates two subkeys
@@ -46,16 +69,46 @@ class CMAC_3DES():
                 The two subkeys for the CMAC
         '''
 
-        byte_length = self.block_size // 4
-        L = self.cypher("0" * byte_length)
-        L = IntegerHandler.fromHexString(L,False,self.block_size)
-        K1 = L.leftShift(1)
-        if L.getMostSignificantBits(1).getBitArray()[0] == 1:
-            K1 = bitwiseXor([K1,self.R_b], False, self.block_size)
-        K2 = K1.leftShift(1)
-        if K1.getMostSignificantBits(1).getBitArray()[0] == 1:
-            K2 = bitwiseXor([K2,self.R_b], False, self.block_size)
-        return K1, K2
+        K1, K2 = self.subkeyValues()
+        return IntegerHandler(K1, False, self.block_size), IntegerHandler(K2, False, self.block_size)
+
+    def subkeyValues(self) -> tuple[int, int]:
+        '''
+        This method generates the two subkeys as ints, only encrypting the zero block the first time for each key
+
+        Returns :
+            K1, K2 : int
+                The two subkeys for the CMAC
+        '''
+
+        if self.subkey_values is None:
+            b = self.block_size
+            mask = (1 << b) - 1
+            R_b = self.R_b.getValue()
+            L = self.cypherValue(0)
+            K1 = (L << 1) & mask
+            if L >> (b - 1):
+                K1 ^= R_b
+            K2 = (K1 << 1) & mask
+            if K1 >> (b - 1):
+                K2 ^= R_b
+            self.subkey_values = (K1, K2)
+        return self.subkey_values
+
+    def createContext(self, tag_length:int = None):
+        '''
+        This method creates a context so a message can be authenticated incrementally in constant memory
+
+        Parameters :
+            tag_length : int, optional
+                The length in bits of the tag the context generates and accepts, a multiple of 8, defaults to the block size
+
+        Returns :
+            context : CMAC_Context
+                The streaming context using this key
+        '''
+
+        return CMAC_Context(self, tag_length)
     
     def cmacGeneration(self, message_hex:str, tag_length:int):
         '''
@@ -72,6 +125,12 @@ class CMAC_3DES():
                 The tag as a hex string
         '''
 
+        if len(message_hex) % 2 == 0:
+            context = self.createContext()
+            context.update(bytes.fromhex(message_hex))
+            return IntegerHandler(context.macValue() >> (self.block_size - tag_length), False, tag_length).getHexString()
+
+        # a message with an odd number of hex characters is not whole bytes, so it is split into bits
         message_bits = IntegerHandler.fromHexString(message_hex, False, len(message_hex) * 4).getBitArray()
         K1, K2 = self.subkeyGeneration()
         message_length = len(message_bits)
@@ -127,6 +186,8 @@ class CMAC_AES128(CMAC_3DES):
     https://nvlpubs.nist.gov/nistpubs/SpecialPublications/NIST.SP.800-38b.pdf
     '''
 
+    block_size = 128
+
     def __init__(self, key:str):
         '''
         This message initializes CMAC with AES 128 and a given key
@@ -142,6 +203,21 @@ class CMAC_AES128(CMAC_3DES):
     def cypher(self, hex_string):
         result_list = self.block_encryption.encryptHexList([hex_string])
         return result_list[0]
+
+    def cypherValue(self, value:int) -> int:
+        '''
+        This method uses the symetric block encryption algorithm in order to encrypt a single block as an int
+
+        Parameters :
+            value : int
+                The block to be encrypted
+
+        Returns :
+            encrypted_value : int
+                The encrypted block
+        '''
+
+        return self.block_encryption.cypherValue(value)
         
 class CMAC_AES192(CMAC_AES128):
     '''
@@ -179,4 +255,304 @@ class CMAC_AES256(CMAC_AES128):
         '''
         self.block_encryption = AES_ECB_256(key=key)
         self.block_size = 128
-        self.R_b = IntegerHandler.fromBitString("0" * 120 + "10000111", False, self.block_size)
\ No newline at end of file
+        self.R_b = IntegerHandler.fromBitString("0" * 120 + "10000111", False, self.block_size)
+
+class CMAC_Context():
+    '''
+    This class holds the running state of a single CMAC, so a message can be added in chunks
+
+    Only the last, possibly partial, block of the message is buffered, since it is the only block combined with a subkey
+    '''
+
+    def __init__(self, cmac:CMAC_3DES, tag_length:int = None):
+        '''
+        This method initializes the CMAC context
+
+        Parameters :
+            cmac : CMAC_3DES
+                The keyed CMAC instance, providing the block cypher and the cached subkeys
+            tag_length : int, optional
+                The length in bits of the tag the context generates and accepts, a multiple of 8, defaults to the block size
+        '''
+
+        if tag_length is None:
+            tag_length = cmac.block_size
+        if tag_length <= 0 or tag_length > cmac.block_size or tag_length % 8 != 0:
+            raise ValueError(f"The tag length must be a multiple of 8 bits up to {cmac.block_size}, not {tag_length}")
+        self.cmac = cmac
+        self.tag_length = tag_length
+        self.block_bytes = cmac.block_size // 8
+        self.chaining_value = 0
+        self.buffer = bytearray()
+        self.mac_value = None
+
+    def update(self, data:bytes):
+        '''
+        This method adds the next chunk of the message, which must be before the context is finalized
+
+        Parameters :
+            data : bytes
+                The next chunk of the message
+        '''
+
+        if self.mac_value is not None:
+            raise ValueError("No more of the message can be added after the context has been finalized")
+        view = memoryview(data)
+        block_bytes = self.block_bytes
+        if len(self.buffer) + len(view) <= block_bytes:
+            self.buffer += view
+            return
+
+        # the buffered block is now known not to be the last one, so it is encrypted along with every whole block
+        # of the new data apart from the last 1 to block_bytes bytes, which become the new buffer
+        offset = block_bytes - len(self.buffer)
+        self.buffer += view[:offset]
+        cypher_value = self.cmac.cypherValue
+        C = cypher_value(self.chaining_value ^ int.from_bytes(self.buffer, "big"))
+        last_start = offset + (len(view) - offset - 1) // block_bytes * block_bytes
+        for start in range(offset, last_start, block_bytes):
+            C = cypher_value(C ^ int.from_bytes(view[start:start+block_bytes], "big"))
+        self.buffer = bytearray(view[last_start:])
+        self.chaining_value = C
+
+    def macValue(self) -> int:
+        '''
+        This method completes the CMAC, combining the last block with K1 if it is whole or padding it and using K2 if it is not
+        After this no more of the message can be added
+
+        Returns :
+            mac : int
+                The full block length CMAC as an int
+        '''
+
+        if self.mac_value is None:
+            K1, K2 = self.cmac.subkeyValues()
+            block_bytes = self.block_bytes
+            if len(self.buffer) == block_bytes:
+                last_block = int.from_bytes(self.buffer, "big") ^ K1
+            else:
+                padded_block = bytes(self.buffer) + b"\x80" + bytes(block_bytes - len(self.buffer) - 1)
+                last_block = int.from_bytes(padded_block, "big") ^ K2
+            self.mac_value = self.cmac.cypherValue(self.chaining_value ^ last_block)
+        return self.mac_value
+
+    def finalize(self) -> bytes:
+        '''
+        This method gets the CMAC tag for everything added so far, truncated to the tag length of the context
+
+        Returns :
+            tag : bytes
+                The tag as bytes
+        '''
+
+        return self.macValue().to_bytes(self.block_bytes, "big")[:self.tag_length // 8]
+
+    def verify(self, tag:bytes) -> bool:
+        '''
+        This method verifies a tag against the message added so far, comparing the tags in constant time
+        A tag which is not exactly the tag length of the context is always rejected
+
+        Parameters :
+            tag : bytes
+                The tag being verified
+
+        Returns :
+            verified : bool
+                Whether the tag is valid
+        '''
+
+        expected_tag = self.finalize()
+        if len(tag) * 8 != self.tag_length:
+            return False
+        return secrets.compare_digest(expected_tag, bytes(tag))
+
+# The keyed CMAC instances in each worker process, so the cypher and subkeys for a key are reused across chunks
+cmac_worker_instances = {}
+
+def cmacWorkerVerify(cmac_class:type, key:str, tag_length:int, indexed_records:list[tuple[int, bytes, bytes]]) -> list[int]:
+    '''
+    This method verifies one chunk of records which all use the same key, in a worker process
+    A record whose tag is not exactly tag_length bits long is always rejected
+
+    Parameters :
+        cmac_class : type
+            The CMAC class for the block cypher, such as CMAC_AES128
+        key : str
+            The key as a hex string
+        tag_length : int
+            The expected tag length in bits
+        indexed_records : [(int, bytes, bytes)]
+            The records as (position in the batch, message, tag) tuples
+
+    Returns :
+        verified_indexes : [int]
+            The positions in the batch of the records whose tags were verified
+    '''
+
+    cmac = cmac_worker_instances.get((cmac_class, key))
+    if cmac is None:
+        if len(cmac_worker_instances) >= 1024:
+            cmac_worker_instances.clear()
+        cmac = cmac_class(key)
+        cmac_worker_instances[(cmac_class, key)] = cmac
+    verified_indexes = []
+    for index, message, tag in indexed_records:
+        context = cmac.createContext(tag_length)
+        context.update(message)
+        if context.verify(tag):
+            verified_indexes.append(index)
+    return verified_indexes
+
+class CMAC_BatchVerifier():
+    '''
+    This class verifies large batches of CMAC tagged messages which use a table of keys
+
+    The records are grouped by key and each group is split into chunks which are verified across a process pool,
+    with each worker keeping the CMAC instance for a key so the cypher and subkeys are only set up once per key
+    The pool is started by the first batch that needs it and reused for later batches until close() is called
+    '''
+
+    def __init__(self, cmac_class:type, keys:dict, tag_length:int, max_workers:int = None, chunk_size:int = 1024, is_debug:bool = False):
+        '''
+        This method initializes the batch verifier
+
+        Parameters :
+            cmac_class : type
+                The CMAC class for the block cypher, such as CMAC_AES128
+            keys : {key_id : str}
+                The keys as hex strings for each key id used by the records
+            tag_length : int
+                The length in bits of every tag, a multiple of 8 up to the block size, records with a tag of any other length are rejected
+            max_workers : int, optional
+                The number of worker processes, 1 verifies in this process, defaults to the number of processors
+            chunk_size : int, optional
+                The largest number of records sent to a worker at a time, defaults to 1024
+            is_debug : bool, optional
+                Whether the throughput of each batch is printed, defaults to False
+        '''
+
+        if tag_length <= 0 or tag_length > cmac_class.block_size or tag_length % 8 != 0:
+            raise ValueError(f"The tag length must be a multiple of 8 bits up to {cmac_class.block_size}, not {tag_length}")
+        self.cmac_class = cmac_class
+        self.keys = keys
+        self.tag_length = tag_length
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.is_debug = is_debug
+        self.batch_statistics = None
+        self.executor = None
+
+    def verifyMany(self, records:list[tuple[object, bytes, bytes]]) -> int:
+        '''
+        This method verifies a batch of records, the batch size and throughput are stored in batch_statistics
+
+        Parameters :
+            records : [(key_id, bytes, bytes)]
+                The records as (key id, message, tag) tuples, a record with an unknown key id or a tag which is not
+                tag_length bits long fails verification
+
+        Returns :
+            verified_bits : int
+                The results as a bit vector, where bit i is set if the tag of record i was verified
+        '''
+
+        start_time = time.perf_counter()
+        groups = {}
+        byte_count = 0
+        for index, (key_id, message, tag) in enumerate(records):
+            byte_count += len(message)
+            if key_id in self.keys:
+                groups.setdefault(key_id, []).append((index, message, tag))
+
+        chunk_size = max(1, self.chunk_size)
+        chunk_keys = []
+        chunks = []
+        for key_id, group in groups.items():
+            for start in range(0, len(group), chunk_size):
+                chunk_keys.append(self.keys[key_id])
+                chunks.append(group[start:start+chunk_size])
+
+        if self.max_workers == 1 or len(chunks) <= 1:
+            results = map(cmacWorkerVerify, [self.cmac_class] * len(chunks), chunk_keys, [self.tag_length] * len(chunks), chunks)
+        else:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            results = self.executor.map(cmacWorkerVerify, [self.cmac_class] * len(chunks), chunk_keys, [self.tag_length] * len(chunks), chunks)
+        verified_bits = self.packResults(results, len(records))
+
+        self.recordBatchStatistics(len(records), byte_count, verified_bits.bit_count(), start_time)
+        return verified_bits
+
+    def close(self):
+        '''
+        This method shuts down the worker pool, if one has been started, a new pool is started if a later batch needs one
+        '''
+
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        '''
+        This method allows the verifier to be used in a with statement, so the worker pool is shut down at the end of it
+
+        Returns :
+            verifier : CMAC_BatchVerifier
+                This verifier
+        '''
+
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        '''
+        This method shuts down the worker pool at the end of a with statement
+        '''
+
+        self.close()
+
+    def packResults(self, results, record_count:int) -> int:
+        '''
+        This method packs the verified positions from every chunk into a bit vector
+
+        Parameters :
+            results : [[int]]
+                The verified positions from each chunk
+            record_count : int
+                The number of records in the batch
+
+        Returns :
+            verified_bits : int
+                The bit vector, where bit i is set if record i was verified
+        '''
+
+        bits = bytearray((record_count + 7) // 8)
+        for verified_indexes in results:
+            for index in verified_indexes:
+                bits[index >> 3] |= 1 << (index & 7)
+        return int.from_bytes(bits, "little")
+
+    def recordBatchStatistics(self, record_count:int, byte_count:int, verified_count:int, start_time:float):
+        '''
+        This method stores the size and throughput of the last batch in batch_statistics, printing them when debugging
+
+        Parameters :
+            record_count : int
+                The number of records in the batch
+            byte_count : int
+                The number of message bytes in the batch
+            verified_count : int
+                The number of records whose tags were verified
+            start_time : float
+                The time.perf_counter() value when the batch started
+        '''
+
+        seconds = max(time.perf_counter() - start_time, 1e-9)
+        self.batch_statistics = {"records" : record_count,
+                                 "verified" : verified_count,
+                                 "rejected" : record_count - verified_count,
+                                 "bytes" : byte_count,
+                                 "seconds" : seconds,
+                                 "records_per_second" : record_count / seconds,
+                                 "bytes_per_second" : byte_count / seconds}
+        if self.is_debug:
+            print(f"Batch of {record_count} records ({byte_count} bytes) in {seconds:.6f}s : {record_count / seconds:.0f} records/s {byte_count / seconds:.0f} bytes/s, {verified_count} verified")
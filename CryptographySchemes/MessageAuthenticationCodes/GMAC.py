@@ -0,0 +1,154 @@
+from CryptographySchemes.SymmetricEncryptionAlgorithms.AES_GaloisCounterMode import AES_GCM_128, AES_GCM_192, AES_GCM_256, AES_GCM_Context
+
+class GMAC_AES128():
+    '''
+    A Galois Message Authentication Code abbreviated as GMAC, which is AES GCM with only additional data and no plain text
+
+    The keyed AES GCM instance is kept so the hash subkey and its GHASH tables are only computed once per key
+
+    https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38d.pdf
+    '''
+
+    def __init__(self, key:str, table_bits:int = 8):
+        '''
+        This method initializes GMAC with AES 128 and a given key
+
+        Parameters :
+            key : str
+                The key for AES 128 as a hex string
+            table_bits : int, optional
+                The number of bits (4 or 8) handled per lookup in the GHASH tables, defaults to 8
+        '''
+        self.gcm = AES_GCM_128(key, table_bits=table_bits)
+
+    def createContext(self, initialization_vector:bytes, tag_length:int = 128):
+        '''
+        This method creates a context so the data can be authenticated incrementally
+
+        Parameters :
+            initialization_vector : bytes
+                The initialization vector as bytes
+            tag_length : int, optional
+                The length in bits of the tag the context generates and accepts, defaults to 128
+
+        Returns :
+            context : GMAC_Context
+                The streaming context using this key
+        '''
+
+        return GMAC_Context(self.gcm, initialization_vector, tag_length)
+
+    def gmacGeneration(self, initialization_vector:bytes, data:bytes, tag_length:int = 128) -> bytes:
+        '''
+        This method generates the GMAC tag for some data
+
+        Parameters :
+            initialization_vector : bytes
+                The initialization vector as bytes
+            data : bytes
+                The data to be authenticated
+            tag_length : int, optional
+                The tag length in bits, defaults to 128
+
+        Returns :
+            tag : bytes
+                The generated tag
+        '''
+
+        context = self.createContext(initialization_vector, tag_length)
+        context.update(data)
+        return context.finalize()
+
+    def gmacVerification(self, initialization_vector:bytes, data:bytes, tag:bytes, tag_length:int) -> bool:
+        '''
+        This method verifies a GMAC tag for some data, comparing the tags in constant time
+        A tag which is not exactly tag_length bits long is always rejected
+
+        Parameters :
+            initialization_vector : bytes
+                The initialization vector as bytes
+            data : bytes
+                The data that was authenticated
+            tag : bytes
+                The tag being verified
+            tag_length : int
+                The expected tag length in bits, one of 128, 120, 112, 104, 96, 64 or 32
+
+        Returns :
+            verified : bool
+                Whether the tag is valid
+        '''
+
+        context = self.createContext(initialization_vector, tag_length)
+        context.update(data)
+        return context.verify(tag)
+
+class GMAC_AES192(GMAC_AES128):
+    '''
+    A Galois Message Authentication Code abbreviated as GMAC.
+
+    https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38d.pdf
+    '''
+
+    def __init__(self, key:str, table_bits:int = 8):
+        '''
+        This method initializes GMAC with AES 192 and a given key
+
+        Parameters :
+            key : str
+                The key for AES 192 as a hex string
+            table_bits : int, optional
+                The number of bits (4 or 8) handled per lookup in the GHASH tables, defaults to 8
+        '''
+        self.gcm = AES_GCM_192(key, table_bits=table_bits)
+
+class GMAC_AES256(GMAC_AES128):
+    '''
+    A Galois Message Authentication Code abbreviated as GMAC.
+
+    https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38d.pdf
+    '''
+
+    def __init__(self, key:str, table_bits:int = 8):
+        '''
+        This method initializes GMAC with AES 256 and a given key
+
+        Parameters :
+            key : str
+                The key for AES 256 as a hex string
+            table_bits : int, optional
+                The number of bits (4 or 8) handled per lookup in the GHASH tables, defaults to 8
+        '''
+        self.gcm = AES_GCM_256(key, table_bits=table_bits)
+
+class GMAC_Context(AES_GCM_Context):
+    '''
+    This class holds the running GHASH of a single GMAC, where everything passed to update() is additional data
+    No counter blocks are encrypted apart from J_0 for the final tag
+    '''
+
+    def __init__(self, gcm:AES_GCM_128, initialization_vector:bytes, tag_length:int = 128):
+        '''
+        This method initializes the GMAC context
+
+        Parameters :
+            gcm : AES_GCM_128
+                The keyed AES GCM instance, providing the cypher and the GHASH tables
+            initialization_vector : bytes
+                The initialization vector as bytes
+            tag_length : int, optional
+                The length in bits of the tag the context generates and accepts, defaults to 128
+        '''
+
+        super().__init__(gcm, initialization_vector, tag_length=tag_length)
+
+    def update(self, data:bytes):
+        '''
+        This method adds the next chunk of data to be authenticated
+
+        Parameters :
+            data : bytes
+                The next chunk of data
+        '''
+
+        self.updateAad(data)
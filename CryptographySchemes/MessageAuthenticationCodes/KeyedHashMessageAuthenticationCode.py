@@ -1,6 +1,7 @@
 from CryptographySchemes.HashingAlgorithms.SecureHashAlgorithm3 import *
 from CryptographySchemes.HashingAlgorithms.SecureHashAlgorithm2 import *
 from HelperFunctions.IntegerHandler import *
+import secrets
 
 class HMAC():
     '''
@@ -98,6 +99,21 @@ class HMAC():
 
         return final_hash
     
+    def createContext(self, key:str):
+        '''
+        This method creates a keyed context, which processes the key once so that each mac only needs to hash the message
+
+        Parameters :
+            key : str
+                The hex string for the key
+
+        Returns :
+            context : HMAC_Context
+                The keyed context for this hmac variant
+        '''
+
+        return HMAC_Context(self, key)
+
     def hashIntegerHandler(self, handler: IntegerHandler) -> IntegerHandler:
         '''
         This method generates the hash value for the Integer Handler which has been passed to it
@@ -118,6 +134,92 @@ class HMAC():
         hash_result = hash_result.getHexString()
         return IntegerHandler.fromHexString(hash_result, little_endian=False, bit_length=bit_length)
     
+class HMAC_Context():
+    '''
+    This class holds a keyed hmac, with the hash states after K0 xor ipad and K0 xor opad (the midstates) cached
+    Each mac copies the cached states, so only the message and the inner hash need to be processed
+    '''
+
+    def __init__(self, hmac:HMAC, key:str):
+        '''
+        This method initializes the keyed context, processing the key and absorbing the padded key blocks
+
+        Parameters :
+            hmac : HMAC
+                The hmac variant, providing the hash function and b
+            key : str
+                The hex string for the key
+        '''
+
+        self.hmac = hmac
+        key_hex = key.replace(" ","")
+        if len(key_hex) % 2 != 0:
+            key_hex = "0" + key_hex
+        key_bytes = bytes.fromhex(key_hex)
+        block_bytes = hmac.b // 8
+        if len(key_bytes) > block_bytes:
+            key_bytes = hmac.sha.createHasher(key_bytes).digest()
+        K_0 = key_bytes + bytes(block_bytes - len(key_bytes))
+
+        self.inner_hasher = hmac.sha.createHasher(bytes(key_byte ^ 0x36 for key_byte in K_0))
+        self.outer_hasher = hmac.sha.createHasher(bytes(key_byte ^ 0x5c for key_byte in K_0))
+
+    def generateMac(self, message:bytes) -> bytes:
+        '''
+        This method calculates the hmac for a message using the cached key states
+
+        Parameters :
+            message : bytes
+                The message as bytes
+
+        Returns :
+            mac : bytes
+                The hmac as bytes
+        '''
+
+        inner_hasher = self.inner_hasher.copy()
+        inner_hasher.update(message)
+        outer_hasher = self.outer_hasher.copy()
+        outer_hasher.update(inner_hasher.digest())
+        return outer_hasher.digest()
+
+    def verifyMac(self, message:bytes, mac:bytes) -> bool:
+        '''
+        This method verifies an hmac for a message, comparing the macs in constant time
+
+        Parameters :
+            message : bytes
+                The message as bytes
+            mac : bytes
+                The hmac being verified
+
+        Returns :
+            verified : bool
+                Whether the hmac matches the message
+        '''
+
+        return secrets.compare_digest(self.generateMac(message), mac)
+
+    def HMAC(self, message:str) -> IntegerHandler:
+        '''
+        This method calculates the hmac for a string message, with the same output as HMAC.HMAC
+
+        The message is converted with IntegerHandler.fromString as in HMAC.HMAC, which keeps len(message) bytes of its
+        utf-8 encoding, so a non ascii message matches HMAC.HMAC rather than the hmac of its full utf-8 encoding
+
+        Parameters :
+            message : str
+                The message as a string
+
+        Returns :
+            hmac : IntegerHandler
+                The hmac as an IntegerHandler
+        '''
+
+        message_handler = IntegerHandler.fromString(message, little_endian=False, bit_length=len(message) * 8)
+        mac = self.generateMac(message_handler.getValue().to_bytes(len(message), "big"))
+        return IntegerHandler(int.from_bytes(mac, "big"), little_endian=False, bit_length=len(mac) * 8)
+
 class HMAC_SHA224(HMAC):
     def __init__(self):
         super().__init__(hashing_algorithm=sha224, b=512, l=224)
@@ -1,6 +1,11 @@
 from HelperFunctions.IntegerHandler import *
 from CryptographySchemes.SymmetricEncryptionAlgorithms.AdvancedEncryptionStandard import *
 from math import ceil
+import struct
+import secrets
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+import time
 
 class GCM_Block(IntegerHandler):
     '''
@@ -72,13 +77,9 @@ class GCM_Block(IntegerHandler):
             gcm_block : GCM_Block
                 The new GCM Block with the incremented value
         '''
-        stationary_bit_count = 128 - variable_bit_count
-        stationary_bits = self.getBitArray()[:stationary_bit_count]
-        variable_bits =  IntegerHandler.fromBitArray(self.getBitArray()[stationary_bit_count:], False, variable_bit_count)
-        variable_bits.setValue(variable_bits.getValue()+1)
-
-        updated_bits = stationary_bits + variable_bits.getBitArray()
-        return GCM_Block.fromBitArray(updated_bits)
+        # only the least significant bits are incremented, wrapping around without carrying into the stationary bits
+        variable_mask = (1 << variable_bit_count) - 1
+        return GCM_Block((self.value & ~variable_mask) | ((self.value + 1) & variable_mask))
 
     def rightShift(self,shift_amount):
         '''
@@ -126,7 +127,13 @@ class AES_GCM_128(AES128):
     https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38d.pdf
     '''
 
-    def __init__(self, key:str, is_debug:bool = False):
+    # The reduction polynomial for GF(2^128) in GCM's reflected bit order, R = 11100001 || 0^120
+    reduction_polynomial = 0xE1000000000000000000000000000000
+
+    # The tag lengths in bits allowed by NIST SP-800 38D Section 5.2.1.2, with 64 and 32 only for some applications
+    valid_tag_lengths = (128, 120, 112, 104, 96, 64, 32)
+
+    def __init__(self, key:str, is_debug:bool = False, table_bits:int = 8):
         '''
         This method initializes the AES GCM with a given key
 
@@ -135,10 +142,114 @@ class AES_GCM_128(AES128):
                 The key as a hexadecimal string
             is_debug : bool, optional
                 Whether the AES GCM instance is being debugged and should output intermediary values
+            table_bits : int, optional
+                The number of bits (4 or 8) of the multiplier handled per lookup in the GHASH tables, defaults to 8
+                The 8 bit tables use 512 entries and need 16 lookups per block, the 4 bit tables use 32 entries and need 32 lookups
         '''
 
+        self.table_bits = table_bits
         super().__init__(key)
         self.is_debug = is_debug
+        self.batch_statistics = None
+
+    def keyExpansion(self, is_debug = False):
+        '''
+        This method expands the key as in AES and then derives the hash subkey H and its GHASH multiplication tables,
+        so they are only computed once each time the key is set
+        '''
+
+        super().keyExpansion(is_debug)
+        self.hash_subkey = self.cypherValue(0)
+        self.buildGhashTables(self.hash_subkey)
+
+    def buildGhashTables(self, hash_subkey:int):
+        '''
+        This method precomputes the multiplication and reduction tables for multiplying by the hash subkey
+
+        Follows the table method from Section 4.1 "Software" of "The Galois/Counter Mode of Operation (GCM)" (Shoup's method)
+        https://csrc.nist.rip/groups/ST/toolkit/BCM/documents/proposedmodes/gcm/gcm-spec.pdf
+
+        Parameters :
+            hash_subkey : int
+                The hash subkey H as a 128 bit int
+        '''
+
+        if self.table_bits not in (4, 8):
+            raise ValueError(f"The GHASH tables must use 4 or 8 bits, not {self.table_bits}")
+        k = self.table_bits
+        table_size = 1 << k
+        # the multiplication table holds n * H for every k bit value n placed in the most significant k bits of a block
+        # the most significant bit is the x^0 coefficient, so each lower bit is the one above multiplied by x
+        multiplication_table = [0] * table_size
+        bit_multiple = hash_subkey
+        bit = table_size >> 1
+        while bit > 0:
+            multiplication_table[bit] = bit_multiple
+            bit_multiple = (bit_multiple >> 1) ^ ((bit_multiple & 1) * self.reduction_polynomial)
+            bit >>= 1
+        for n in range(1, table_size):
+            high_bit = 1 << (n.bit_length() - 1)
+            if n != high_bit:
+                multiplication_table[n] = multiplication_table[high_bit] ^ multiplication_table[n ^ high_bit]
+        # the reduction table holds the value of the k bits shifted out of the bottom of a block when it is multiplied by x^k
+        reduction_table = []
+        for n in range(0, table_size):
+            value = n
+            for _ in range(0, k):
+                value = (value >> 1) ^ ((value & 1) * self.reduction_polynomial)
+            reduction_table.append(value)
+        self.ghash_table = multiplication_table
+        self.ghash_reduction_table = reduction_table
+
+    def multiplyByHashSubkey(self, value:int) -> int:
+        '''
+        This method multiplies a 128 bit block by the hash subkey H using the precomputed tables, 
+        giving the same result as GCM_Block.blockMultiplication
+
+        Parameters :
+            value : int
+                The block to be multiplied as a 128 bit int
+
+        Returns :
+            result : int
+                The product of the block and H as a 128 bit int
+        '''
+
+        table = self.ghash_table
+        reduction_table = self.ghash_reduction_table
+        k = self.table_bits
+        mask = (1 << k) - 1
+        # Horner's rule from the least significant k bits, multiplying the running result by x^k between lookups
+        result = table[value & mask]
+        for shift in range(k, 128, k):
+            result = (result >> k) ^ reduction_table[result & mask] ^ table[(value >> shift) & mask]
+        return result
+
+    def ghashBytes(self, y:int, data:bytes) -> int:
+        '''
+        This method continues a GHASH over bytes, starting from a previous result
+
+        Any final partial block is padded with zeros, as is done for the additional data and cypher text
+
+        Parameters :
+            y : int
+                The GHASH result so far as a 128 bit int, 0 at the start
+            data : bytes
+                The data to add to the GHASH
+
+        Returns :
+            y : int
+                The updated GHASH result as a 128 bit int
+        '''
+
+        multiply = self.multiplyByHashSubkey
+        length = len(data)
+        full_length = length - length % 16
+        for offset in range(0, full_length, 16):
+            y = multiply(y ^ int.from_bytes(data[offset:offset+16], "big"))
+        if full_length != length:
+            y = multiply(y ^ int.from_bytes(bytes(data[full_length:]) + bytes(16 - length + full_length), "big"))
+        return y
     
     def GHASH(self, hash_block:GCM_Block, input_bits:list[int]) -> GCM_Block:
         '''
@@ -158,6 +269,13 @@ class AES_GCM_128(AES128):
         '''
         # GHASH is only to be used on full blocks and the initial resulting block is 0
         number_of_blocks = len(input_bits) // 128
+        if not self.is_debug and hash_block.getValue() == self.hash_subkey:
+            # use the precomputed tables for H, converting the bit array to bytes once
+            if number_of_blocks == 0:
+                return GCM_Block(0)
+            bit_string = "".join(map(str, input_bits[:number_of_blocks*128]))
+            data = int(bit_string, 2).to_bytes(number_of_blocks * 16, "big")
+            return GCM_Block(self.ghashBytes(0, data))
         result_block = GCM_Block(0)
         if self.is_debug:
             print(f"Starting GHASH blocks:{number_of_blocks} H:{hash_block.getHexString()} Y:{result_block.getHexString()}")
@@ -192,6 +310,20 @@ class AES_GCM_128(AES128):
 
         if input_bits == []:
             return []
+
+        if not self.is_debug:
+            # run the counter on ints and only convert the bit array once in each direction
+            if type(initial_counter_block) == list:
+                counter_value = GCM_Block.fromBitArray(initial_counter_block).getValue()
+            else:
+                counter_value = initial_counter_block.getValue()
+            bit_length = len(input_bits)
+            byte_length = (bit_length + 7) // 8
+            padding_bits = byte_length * 8 - bit_length
+            input_value = int("".join(map(str, input_bits)), 2) << padding_bits
+            result_bytes = self.gctrBytes(counter_value, input_value.to_bytes(byte_length, "big"))
+            result_value = int.from_bytes(result_bytes, "big") >> padding_bits
+            return [int(bit) for bit in format(result_value, f"0{bit_length}b")]
         
         # determine how many 128 bit blocks of data there are and if any are incomplete
         number_full_blocks = len(input_bits) // 128
@@ -231,6 +363,185 @@ class AES_GCM_128(AES128):
             print("Finishing GCTR")
         return result_bits
     
+    def gctrBytes(self, counter:int, data:bytes) -> bytes:
+        '''
+        This method performs the GCTR function on bytes with the counter held as a 128 bit int
+        As laid out in NIST SP-800 38D section 6.5 GCTR Function
+
+        The keystream is written into a preallocated buffer, incrementing only the least significant 32 bits of the counter
+        between blocks, and is then xored with the data in a single operation. Any final partial block uses the most
+        significant bytes of its keystream block
+
+        Parameters :
+            counter : int
+                The initial counter block as a 128 bit int
+            data : bytes
+                The data the GCTR is being performed on
+
+        Returns :
+            result : bytes
+                The result of the GCTR function, the same length as the data
+        '''
+
+        length = len(data)
+        if length == 0:
+            return b""
+        keystream = bytearray(((length + 15) // 16) * 16)
+        cypher_words = self.cypherWords
+        c0, c1, c2, c3 = counter >> 96, (counter >> 64) & 0xFFFFFFFF, (counter >> 32) & 0xFFFFFFFF, counter & 0xFFFFFFFF
+        for offset in range(0, len(keystream), 16):
+            struct.pack_into(">4I", keystream, offset, *cypher_words(c0, c1, c2, c3))
+            c3 = (c3 + 1) & 0xFFFFFFFF
+        xor_value = int.from_bytes(data, "big") ^ int.from_bytes(keystream[:length], "big")
+        return xor_value.to_bytes(length, "big")
+
+    def preCounterValue(self, initialization_vector:bytes) -> int:
+        '''
+        This method derives the pre counter block J_0 from an initialization vector
+        As laid out in NIST SP-800 38D Section 7.1 step 2
+
+        Parameters :
+            initialization_vector : bytes
+                The initialization vector as bytes
+
+        Returns :
+            pre_counter_block : int
+                The pre counter block J_0 as a 128 bit int
+        '''
+
+        if len(initialization_vector) == 12:
+            return (int.from_bytes(initialization_vector, "big") << 32) | 1
+        y = self.ghashBytes(0, initialization_vector)
+        return self.multiplyByHashSubkey(y ^ (len(initialization_vector) * 8))
+
+    def incrementCounter(self, counter:int, number_of_blocks:int) -> int:
+        '''
+        This method increments the least significant 32 bits of a counter block, as inc_32 in NIST SP-800 38D
+
+        Parameters :
+            counter : int
+                The counter block as a 128 bit int
+            number_of_blocks : int
+                The amount to increment the counter by
+
+        Returns :
+            counter : int
+                The incremented counter block
+        '''
+
+        return (counter & ~0xFFFFFFFF) | ((counter + number_of_blocks) & 0xFFFFFFFF)
+
+    def hashSubkeyPower(self, exponent:int) -> int:
+        '''
+        This method calculates H^exponent by square and multiply with the textbook block multiplication
+
+        Parameters :
+            exponent : int
+                The power the hash subkey is raised to
+
+        Returns :
+            power : int
+                H^exponent as a 128 bit int
+        '''
+
+        # the multiplicative identity has only the x^0 coefficient set, which is the most significant bit
+        result = GCM_Block(0x80000000000000000000000000000000)
+        square = GCM_Block(self.hash_subkey)
+        while exponent > 0:
+            if exponent & 1:
+                result = result.blockMultiplication(square)
+            square = square.blockMultiplication(square)
+            exponent >>= 1
+        return result.getValue()
+
+    def parallelAuthenticatedEncryption(self, initialization_vector:bytes, plain_text:bytes, additional_data:bytes, tag_length:int = 128, max_workers:int = None, chunk_size:int = 65536) -> tuple[bytes, bytes]:
+        '''
+        This method performs an authenticated encryption with the plain text split into ranges of blocks across a process pool
+
+        Each worker runs GCTR from the counter for the start of its range and a GHASH of its cypher text from zero.
+        As GHASH is a polynomial in H, the partial results are combined in order as Y = Y * H^m xor Y_j, where m is the 
+        number of blocks in range j, so the tag is identical to the one from authenticatedEncryption
+
+        Parameters :
+            initialization_vector : bytes
+                The initialization vector as bytes
+            plain_text : bytes
+                The plain text to be encrypted
+            additional_data : bytes
+                The additional authenticated data
+            tag_length : int, optional
+                The tag length in bits, one of 128, 120, 112, 104, 96, 64 or 32, defaults to 128
+            max_workers : int, optional
+                The number of worker processes, defaults to the number of processors
+            chunk_size : int, optional
+                The number of bytes in each range given to a worker, rounded down to whole blocks, defaults to 65536
+
+        Returns :
+            cypher_text : bytes
+                The cypher text that was generated
+            tag : bytes
+                The tag that was generated
+        '''
+
+        self.checkTagLength(tag_length)
+        chunk_size = max(16, chunk_size - chunk_size % 16)
+        pre_counter_block = self.preCounterValue(initialization_vector)
+        counter = self.incrementCounter(pre_counter_block, 1)
+        y = self.ghashBytes(0, additional_data)
+
+        if len(plain_text) <= chunk_size:
+            cypher_text = self.gctrBytes(counter, plain_text)
+            y = self.ghashBytes(y, cypher_text)
+        else:
+            offsets = range(0, len(plain_text), chunk_size)
+            counters = [self.incrementCounter(counter, offset // 16) for offset in offsets]
+            chunks = [plain_text[offset:offset+chunk_size] for offset in offsets]
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=initializeGcmWorker, initargs=(type(self), self.key, self.table_bits)) as executor:
+                results = list(executor.map(gcmWorkerEncryptRange, counters, chunks))
+            full_chunk_power = self.hashSubkeyPower(chunk_size // 16)
+            for i in range(0, len(results)):
+                chunk_cypher_text, chunk_ghash = results[i]
+                chunk_power = full_chunk_power if len(chunks[i]) == chunk_size else self.hashSubkeyPower((len(chunks[i]) + 15) // 16)
+                y = GCM_Block(y).blockMultiplication(GCM_Block(chunk_power)).getValue() ^ chunk_ghash
+            cypher_text = b"".join(result[0] for result in results)
+
+        lengths_block = ((len(additional_data) * 8) << 64) | (len(cypher_text) * 8)
+        S = self.multiplyByHashSubkey(y ^ lengths_block)
+        tag = (S ^ self.cypherValue(pre_counter_block)).to_bytes(16, "big")
+        return cypher_text, tag[:tag_length // 8]
+
+    def createContext(self, initialization_vector:bytes, is_decrypt:bool = False, tag_length:int = 128):
+        '''
+        This method creates a streaming authenticated encryption or decryption context for one initialization vector
+
+        Parameters :
+            initialization_vector : bytes
+                The initialization vector as bytes
+            is_decrypt : bool, optional
+                Whether the context is decrypting cypher text rather than encrypting plain text, defaults to False
+            tag_length : int, optional
+                The length in bits of the tag the context generates and accepts, defaults to 128
+
+        Returns :
+            context : AES_GCM_Context
+                The streaming context using this key
+        '''
+
+        return AES_GCM_Context(self, initialization_vector, is_decrypt, tag_length)
+
+    def checkTagLength(self, tag_length:int):
+        '''
+        This method checks that a tag length is one of the lengths allowed by NIST SP-800 38D Section 5.2.1.2, 
+        raising a ValueError if it is not
+
+        Parameters :
+            tag_length : int
+                The tag length in bits
+        '''
+
+        if tag_length not in self.valid_tag_lengths:
+            raise ValueError(f"The tag length must be one of {self.valid_tag_lengths} bits, not {tag_length}")
+
     def authenticatedEncryption(self, initialization_vector:IntegerHandler | str | int | list[int], plain_text:IntegerHandler | str | int | list[int], additional_data:IntegerHandler | str | int | list[int], tag_length:int) -> tuple[IntegerHandler, IntegerHandler]:
         '''
         This method performs an authenticated encryption using AES Galois Counter Mode
@@ -260,8 +571,8 @@ class AES_GCM_128(AES128):
         plain_text = self.makeBitArray(plain_text)
         additional_data = self.makeBitArray(additional_data)
 
-        # initialize the hash subkey block to zero
-        hash_block = GCM_Block.fromHexString(self.cypher("0"*32))
+        # the hash subkey block is the encrypted zero block, computed when the key was set
+        hash_block = GCM_Block(self.hash_subkey)
         if self.is_debug:
             print(f"Staring Authenricated Encryption with H:{hash_block.getHexString()}")
 
@@ -325,8 +636,8 @@ class AES_GCM_128(AES128):
         additional_data = self.makeBitArray(additional_data)
         tag = self.makeBitArray(tag)
 
-        # initialize the hash subkey block to zero
-        hash_block = GCM_Block.fromHexString(self.cypher("0"*32))
+        # the hash subkey block is the encrypted zero block, computed when the key was set
+        hash_block = GCM_Block(self.hash_subkey)
         if self.is_debug:
             print(f"Staring Authenricated Encryption with H:{hash_block.getHexString()}")
 
@@ -341,10 +652,6 @@ class AES_GCM_128(AES128):
         if self.is_debug:
             print(f"J_0 is {pre_counter_block.getHexString()}")
 
-        # use GCTR in order to create the plain text 
-        counter_block = pre_counter_block.inc(32)
-        plain_text = self.GCTR(counter_block , cypher_text)
-
         # create and pad the bit array of the data to be GHASHed in order to create cypher blcok generate the tag
         u = (ceil(len(cypher_text)/128)*128 - len(cypher_text))
         v = (ceil(len(additional_data)/128)*128 - len(additional_data) )
@@ -363,10 +670,153 @@ class AES_GCM_128(AES128):
         tag_prime = gctr_result[:len(tag)]
 
         # comapare the tag you generated with the one provided in order to verify authenticity
-        if tag_prime == tag:
-            return True, IntegerHandler.fromBitArray(plain_text, False, len(plain_text))
-        return False, None
+        # the tag only depends on the cypher text, so forged data is rejected before any of it is decrypted
+        if tag_prime != tag:
+            return False, None
+
+        # use GCTR in order to create the plain text 
+        counter_block = pre_counter_block.inc(32)
+        plain_text = self.GCTR(counter_block , cypher_text)
+        return True, IntegerHandler.fromBitArray(plain_text, False, len(plain_text))
     
+    def authenticatedDecryptionBytes(self, initialization_vector:bytes, cypher_text:bytes, additional_data:bytes, tag:bytes, tag_length:int = 128) -> bytes | None:
+        '''
+        This method performs an authenticated decryption on bytes, checking the tag before running GCTR on the cypher text
+        As laid out in NIST SP-800 38D Section 7.2 "Algorithm for the Authenticated Decryption Function"
+        A tag which is not exactly tag_length bits long is always rejected
+
+        Parameters :
+            initialization_vector : bytes
+                The initialization vector as bytes
+            cypher_text : bytes
+                The cypher text to be decrypted
+            additional_data : bytes
+                The additional authenticated data
+            tag : bytes
+                The tag to verify
+            tag_length : int, optional
+                The expected tag length in bits, defaults to 128
+
+        Returns :
+            plain_text : bytes | None
+                The decrypted plain text, or None if the tag was not authenticated
+        '''
+
+        self.checkTagLength(tag_length)
+        if len(tag) * 8 != tag_length:
+            return None
+        pre_counter_block = self.preCounterValue(initialization_vector)
+        y = self.ghashBytes(self.ghashBytes(0, additional_data), cypher_text)
+        lengths_block = ((len(additional_data) * 8) << 64) | (len(cypher_text) * 8)
+        S = self.multiplyByHashSubkey(y ^ lengths_block)
+        tag_prime = (S ^ self.cypherValue(pre_counter_block)).to_bytes(16, "big")[:tag_length // 8]
+        if not secrets.compare_digest(tag_prime, bytes(tag)):
+            return None
+        return self.gctrBytes(self.incrementCounter(pre_counter_block, 1), cypher_text)
+
+    def sealMany(self, records:list[tuple[bytes, bytes, bytes]], tag_length:int = 128) -> tuple[bytearray, array]:
+        '''
+        This method seals a batch of records under this key, reusing the cached hash subkey and GHASH tables for every record
+
+        The results are written into one preallocated buffer as each record's cypher text followed by its tag, with the end
+        offset of each record in an array, so record i is sealed[offsets[i-1]:offsets[i]]. The batch size and throughput
+        are stored in batch_statistics
+
+        Parameters :
+            records : [(bytes, bytes, bytes)]
+                The records as (initialization vector, plain text, additional data) tuples
+            tag_length : int, optional
+                The tag length in bits, one of 128, 120, 112, 104, 96, 64 or 32, defaults to 128
+
+        Returns :
+            sealed : bytearray
+                The cypher text and tag of every record, one after the other
+            offsets : array
+                The end offset of each record in sealed
+        '''
+
+        self.checkTagLength(tag_length)
+        start_time = time.perf_counter()
+        tag_bytes = tag_length // 8
+        sealed = bytearray(sum(len(record[1]) for record in records) + tag_bytes * len(records))
+        offsets = array("Q")
+        gctr_bytes = self.gctrBytes
+        ghash_bytes = self.ghashBytes
+        multiply = self.multiplyByHashSubkey
+        cypher_value = self.cypherValue
+        position = 0
+        for initialization_vector, plain_text, additional_data in records:
+            if len(initialization_vector) == 12:
+                # with a 96 bit iv J_0 is iv || 0^31 || 1, so the first counter block is iv || 0^30 || 10
+                pre_counter_block = (int.from_bytes(initialization_vector, "big") << 32) | 1
+                counter = pre_counter_block + 1
+            else:
+                pre_counter_block = self.preCounterValue(initialization_vector)
+                counter = self.incrementCounter(pre_counter_block, 1)
+            cypher_text = gctr_bytes(counter, plain_text)
+            y = ghash_bytes(ghash_bytes(0, additional_data), cypher_text)
+            S = multiply(y ^ (((len(additional_data) * 8) << 64) | (len(cypher_text) * 8)))
+            sealed[position:position+len(cypher_text)] = cypher_text
+            position += len(cypher_text)
+            sealed[position:position+tag_bytes] = (S ^ cypher_value(pre_counter_block)).to_bytes(16, "big")[:tag_bytes]
+            position += tag_bytes
+            offsets.append(position)
+        self.recordBatchStatistics(len(records), sum(len(record[1]) for record in records), start_time)
+        return sealed, offsets
+
+    def recordBatchStatistics(self, record_count:int, byte_count:int, start_time:float):
+        '''
+        This method stores the size and throughput of the last batch in batch_statistics, printing them when debugging
+
+        Parameters :
+            record_count : int
+                The number of records in the batch
+            byte_count : int
+                The number of plain text or cypher text bytes in the batch
+            start_time : float
+                The time.perf_counter() value when the batch started
+        '''
+
+        seconds = max(time.perf_counter() - start_time, 1e-9)
+        self.batch_statistics = {"records" : record_count,
+                                 "bytes" : byte_count,
+                                 "seconds" : seconds,
+                                 "records_per_second" : record_count / seconds,
+                                 "bytes_per_second" : byte_count / seconds}
+        if self.is_debug:
+            print(f"Batch of {record_count} records ({byte_count} bytes) in {seconds:.6f}s : {record_count / seconds:.0f} records/s {byte_count / seconds:.0f} bytes/s")
+
+    def openMany(self, records:list[tuple[bytes, bytes, bytes, bytes]], tag_length:int = 128) -> tuple[list[bytes | None], int, int]:
+        '''
+        This method opens a batch of records under this key, rejecting any record whose tag does not match 
+        or is not tag_length bits long without decrypting it. The batch size and throughput are stored in batch_statistics
+
+        Parameters :
+            records : [(bytes, bytes, bytes, bytes)]
+                The records as (initialization vector, cypher text, additional data, tag) tuples
+            tag_length : int, optional
+                The expected tag length in bits, defaults to 128
+
+        Returns :
+            plain_texts : [bytes | None]
+                The plain text for each record, or None where the record was rejected
+            accepted_count : int
+                The number of records that were authenticated
+            rejected_count : int
+                The number of records that were rejected
+        '''
+
+        start_time = time.perf_counter()
+        plain_texts = []
+        rejected_count = 0
+        for initialization_vector, cypher_text, additional_data, tag in records:
+            plain_text = self.authenticatedDecryptionBytes(initialization_vector, cypher_text, additional_data, tag, tag_length)
+            if plain_text is None:
+                rejected_count += 1
+            plain_texts.append(plain_text)
+        self.recordBatchStatistics(len(records), sum(len(record[1]) for record in records), start_time)
+        return plain_texts, len(records) - rejected_count, rejected_count
+
     def authenticatedEncryption_StringMessage(self, initialization_vector:IntegerHandler | str | int | list[int], string_message:str, additional_data:IntegerHandler | str | int | list[int], tag_length:int) -> tuple[IntegerHandler, IntegerHandler]:
         '''
         This method performs an authenticated encryption using AES Galois Counter Mode
@@ -444,6 +894,46 @@ class AES_GCM_128(AES128):
             value = IntegerHandler(value, False).getBitArray()
         return value
 
+# The keyed AES GCM instance for each worker process, created once by initializeGcmWorker
+gcm_worker_instance = None
+
+def initializeGcmWorker(gcm_class:type, key:str, table_bits:int):
+    '''
+    This method creates the keyed AES GCM instance for a worker process, so the key expansion and GHASH tables are
+    only built once per worker rather than being sent with every range
+
+    Parameters :
+        gcm_class : type
+            The AES GCM class for the key length
+        key : str
+            The key as a hexadecimal string
+        table_bits : int
+            The number of bits handled per lookup in the GHASH tables
+    '''
+
+    global gcm_worker_instance
+    gcm_worker_instance = gcm_class(key, table_bits=table_bits)
+
+def gcmWorkerEncryptRange(counter:int, plain_text:bytes) -> tuple[bytes, int]:
+    '''
+    This method encrypts one range of blocks in a worker process and hashes the resulting cypher text
+
+    Parameters :
+        counter : int
+            The counter block for the first block in the range
+        plain_text : bytes
+            The plain text for the range
+
+    Returns :
+        cypher_text : bytes
+            The cypher text for the range
+        ghash_value : int
+            The GHASH of the range's cypher text starting from zero
+    '''
+
+    cypher_text = gcm_worker_instance.gctrBytes(counter, plain_text)
+    return cypher_text, gcm_worker_instance.ghashBytes(0, cypher_text)
+
 def bitwiseXorGCM(list_of_blocks:list[GCM_Block]) -> GCM_Block:
     '''
     This method performs a bit wise xor of a list of GCM Blocks
@@ -470,16 +960,20 @@ class AES_GCM_192(AES_GCM_128):
     GCM is detailed in NIST SP 800-38 D "Recommendation for Block Cipher Modes of Operation: Galois/Counter Mode (GCM) and GMAC"
     https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38d.pdf
     '''
-    def __init__(self, key):
+    def __init__(self, key, is_debug:bool = False, table_bits:int = 8):
         '''
         This method should initialize aes_gcm_192 with a given key
 
         Parameters : 
             key : str
                 The 192 bit key for the aes algorithm
+            is_debug : bool, optional
+                Whether the AES GCM instance is being debugged and should output intermediary values
+            table_bits : int, optional
+                The number of bits (4 or 8) handled per lookup in the GHASH tables, defaults to 8
         '''
 
-        super().__init__(key)
+        super().__init__(key, is_debug, table_bits)
         self.key_length = 192
         self.number_key_words = 6
         self.number_of_rounds = 12
@@ -493,22 +987,215 @@ class AES_GCM_256(AES_GCM_128):
     https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38d.pdf
     '''
 
-    def __init__(self, key):
+    def __init__(self, key, is_debug:bool = False, table_bits:int = 8):
         '''
         This method should initialize aes gcm 256 with a given key
 
         Parameters : 
             key : str
                 The 256 bit key for the aes algorithm
+            is_debug : bool, optional
+                Whether the AES GCM instance is being debugged and should output intermediary values
+            table_bits : int, optional
+                The number of bits (4 or 8) handled per lookup in the GHASH tables, defaults to 8
         '''
 
-        super().__init__(key)
+        super().__init__(key, is_debug, table_bits)
         self.key_length = 256
         self.number_of_rounds = 14
         self.number_key_words = 8
         self.keyExpansion()
 
 
+class AES_GCM_Context():
+    '''
+    This class holds the state of a single AES GCM authenticated encryption or decryption so data can be processed in chunks
+
+    Only the running GHASH value, the counter, any unused keystream and less than one block of buffered data are kept,
+    so the memory used does not grow with the length of the additional data or the text
+
+    As laid out in NIST SP-800 38D Sections 7.1 and 7.2
+    https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38d.pdf
+    '''
+
+    def __init__(self, gcm:AES_GCM_128, initialization_vector:bytes, is_decrypt:bool = False, tag_length:int = 128):
+        '''
+        This method initializes the context, deriving the pre counter block from the initialization vector
+
+        Parameters :
+            gcm : AES_GCM_128
+                The keyed AES GCM instance, providing the cypher and the GHASH tables
+            initialization_vector : bytes
+                The initialization vector as bytes
+            is_decrypt : bool, optional
+                Whether the context is decrypting cypher text rather than encrypting plain text, defaults to False
+            tag_length : int, optional
+                The length in bits of the tag the context generates and accepts, defaults to 128
+        '''
+
+        gcm.checkTagLength(tag_length)
+        self.gcm = gcm
+        self.is_decrypt = is_decrypt
+        self.tag_length = tag_length
+        self.pre_counter_block = gcm.preCounterValue(bytes(initialization_vector))
+        self.counter = self.gcm.incrementCounter(self.pre_counter_block, 1)
+        self.ghash_value = 0
+        self.ghash_buffer = b""
+        self.keystream = b""
+        self.additional_data_length = 0
+        self.text_length = 0
+        self.is_additional_data_finished = False
+        self.tag = None
+
+    def checkNotFinalized(self):
+        '''
+        This method raises a ValueError if the tag has already been generated, as no more data can be added after it
+        '''
+
+        if self.tag is not None:
+            raise ValueError("No more data can be added after the context has been finalized")
+
+    def absorbGhash(self, data:bytes):
+        '''
+        This method adds data to the running GHASH, buffering any partial block until more data arrives
+
+        Parameters :
+            data : bytes
+                The additional data or cypher text to be hashed
+        '''
+
+        if self.ghash_buffer:
+            needed = 16 - len(self.ghash_buffer)
+            self.ghash_buffer += data[:needed]
+            data = data[needed:]
+            if len(self.ghash_buffer) < 16:
+                return
+            self.ghash_value = self.gcm.ghashBytes(self.ghash_value, self.ghash_buffer)
+            self.ghash_buffer = b""
+        full_length = len(data) - len(data) % 16
+        if full_length:
+            self.ghash_value = self.gcm.ghashBytes(self.ghash_value, data[:full_length])
+        self.ghash_buffer = bytes(data[full_length:])
+
+    def finishAdditionalData(self):
+        '''
+        This method zero pads the additional data to a whole block once the text starts
+        '''
+
+        if not self.is_additional_data_finished:
+            if self.ghash_buffer:
+                self.ghash_value = self.gcm.ghashBytes(self.ghash_value, self.ghash_buffer)
+                self.ghash_buffer = b""
+            self.is_additional_data_finished = True
+
+    def updateAad(self, additional_data:bytes):
+        '''
+        This method adds additional authenticated data, which must all be added before any text
+
+        Parameters :
+            additional_data : bytes
+                The next chunk of additional data
+        '''
+
+        self.checkNotFinalized()
+        if self.is_additional_data_finished:
+            raise ValueError("Additional data must be added before any text")
+        self.additional_data_length += len(additional_data)
+        self.absorbGhash(bytes(additional_data))
+
+    def update(self, data:bytes) -> bytes:
+        '''
+        This method encrypts or decrypts the next chunk of text, which may be any length
+
+        Parameters :
+            data : bytes
+                The next chunk of plain text when encrypting, or cypher text when decrypting
+
+        Returns :
+            result : bytes
+                The matching chunk of cypher text when encrypting, or plain text when decrypting
+        '''
+
+        self.checkNotFinalized()
+        self.finishAdditionalData()
+        data = bytes(data)
+        length = len(data)
+        self.text_length += length
+        output = bytearray(length)
+        offset = 0
+
+        # use up any keystream left over from a partial block in the previous chunk
+        if self.keystream:
+            used = min(len(self.keystream), length)
+            xor_value = int.from_bytes(data[:used], "big") ^ int.from_bytes(self.keystream[:used], "big")
+            output[0:used] = xor_value.to_bytes(used, "big")
+            self.keystream = self.keystream[used:]
+            offset = used
+
+        full_length = (length - offset) - (length - offset) % 16
+        if full_length:
+            output[offset:offset+full_length] = self.gcm.gctrBytes(self.counter, data[offset:offset+full_length])
+            self.counter = self.gcm.incrementCounter(self.counter, full_length // 16)
+            offset += full_length
+
+        # keep the rest of the keystream block for the next chunk
+        if offset < length:
+            keystream = self.gcm.cypherValue(self.counter).to_bytes(16, "big")
+            self.counter = self.gcm.incrementCounter(self.counter, 1)
+            used = length - offset
+            xor_value = int.from_bytes(data[offset:], "big") ^ int.from_bytes(keystream[:used], "big")
+            output[offset:] = xor_value.to_bytes(used, "big")
+            self.keystream = keystream[used:]
+
+        result = bytes(output)
+        self.absorbGhash(data if self.is_decrypt else result)
+        return result
+
+    def finalize(self, tag_length:int = None) -> bytes:
+        '''
+        This method completes the GHASH with the lengths block and generates the tag, after which no more data can be added
+
+        Parameters :
+            tag_length : int, optional
+                The tag length in bits, defaults to the tag length of the context
+
+        Returns :
+            tag : bytes
+                The tag, truncated to the tag length
+        '''
+
+        if self.tag is None:
+            self.finishAdditionalData()
+            if self.ghash_buffer:
+                self.ghash_value = self.gcm.ghashBytes(self.ghash_value, self.ghash_buffer)
+                self.ghash_buffer = b""
+            lengths_block = ((self.additional_data_length * 8) << 64) | (self.text_length * 8)
+            S = self.gcm.multiplyByHashSubkey(self.ghash_value ^ lengths_block)
+            self.tag = (S ^ self.gcm.cypherValue(self.pre_counter_block)).to_bytes(16, "big")
+        if tag_length is None:
+            tag_length = self.tag_length
+        self.gcm.checkTagLength(tag_length)
+        return self.tag[:tag_length // 8]
+
+    def verify(self, tag:bytes) -> bool:
+        '''
+        This method verifies a tag against the data processed so far, comparing the tags in constant time
+        A tag which is not exactly the tag length of the context is always rejected
+
+        Parameters :
+            tag : bytes
+                The tag being verified
+
+        Returns :
+            verified : bool
+                Whether the tag is valid
+        '''
+
+        expected_tag = self.finalize()
+        if len(tag) * 8 != self.tag_length:
+            return False
+        return secrets.compare_digest(expected_tag, bytes(tag))
+
 if __name__ == '__main__':
     aes_256_gcm = AES_GCM_256("163D28AB"*8)
     initialization_vector = "1234567890abc1243567890"
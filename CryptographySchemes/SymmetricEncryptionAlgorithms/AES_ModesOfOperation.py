@@ -1,5 +1,11 @@
+import struct
+import mmap
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from CryptographySchemes.SymmetricEncryptionAlgorithms.AdvancedEncryptionStandard import *
 from HelperFunctions.IntegerHandler import *
+from HelperFunctions.ChunkedStreams import processStream
 class AES_ECB_128(AES128):
     '''
     This class should allow AES 128 to be used in electronic cookbook (ECB) mode
@@ -8,6 +14,139 @@ class AES_ECB_128(AES128):
     https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
     '''
 
+    # Payloads of at least parallel_threshold bytes are split into parallel_chunk_size ranges and processed across
+    # parallel_workers processes, for the modes where blocks do not depend on each other (ECB and CBC decryption)
+    # The threshold is None by default, which keeps everything on the calling process
+    # The worker pool is created the first time it is needed and kept until close() is called, so the key is only
+    # expanded once in each worker process rather than for every payload
+    parallel_threshold = None
+    parallel_workers = None
+    parallel_chunk_size = 65536
+    parallel_executor = None
+
+    def isParallel(self, length:int) -> bool:
+        '''
+        This method checks whether a payload is large enough to be processed across the worker pool
+
+        Parameters :
+            length : int
+                The length of the payload in bytes
+
+        Returns :
+            is_parallel : bool
+                Whether the payload should be processed in parallel
+        '''
+
+        return self.parallel_threshold is not None and length >= self.parallel_threshold and length > self.parallel_chunk_size
+
+    def runParallel(self, worker_function, *argument_lists) -> bytes:
+        '''
+        This method maps a worker function over chunks of a payload in a process pool and joins the results in order
+
+        The pool is reused between payloads, and each worker process expands the key once when it starts,
+        rather than it being sent with every chunk
+
+        Parameters :
+            worker_function : function
+                The module level function that processes one chunk
+            argument_lists : [[]]
+                The arguments for each call of the worker function
+
+        Returns :
+            result : bytes
+                The results of every chunk joined in order
+        '''
+
+        if self.parallel_executor is None:
+            self.parallel_executor = ProcessPoolExecutor(max_workers=self.parallel_workers, initializer=initializeModeWorker, initargs=(type(self), self.key))
+        return b"".join(self.parallel_executor.map(worker_function, *argument_lists))
+
+    def close(self):
+        '''
+        This method shuts down the worker pool, if one has been started, a new pool is started if a later payload needs one
+        '''
+
+        if self.parallel_executor is not None:
+            self.parallel_executor.shutdown()
+            self.parallel_executor = None
+
+    def __enter__(self):
+        '''
+        This method allows the mode to be used in a with statement, so the worker pool is shut down at the end of it
+
+        Returns :
+            mode : AES_ECB_128
+                This mode instance
+        '''
+
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        '''
+        This method shuts down the worker pool at the end of a with statement
+        '''
+
+        self.close()
+
+    def checkWholeBlocks(self, data:bytes):
+        '''
+        This method checks that cypher text is a whole number of blocks, raising a ValueError if it is not
+
+        Parameters :
+            data : bytes
+                The cypher text
+        '''
+
+        if len(data) % 16 != 0:
+            raise ValueError(f"The cypher text must be a whole number of 16 byte blocks, not {len(data)} bytes")
+
+    def splitIntoChunks(self, data:bytes) -> list[bytes]:
+        '''
+        This method splits a payload into whole block chunks of parallel_chunk_size bytes
+
+        Parameters :
+            data : bytes
+                The payload, a whole number of blocks
+
+        Returns :
+            chunks : [bytes]
+                The payload split into chunks
+        '''
+
+        chunk_size = max(16, self.parallel_chunk_size - self.parallel_chunk_size % 16)
+        return [data[offset:offset+chunk_size] for offset in range(0, len(data), chunk_size)]
+
+    def hexListToBytes(self, hex_list:list[str]) -> bytes:
+        '''
+        This method joins a list of hex string blocks into bytes
+
+        Parameters :
+            hex_list : [str]
+                The list of hex strings
+
+        Returns :
+            data : bytes
+                The blocks as bytes
+        '''
+
+        return bytes.fromhex("".join(hex_list))
+
+    def bytesToHexList(self, data:bytes) -> list[str]:
+        '''
+        This method splits bytes into a list of upper case hex strings, one per block
+
+        Parameters :
+            data : bytes
+                The blocks as bytes
+
+        Returns :
+            hex_list : [str]
+                The list of hex strings
+        '''
+
+        hex_data = data.hex().upper()
+        return [hex_data[i:i+32] for i in range(0, len(hex_data), 32)]
+
     def encryptHexStringMessage(self, hex_message:str)->list[str]:
         '''
         This method encrypts a hex string using AES
@@ -47,6 +186,8 @@ class AES_ECB_128(AES128):
             encrypted_hex_list : [str]
                 The result of the encryption as a list of hex strings
         '''
+        if self.isParallel(len(hex_list) * 16):
+            return self.bytesToHexList(self.encrypt(self.hexListToBytes(hex_list)))
         number_of_message_blocks = len(hex_list)
         result_list = []
         for i in range (0, number_of_message_blocks):
@@ -87,6 +228,8 @@ class AES_ECB_128(AES128):
             
         '''
 
+        if self.isParallel(len(encrypted_list) * 16):
+            return self.bytesToHexList(self.decrypt(self.hexListToBytes(encrypted_list)))
         result_list = []
         for encoded_hex in encrypted_list:
             result_list.append(self.inverseCypher(encoded_hex))
@@ -109,6 +252,165 @@ class AES_ECB_128(AES128):
         unencrypted_string = self.hexListToString(result_list)
         return unencrypted_string
     
+    def encrypt(self, data:bytes) -> bytes:
+        '''
+        This method encrypts bytes using AES in Electronic Codebook (ECB) mode, writing each block straight into a preallocated output buffer
+
+        The data is padded with zero bytes to a whole number of blocks, the same as encryptHexStringMessage
+
+        Parameters :
+            data : bytes
+                The content to be encrypted
+
+        Returns :
+            encrypted_data : bytes
+                The result of the encryption
+        '''
+
+        data = self.padBytes(data)
+        if self.isParallel(len(data)):
+            return self.runParallel(modeWorkerEncrypt, self.splitIntoChunks(data))
+        output = bytearray(len(data))
+        cypher_words = self.cypherWords
+        for offset in range(0, len(data), 16):
+            struct.pack_into(">4I", output, offset, *cypher_words(*struct.unpack_from(">4I", data, offset)))
+        return bytes(output)
+
+    def decrypt(self, data:bytes) -> bytes:
+        '''
+        This method decrypts bytes that were encrypted using AES in Electronic Codebook (ECB) mode
+
+        Parameters :
+            data : bytes
+                The encrypted content, a whole number of blocks
+
+        Returns :
+            decrypted_data : bytes
+                The result of the decryption
+        '''
+
+        self.checkWholeBlocks(data)
+        if self.isParallel(len(data)):
+            return self.runParallel(modeWorkerDecrypt, self.splitIntoChunks(data))
+        output = bytearray(len(data))
+        inverse_cypher_words = self.inverseCypherWords
+        for offset in range(0, len(data), 16):
+            struct.pack_into(">4I", output, offset, *inverse_cypher_words(*struct.unpack_from(">4I", data, offset)))
+        return bytes(output)
+
+    def encryptStream(self, source, destination, chunk_size:int = 65536) -> int:
+        '''
+        This method encrypts a binary stream, such as an open file, in Electronic Codebook (ECB) mode one chunk at a time
+
+        The chunks are read into a reusable buffer and only the final chunk is padded
+
+        Parameters :
+            source : binary stream
+                The stream of plain text, which must support readinto
+            destination : binary stream
+                The stream the cypher text is written to
+            chunk_size : int, optional
+                The number of bytes to process at a time, defaults to 65536
+
+        Returns :
+            length : int
+                The number of bytes written
+        '''
+
+        return processStream(source, destination, chunk_size, 16, lambda chunk, state : self.streamChunk(chunk, state, False), None)
+
+    def decryptStream(self, source, destination, chunk_size:int = 65536) -> int:
+        '''
+        This method decrypts a binary stream that was encrypted in Electronic Codebook (ECB) mode one chunk at a time
+
+        Parameters :
+            source : binary stream
+                The stream of cypher text, which must support readinto
+            destination : binary stream
+                The stream the plain text is written to
+            chunk_size : int, optional
+                The number of bytes to process at a time, defaults to 65536
+
+        Returns :
+            length : int
+                The number of bytes written
+        '''
+
+        return processStream(source, destination, chunk_size, 16, lambda chunk, state : self.streamChunk(chunk, state, True), None)
+
+    def streamChunk(self, chunk:memoryview, state, is_decrypt:bool) -> tuple[bytes, None]:
+        '''
+        This method encrypts or decrypts one chunk of a stream, there is no state to carry between chunks in ECB mode
+
+        Parameters :
+            chunk : memoryview
+                The chunk of the stream
+            state : None
+                The chaining state, which is unused
+            is_decrypt : bool
+                Whether the chunk is being decrypted
+
+        Returns :
+            result : bytes
+                The result for the chunk
+            state : None
+                The chaining state for the next chunk
+        '''
+
+        if is_decrypt:
+            return self.decrypt(chunk), state
+        return self.encrypt(chunk), state
+
+# The keyed mode instance for each worker process, created once by initializeModeWorker
+mode_worker_instance = None
+
+def initializeModeWorker(mode_class:type, key:str):
+    '''
+    This method creates the keyed mode instance for a worker process, expanding the key once per worker
+
+    Parameters :
+        mode_class : type
+            The mode class for the key length
+        key : str
+            The key as a hexadecimal string
+    '''
+
+    global mode_worker_instance
+    mode_worker_instance = mode_class(key)
+    mode_worker_instance.parallel_threshold = None
+
+def modeWorkerEncrypt(chunk:bytes) -> bytes:
+    '''
+    This method encrypts one chunk of an Electronic Codebook (ECB) payload in a worker process
+
+    Parameters :
+        chunk : bytes
+            The chunk of plain text, a whole number of blocks
+
+    Returns :
+        result : bytes
+            The chunk of cypher text
+    '''
+
+    return mode_worker_instance.encrypt(chunk)
+
+def modeWorkerDecrypt(chunk:bytes, *chaining_block:bytes) -> bytes:
+    '''
+    This method decrypts one chunk of an Electronic Codebook (ECB) or Cipher Block Chaining (CBC) payload in a worker process
+
+    Parameters :
+        chunk : bytes
+            The chunk of cypher text, a whole number of blocks
+        chaining_block : bytes, optional
+            For CBC, the cypher text block before the chunk, or the initialization vector for the first chunk
+
+    Returns :
+        result : bytes
+            The chunk of plain text
+    '''
+
+    return mode_worker_instance.decrypt(chunk, *chaining_block)
+
 class AES_ECB_192(AES_ECB_128):
     '''
     This class is a subclass of AES_ECB_128 with a key length of 192 bits in Electronic Cookbook Mode
@@ -229,6 +531,8 @@ class AES_CBC_128(AES_ECB_128):
             
         '''
 
+        if self.isParallel(len(encrypted_list) * 16):
+            return self.bytesToHexList(self.decrypt(self.hexListToBytes(encrypted_list), bytes.fromhex(initialization_vector)))
         result_list = []
         xor_vector = initialization_vector
         for encoded_hex in encrypted_list:
@@ -301,6 +605,153 @@ class AES_CBC_128(AES_ECB_128):
         unencrypted_string = self.hexListToString(result_list)
         return unencrypted_string
     
+    def encrypt(self, data:bytes, initialization_vector:bytes) -> bytes:
+        '''
+        This method encrypts bytes using AES in Cipher Block Chaining (CBC) mode, chaining on 32 bit column words
+
+        The data is padded with zero bytes to a whole number of blocks, the same as encryptHexStringMessage
+
+        Parameters :
+            data : bytes
+                The content to be encrypted
+            initialization_vector : bytes
+                The 16 byte initialization vector
+
+        Returns :
+            encrypted_data : bytes
+                The result of the encryption
+        '''
+
+        data = self.padBytes(data)
+        output = bytearray(len(data))
+        cypher_words = self.cypherWords
+        c0, c1, c2, c3 = struct.unpack(">4I", initialization_vector)
+        for offset in range(0, len(data), 16):
+            p0, p1, p2, p3 = struct.unpack_from(">4I", data, offset)
+            c0, c1, c2, c3 = cypher_words(p0 ^ c0, p1 ^ c1, p2 ^ c2, p3 ^ c3)
+            struct.pack_into(">4I", output, offset, c0, c1, c2, c3)
+        return bytes(output)
+
+    def decrypt(self, data:bytes, initialization_vector:bytes) -> bytes:
+        '''
+        This method decrypts bytes that were encrypted using AES in Cipher Block Chaining (CBC) mode
+
+        Parameters :
+            data : bytes
+                The encrypted content, a whole number of blocks
+            initialization_vector : bytes
+                The 16 byte initialization vector
+
+        Returns :
+            decrypted_data : bytes
+                The result of the decryption
+        '''
+
+        self.checkWholeBlocks(data)
+        if self.isParallel(len(data)):
+            # each chunk is chained from the last cypher text block of the chunk before it
+            chunks = self.splitIntoChunks(data)
+            chaining_blocks = [bytes(initialization_vector)] + [chunk[-16:] for chunk in chunks[:-1]]
+            return self.runParallel(modeWorkerDecrypt, chunks, chaining_blocks)
+        output = bytearray(len(data))
+        inverse_cypher_words = self.inverseCypherWords
+        v0, v1, v2, v3 = struct.unpack(">4I", initialization_vector)
+        for offset in range(0, len(data), 16):
+            c0, c1, c2, c3 = struct.unpack_from(">4I", data, offset)
+            p0, p1, p2, p3 = inverse_cypher_words(c0, c1, c2, c3)
+            struct.pack_into(">4I", output, offset, p0 ^ v0, p1 ^ v1, p2 ^ v2, p3 ^ v3)
+            v0, v1, v2, v3 = c0, c1, c2, c3
+        return bytes(output)
+
+    def xorBytes(self, data:bytes, keystream:bytes) -> bytes:
+        '''
+        This method performs an exclusive or of data with the start of a keystream as a single int operation
+
+        Parameters :
+            data : bytes
+                The data to be xored
+            keystream : bytes
+                The keystream, at least as long as the data
+
+        Returns :
+            xor_bytes : bytes
+                The result of the xor, the same length as the data
+        '''
+
+        length = len(data)
+        xor_value = int.from_bytes(data, "big") ^ int.from_bytes(keystream[:length], "big")
+        return xor_value.to_bytes(length, "big")
+
+    def encryptStream(self, source, destination, initialization_vector:bytes, chunk_size:int = 65536) -> int:
+        '''
+        This method encrypts a binary stream, such as an open file, one chunk at a time
+
+        The chunks are read into a reusable buffer, the chaining state is carried from one chunk to the next
+        and only the final chunk is padded
+
+        Parameters :
+            source : binary stream
+                The stream of plain text, which must support readinto
+            destination : binary stream
+                The stream the cypher text is written to
+            initialization_vector : bytes
+                The 16 byte initialization vector
+            chunk_size : int, optional
+                The number of bytes to process at a time, defaults to 65536
+
+        Returns :
+            length : int
+                The number of bytes written
+        '''
+
+        return processStream(source, destination, chunk_size, 16, lambda chunk, state : self.streamChunk(chunk, state, False), bytes(initialization_vector))
+
+    def decryptStream(self, source, destination, initialization_vector:bytes, chunk_size:int = 65536) -> int:
+        '''
+        This method decrypts a binary stream one chunk at a time, carrying the chaining state from one chunk to the next
+
+        Parameters :
+            source : binary stream
+                The stream of cypher text, which must support readinto
+            destination : binary stream
+                The stream the plain text is written to
+            initialization_vector : bytes
+                The 16 byte initialization vector
+            chunk_size : int, optional
+                The number of bytes to process at a time, defaults to 65536
+
+        Returns :
+            length : int
+                The number of bytes written
+        '''
+
+        return processStream(source, destination, chunk_size, 16, lambda chunk, state : self.streamChunk(chunk, state, True), bytes(initialization_vector))
+
+    def streamChunk(self, chunk:memoryview, initialization_vector:bytes, is_decrypt:bool) -> tuple[bytes, bytes]:
+        '''
+        This method encrypts or decrypts one chunk of a stream in Cipher Block Chaining (CBC) mode,
+        the last cypher text block becomes the initialization vector for the next chunk
+
+        Parameters :
+            chunk : memoryview
+                The chunk of the stream
+            initialization_vector : bytes
+                The initialization vector for the chunk
+            is_decrypt : bool
+                Whether the chunk is being decrypted
+
+        Returns :
+            result : bytes
+                The result for the chunk
+            initialization_vector : bytes
+                The initialization vector for the next chunk
+        '''
+
+        if is_decrypt:
+            return self.decrypt(chunk, initialization_vector), bytes(chunk[-16:])
+        result = self.encrypt(chunk, initialization_vector)
+        return result, result[-16:]
+
 class AES_CBC_192(AES_CBC_128):
     '''
     This class is a subclass of AES_CBC_128 with a key length of 192 bits in Cipher Block Chaining (CBC) Mode
@@ -436,6 +887,114 @@ class AES_CFB_128(AES_CBC_128):
             result_list.append(message_chunk.getHexString())
         return result_list
 
+    def encrypt(self, data:bytes, initialization_vector:bytes) -> bytes:
+        '''
+        This method encrypts bytes using AES in Cipher Feedback (CFB) mode with a segment size of s bits
+
+        Each block of the data is split into s bit segments as in encryptHexList, with any partial segment at the end
+        of the data encrypted using the most significant bits of its output block
+
+        Parameters :
+            data : bytes
+                The content to be encrypted
+            initialization_vector : bytes
+                The 16 byte initialization vector
+
+        Returns :
+            encrypted_data : bytes
+                The result of the encryption
+        '''
+
+        return self.cfbBytes(data, initialization_vector, False)
+
+    def decrypt(self, data:bytes, initialization_vector:bytes) -> bytes:
+        '''
+        This method decrypts bytes that were encrypted using AES in Cipher Feedback (CFB) mode with a segment size of s bits
+
+        Parameters :
+            data : bytes
+                The encrypted content
+            initialization_vector : bytes
+                The 16 byte initialization vector
+
+        Returns :
+            decrypted_data : bytes
+                The result of the decryption
+        '''
+
+        return self.cfbBytes(data, initialization_vector, True)
+
+    def cfbBytes(self, data:bytes, initialization_vector:bytes, is_decrypt:bool) -> bytes:
+        '''
+        This method runs the Cipher Feedback (CFB) shift register over bytes, keeping the input block as a 128 bit int
+
+        Parameters :
+            data : bytes
+                The content to be encrypted or decrypted
+            initialization_vector : bytes
+                The 16 byte initialization vector
+            is_decrypt : bool
+                Whether the data is cypher text, in which case the input segments are fed back instead of the output segments
+
+        Returns :
+            result : bytes
+                The result of the encryption or decryption
+        '''
+
+        b = self.block_size
+        s = self.s
+        segment_mask = (1 << s) - 1
+        block_mask = (1 << b) - 1
+        cypher_value = self.cypherValue
+        output = bytearray(len(data))
+        I = int.from_bytes(initialization_vector, "big")
+        for offset in range(0, len(data), 16):
+            chunk = data[offset:offset+16]
+            bit_length = len(chunk) * 8
+            chunk_value = int.from_bytes(chunk, "big")
+            result_value = 0
+            for j in range(0, bit_length // s):
+                O = cypher_value(I) >> (b - s)
+                segment = (chunk_value >> (bit_length - s * (j + 1))) & segment_mask
+                result_segment = segment ^ O
+                result_value = (result_value << s) | result_segment
+                C = segment if is_decrypt else result_segment
+                I = ((I << s) | C) & block_mask
+            # a partial segment at the end of the data uses only the most significant bits of the output block
+            remainder = bit_length % s
+            if remainder:
+                O = cypher_value(I) >> (b - remainder)
+                segment = chunk_value & ((1 << remainder) - 1)
+                result_value = (result_value << remainder) | (segment ^ O)
+            output[offset:offset+len(chunk)] = result_value.to_bytes(len(chunk), "big")
+        return bytes(output)
+
+    def streamChunk(self, chunk:memoryview, initialization_vector:bytes, is_decrypt:bool) -> tuple[bytes, bytes]:
+        '''
+        This method encrypts or decrypts one chunk of a stream in Cipher Feedback (CFB) mode
+
+        Every chunk but the last is a whole number of blocks, so after it the shift register holds the last cypher text block
+
+        Parameters :
+            chunk : memoryview
+                The chunk of the stream
+            initialization_vector : bytes
+                The input block for the chunk
+            is_decrypt : bool
+                Whether the chunk is being decrypted
+
+        Returns :
+            result : bytes
+                The result for the chunk
+            initialization_vector : bytes
+                The input block for the next chunk
+        '''
+
+        result = self.cfbBytes(chunk, initialization_vector, is_decrypt)
+        if is_decrypt:
+            return result, bytes(chunk[-16:])
+        return result, result[-16:]
+
 class AES_CFB_192(AES_CFB_128):
     '''
     This class is a subclass of AES_CFB_128 with a key length of 192 bits in Cipher Feedback (CFB) Mode
@@ -545,6 +1104,91 @@ class AES_OFB_128(AES_CBC_128):
             I = O
         return result_list
     
+    def encrypt(self, data:bytes, initialization_vector:bytes) -> bytes:
+        '''
+        This method encrypts bytes using AES in Output Feedback (OFB) mode
+
+        The keystream is written into a preallocated buffer and xored with the data in one pass, so no padding is needed
+
+        Parameters :
+            data : bytes
+                The content to be encrypted
+            initialization_vector : bytes
+                The 16 byte initialization vector
+
+        Returns :
+            encrypted_data : bytes
+                The result of the encryption
+        '''
+
+        number_of_blocks = (len(data) + 15) // 16
+        keystream = bytearray(number_of_blocks * 16)
+        cypher_words = self.cypherWords
+        O = struct.unpack(">4I", initialization_vector)
+        for offset in range(0, len(keystream), 16):
+            O = cypher_words(*O)
+            struct.pack_into(">4I", keystream, offset, *O)
+        return self.xorBytes(data, keystream)
+
+    def decrypt(self, data:bytes, initialization_vector:bytes) -> bytes:
+        '''
+        This method decrypts bytes that were encrypted using AES in Output Feedback (OFB) mode
+
+        Parameters :
+            data : bytes
+                The encrypted content
+            initialization_vector : bytes
+                The 16 byte initialization vector
+
+        Returns :
+            decrypted_data : bytes
+                The result of the decryption
+        '''
+
+        return self.encrypt(data, initialization_vector)
+
+    def streamChunk(self, chunk:memoryview, initialization_vector:bytes, is_decrypt:bool) -> tuple[bytes, bytes]:
+        '''
+        This method encrypts or decrypts one chunk of a stream in Output Feedback (OFB) mode,
+        the last output block, recovered by xoring the last input and result blocks, is the input block for the next chunk
+
+        Parameters :
+            chunk : memoryview
+                The chunk of the stream
+            initialization_vector : bytes
+                The input block for the chunk
+            is_decrypt : bool
+                Whether the chunk is being decrypted, which is the same as encrypting in OFB mode
+
+        Returns :
+            result : bytes
+                The result for the chunk
+            initialization_vector : bytes
+                The input block for the next chunk
+        '''
+
+        result = self.encrypt(chunk, initialization_vector)
+        return result, self.xorBytes(chunk[-16:], result[-16:])
+
+    def keystreamBlocks(self, initialization_vector:bytes):
+        '''
+        This method generates the Output Feedback (OFB) mode keystream one block at a time, independent of the data
+
+        Parameters :
+            initialization_vector : bytes
+                The 16 byte initialization vector
+
+        Yields :
+            block : bytes
+                The next 16 byte output block
+        '''
+
+        cypher_words = self.cypherWords
+        words = struct.unpack(">4I", initialization_vector)
+        while True:
+            words = cypher_words(*words)
+            yield struct.pack(">4I", *words)
+
 class AES_OFB_192(AES_OFB_128):
     '''
     This class is a subclass of AES_OFB_128 with a key length of 192 bits in Output Feedback (OFB) Mode
@@ -654,6 +1298,148 @@ class AES_CTR_128(AES_CBC_128):
             T.setValue(T.getValue()+1)
         return result_list
     
+    def encrypt(self, data:bytes, initialization_vector:bytes) -> bytes:
+        '''
+        This method encrypts bytes using AES in Counter (CTR) mode
+
+        The counter is kept as a 128 bit int and the keystream is written into a preallocated buffer and xored
+        with the data in one pass, so no padding is needed
+
+        Parameters :
+            data : bytes
+                The content to be encrypted
+            initialization_vector : bytes
+                The 16 byte initial counter block
+
+        Returns :
+            encrypted_data : bytes
+                The result of the encryption
+        '''
+
+        number_of_blocks = (len(data) + 15) // 16
+        keystream = self.keystreamBytes(int.from_bytes(initialization_vector, "big"), number_of_blocks)
+        return self.xorBytes(data, keystream)
+
+    def keystreamBytes(self, counter:int, number_of_blocks:int) -> bytearray:
+        '''
+        This method generates the Counter (CTR) mode keystream for a number of blocks starting from a counter block
+
+        Parameters :
+            counter : int
+                The first counter block as a 128 bit int
+            number_of_blocks : int
+                The number of keystream blocks to generate
+
+        Returns :
+            keystream : bytearray
+                The encrypted counter blocks
+        '''
+
+        keystream = bytearray(number_of_blocks * 16)
+        cypher_words = self.cypherWords
+        T = counter
+        for offset in range(0, len(keystream), 16):
+            struct.pack_into(">4I", keystream, offset, *cypher_words(T >> 96, (T >> 64) & 0xFFFFFFFF, (T >> 32) & 0xFFFFFFFF, T & 0xFFFFFFFF))
+            T = (T + 1) & 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+        return keystream
+
+    def decryptRange(self, source, initialization_vector:bytes, offset:int, length:int) -> bytes:
+        '''
+        This method decrypts a byte range from the middle of Counter (CTR) mode cypher text without decrypting what comes before it
+
+        The counter block for the first block of the range is computed directly from the initial counter, and only the
+        keystream blocks covering the range are generated, trimmed for any partial leading and trailing blocks
+
+        Parameters :
+            source : bytes, bytearray, memoryview, mmap or binary file
+                The whole cypher text, only the bytes in the range are read
+            initialization_vector : bytes
+                The 16 byte initial counter block used to encrypt the whole cypher text
+            offset : int
+                The position of the first byte to decrypt
+            length : int
+                The number of bytes to decrypt, fewer are returned if the range runs past the end of the source
+
+        Returns :
+            decrypted_data : bytes
+                The decrypted bytes of the range
+        '''
+
+        if offset < 0 or length < 0:
+            raise ValueError(f"The range must have a non negative offset and length, not offset {offset} and length {length}")
+        if hasattr(source, "read") and not isinstance(source, mmap.mmap):
+            source.seek(offset)
+            data = source.read(length)
+        else:
+            data = bytes(memoryview(source)[offset:offset + length])
+        if len(data) == 0:
+            return b""
+
+        first_block, skipped_bytes = divmod(offset, 16)
+        number_of_blocks = (skipped_bytes + len(data) + 15) // 16
+        counter = (int.from_bytes(initialization_vector, "big") + first_block) & 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+        keystream = self.keystreamBytes(counter, number_of_blocks)
+        return self.xorBytes(data, keystream[skipped_bytes:])
+
+    def decrypt(self, data:bytes, initialization_vector:bytes) -> bytes:
+        '''
+        This method decrypts bytes that were encrypted using AES in Counter (CTR) mode
+
+        Parameters :
+            data : bytes
+                The encrypted content
+            initialization_vector : bytes
+                The 16 byte initial counter block
+
+        Returns :
+            decrypted_data : bytes
+                The result of the decryption
+        '''
+
+        return self.encrypt(data, initialization_vector)
+
+    def streamChunk(self, chunk:memoryview, initialization_vector:bytes, is_decrypt:bool) -> tuple[bytes, bytes]:
+        '''
+        This method encrypts or decrypts one chunk of a stream in Counter (CTR) mode,
+        the counter block is advanced by the number of blocks in the chunk
+
+        Parameters :
+            chunk : memoryview
+                The chunk of the stream
+            initialization_vector : bytes
+                The counter block for the first block of the chunk
+            is_decrypt : bool
+                Whether the chunk is being decrypted, which is the same as encrypting in CTR mode
+
+        Returns :
+            result : bytes
+                The result for the chunk
+            initialization_vector : bytes
+                The counter block for the next chunk
+        '''
+
+        next_counter = (int.from_bytes(initialization_vector, "big") + (len(chunk) + 15) // 16) & 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+        return self.encrypt(chunk, initialization_vector), next_counter.to_bytes(16, "big")
+
+    def keystreamBlocks(self, initialization_vector:bytes):
+        '''
+        This method generates the Counter (CTR) mode keystream one block at a time, independent of the data
+
+        Parameters :
+            initialization_vector : bytes
+                The 16 byte initial counter block
+
+        Yields :
+            block : bytes
+                The next 16 byte encrypted counter block
+        '''
+
+        cypher_words = self.cypherWords
+        T = int.from_bytes(initialization_vector, "big")
+        while True:
+            yield struct.pack(">4I", *cypher_words(T >> 96, (T >> 64) & 0xFFFFFFFF, (T >> 32) & 0xFFFFFFFF, T & 0xFFFFFFFF))
+            T = (T + 1) & 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF
+
 class AES_CTR_192(AES_CTR_128):
     '''
     This class is a subclass of AES_CTR_128 with a key length of 192 bits in Counter (CTR) Mode
@@ -697,4 +1483,151 @@ class AES_CTR_256(AES_CTR_128):
         self.key_length = 256
         self.number_of_rounds = 14
         self.number_key_words = 8
-        self.keyExpansion()
\ No newline at end of file
+        self.keyExpansion()
+
+class AES_KeystreamProducer():
+    '''
+    This class precomputes the keystream for Output Feedback (OFB) or Counter (CTR) mode in a background thread
+
+    The keystream does not depend on the data, so blocks are generated into a ring buffer of queue_depth blocks ahead of demand
+    and encrypting or decrypting becomes an exclusive or with blocks that are already waiting
+    A hit is a block that was ready when it was needed and a miss is a block that had to be waited for, which can be used to size the queue
+    '''
+
+    def __init__(self, mode:AES_CBC_128, initialization_vector:bytes, queue_depth:int = 256):
+        '''
+        This method initializes the keystream producer and starts its background thread
+
+        Parameters :
+            mode : AES_OFB_128 or AES_CTR_128
+                The keyed mode instance, of any key length, providing keystreamBlocks
+            initialization_vector : bytes
+                The 16 byte initialization vector or initial counter block
+            queue_depth : int, optional
+                The number of keystream blocks that can be generated ahead of demand, defaults to 256
+        '''
+
+        self.queue_depth = queue_depth
+        self.ring_buffer = queue.Queue(maxsize=queue_depth)
+        self.leftover_keystream = b""
+        self.hits = 0
+        self.misses = 0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.produceKeystream, args=(mode.keystreamBlocks(bytes(initialization_vector)),), daemon=True)
+        self.thread.start()
+
+    def produceKeystream(self, keystream_blocks):
+        '''
+        This method runs in the background thread, filling the ring buffer until the producer is stopped
+
+        Parameters :
+            keystream_blocks : generator
+                The mode's keystream blocks
+        '''
+
+        for block in keystream_blocks:
+            while not self.stop_event.is_set():
+                try:
+                    self.ring_buffer.put(block, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if self.stop_event.is_set():
+                return
+
+    def queuedBlocks(self) -> int:
+        '''
+        This method gets the number of keystream blocks currently waiting in the ring buffer
+
+        Returns :
+            queued_blocks : int
+                The number of blocks ready to be used
+        '''
+
+        return self.ring_buffer.qsize()
+
+    def keystream(self, length:int) -> bytes:
+        '''
+        This method takes the next bytes of keystream, keeping any unused part of the last block for the next call
+        A ValueError is raised once the producer has been stopped, as no more blocks will be generated
+
+        Parameters :
+            length : int
+                The number of keystream bytes needed
+
+        Returns :
+            keystream : bytes
+                The next length bytes of the keystream
+        '''
+
+        keystream_parts = [self.leftover_keystream]
+        for _ in range(0, (length - len(self.leftover_keystream) + 15) // 16):
+            if self.stop_event.is_set():
+                raise ValueError("No more keystream can be taken after the producer has been stopped")
+            try:
+                block = self.ring_buffer.get_nowait()
+                self.hits += 1
+            except queue.Empty:
+                block = self.waitForBlock()
+                self.misses += 1
+            keystream_parts.append(block)
+        keystream = b"".join(keystream_parts)
+        self.leftover_keystream = keystream[length:]
+        return keystream[:length]
+
+    def waitForBlock(self) -> bytes:
+        '''
+        This method waits for the background thread to generate the next keystream block, 
+        raising a ValueError if the producer is stopped while waiting
+
+        Returns :
+            block : bytes
+                The next keystream block
+        '''
+
+        while not self.stop_event.is_set():
+            try:
+                return self.ring_buffer.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        raise ValueError("No more keystream can be taken after the producer has been stopped")
+
+    def xorBytes(self, data:bytes) -> bytes:
+        '''
+        This method encrypts or decrypts the next bytes of the stream as an exclusive or with the precomputed keystream
+
+        Parameters :
+            data : bytes
+                The next bytes of plain text or cypher text
+
+        Returns :
+            result : bytes
+                The result of the exclusive or
+        '''
+
+        length = len(data)
+        xor_value = int.from_bytes(data, "big") ^ int.from_bytes(self.keystream(length), "big")
+        return xor_value.to_bytes(length, "big")
+
+    def xorHexList(self, hex_list:list[str]) -> list[str]:
+        '''
+        This method encrypts or decrypts the next blocks of the stream, given as a list of hex strings, with the precomputed keystream
+
+        Parameters :
+            hex_list : [str]
+                The next blocks as hex strings in the appropriate block size
+
+        Returns :
+            result_list : [str]
+                The results as a list of upper case hex strings
+        '''
+
+        return [self.xorBytes(bytes.fromhex(hex_segment)).hex().upper() for hex_segment in hex_list]
+
+    def stop(self):
+        '''
+        This method stops the background thread, after which keystream() raises a ValueError
+        '''
+
+        self.stop_event.set()
+        self.thread.join()
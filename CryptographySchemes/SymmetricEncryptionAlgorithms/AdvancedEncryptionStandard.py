@@ -1,3 +1,4 @@
+import struct
 
 class AES():
     '''
@@ -67,19 +68,29 @@ class AES():
         [0x09, 0x0e, 0x0b, 0x0d],
         [0x0d, 0x09, 0x0e, 0x0b],
         [0x0b, 0x0d, 0x09, 0x0e]]
+    # The substitution boxes as flat 256 entry lists, the four combined SubBytes/ShiftRows/MixColumns tables
+    # and the four combined InvSubBytes/InvShiftRows/InvMixColumns tables for the equivalent inverse cypher
+    # These are built once from the matrices above by buildTables() the first time a key is expanded
+    substitution_bytes = None
+    encryption_tables = None
+    inverse_substitution_bytes = None
+    decryption_tables = None
     
-    def __init__(self, key):
+    def __init__(self, key, use_tables:bool = True):
         '''
         This method should initialize aes with a given key
 
         Parameters : 
             key : str
                 The key for the aes algorithm
+            use_tables : bool, optional
+                Whether the cypher and inverse cypher should use the 32 bit column word lookup tables instead of the 4x4 matrix steps, defaults to True
         '''
         self.block_size = 128
         self.key = key
         self.number_key_words = 0
         self.number_of_rounds = 0
+        self.use_tables = use_tables
 
     def substituteBytes(self, s):
         '''
@@ -457,6 +468,209 @@ class AES():
                 self.printWordAsHex(temp)
             expanded_key.append(new_word)
         self.expanded_key = expanded_key
+        if AES.encryption_tables is None:
+            self.buildTables()
+        self.round_key_words = [(word[0] << 24) | (word[1] << 16) | (word[2] << 8) | word[3] for word in expanded_key]
+        self.inverseKeyExpansion()
+
+    def inverseKeyExpansion(self):
+        '''
+        This method transforms the round keys for use by the equivalent inverse cypher
+        As defined by Algorithm 5 "Pseudocode for KEYEXPANSIONEIC()" in NIST FIPS 197
+
+        The round keys are stored in the order the inverse cypher uses them, and InvMixColumns is applied
+        to every round key apart from the first and last so that decryption has the same structure as encryption
+        '''
+
+        sbox = self.substitution_bytes
+        table_0, table_1, table_2, table_3 = self.decryption_tables
+        round_keys = self.round_key_words
+        decryption_keys = round_keys[4*self.number_of_rounds:4*(self.number_of_rounds+1)]
+        for i in range(self.number_of_rounds-1, 0, -1):
+            for word in round_keys[4*i:4*(i+1)]:
+                # the substitution box cancels the inverse substitution built into the decryption tables
+                decryption_keys.append(table_0[sbox[word >> 24]] ^ table_1[sbox[(word >> 16) & 0xFF]] ^ table_2[sbox[(word >> 8) & 0xFF]] ^ table_3[sbox[word & 0xFF]])
+        decryption_keys += round_keys[0:4]
+        self.decryption_key_words = decryption_keys
+
+    def buildTables(self):
+        '''
+        This method builds the lookup tables used by the table based cypher and inverse cypher
+
+        Each table entry is the 32 bit column word produced by substituting a byte and multiplying it through one column
+        of the MixColumns (or InvMixColumns) matrix, so a full round becomes sixteen lookups and xors on four column words
+        As described in "The Design of Rijndael" Section 4.2 "Different Platforms"
+        '''
+
+        substitution_bytes = [value for row in self.substitution_matrix for value in row]
+        table_0 = []
+        for value in substitution_bytes:
+            table_0.append((self.xTimes(value, 2) << 24) | (value << 16) | (value << 8) | self.xTimes(value, 3))
+        table_1 = [((word >> 8) | (word << 24)) & 0xFFFFFFFF for word in table_0]
+        table_2 = [((word >> 8) | (word << 24)) & 0xFFFFFFFF for word in table_1]
+        table_3 = [((word >> 8) | (word << 24)) & 0xFFFFFFFF for word in table_2]
+        inverse_substitution_bytes = [value for row in self.inverse_substitution_matrix for value in row]
+        inverse_table_0 = []
+        for value in inverse_substitution_bytes:
+            inverse_table_0.append((self.xTimes(value, 0x0e) << 24) | (self.xTimes(value, 0x09) << 16) | (self.xTimes(value, 0x0d) << 8) | self.xTimes(value, 0x0b))
+        inverse_table_1 = [((word >> 8) | (word << 24)) & 0xFFFFFFFF for word in inverse_table_0]
+        inverse_table_2 = [((word >> 8) | (word << 24)) & 0xFFFFFFFF for word in inverse_table_1]
+        inverse_table_3 = [((word >> 8) | (word << 24)) & 0xFFFFFFFF for word in inverse_table_2]
+        AES.substitution_bytes = substitution_bytes
+        AES.encryption_tables = (table_0, table_1, table_2, table_3)
+        AES.inverse_substitution_bytes = inverse_substitution_bytes
+        AES.decryption_tables = (inverse_table_0, inverse_table_1, inverse_table_2, inverse_table_3)
+
+    def cypherWords(self, s0:int, s1:int, s2:int, s3:int) -> tuple[int, int, int, int]:
+        '''
+        This method applies the aes cypher to a block held as four 32 bit column words using the combined lookup tables
+
+        Parameters :
+            s0, s1, s2, s3 : int
+                The four columns of the input block, each as a big endian 32 bit int
+
+        Returns :
+            state : (int, int, int, int)
+                The four columns of the encyphered block
+        '''
+
+        table_0, table_1, table_2, table_3 = self.encryption_tables
+        sbox = self.substitution_bytes
+        round_keys = self.round_key_words
+        s0 ^= round_keys[0]
+        s1 ^= round_keys[1]
+        s2 ^= round_keys[2]
+        s3 ^= round_keys[3]
+        k = 4
+        for _ in range(1, self.number_of_rounds):
+            t0 = table_0[s0 >> 24] ^ table_1[(s1 >> 16) & 0xFF] ^ table_2[(s2 >> 8) & 0xFF] ^ table_3[s3 & 0xFF] ^ round_keys[k]
+            t1 = table_0[s1 >> 24] ^ table_1[(s2 >> 16) & 0xFF] ^ table_2[(s3 >> 8) & 0xFF] ^ table_3[s0 & 0xFF] ^ round_keys[k+1]
+            t2 = table_0[s2 >> 24] ^ table_1[(s3 >> 16) & 0xFF] ^ table_2[(s0 >> 8) & 0xFF] ^ table_3[s1 & 0xFF] ^ round_keys[k+2]
+            t3 = table_0[s3 >> 24] ^ table_1[(s0 >> 16) & 0xFF] ^ table_2[(s1 >> 8) & 0xFF] ^ table_3[s2 & 0xFF] ^ round_keys[k+3]
+            s0, s1, s2, s3 = t0, t1, t2, t3
+            k += 4
+        # the final round has no MixColumns so only the substitution box is used
+        t0 = ((sbox[s0 >> 24] << 24) | (sbox[(s1 >> 16) & 0xFF] << 16) | (sbox[(s2 >> 8) & 0xFF] << 8) | sbox[s3 & 0xFF]) ^ round_keys[k]
+        t1 = ((sbox[s1 >> 24] << 24) | (sbox[(s2 >> 16) & 0xFF] << 16) | (sbox[(s3 >> 8) & 0xFF] << 8) | sbox[s0 & 0xFF]) ^ round_keys[k+1]
+        t2 = ((sbox[s2 >> 24] << 24) | (sbox[(s3 >> 16) & 0xFF] << 16) | (sbox[(s0 >> 8) & 0xFF] << 8) | sbox[s1 & 0xFF]) ^ round_keys[k+2]
+        t3 = ((sbox[s3 >> 24] << 24) | (sbox[(s0 >> 16) & 0xFF] << 16) | (sbox[(s1 >> 8) & 0xFF] << 8) | sbox[s2 & 0xFF]) ^ round_keys[k+3]
+        return t0, t1, t2, t3
+
+    def cypherValue(self, value:int) -> int:
+        '''
+        This method encrypts a single block held as a 128 bit int with the table based cypher
+
+        Parameters :
+            value : int
+                The 128 bit block to encrypt
+
+        Returns :
+            encrypted_value : int
+                The encrypted 128 bit block
+        '''
+
+        s0, s1, s2, s3 = self.cypherWords(value >> 96, (value >> 64) & 0xFFFFFFFF, (value >> 32) & 0xFFFFFFFF, value & 0xFFFFFFFF)
+        return (s0 << 96) | (s1 << 64) | (s2 << 32) | s3
+
+    def inverseCypherValue(self, value:int) -> int:
+        '''
+        This method decrypts a single block held as a 128 bit int with the equivalent inverse cypher
+
+        Parameters :
+            value : int
+                The 128 bit block to decrypt
+
+        Returns :
+            decrypted_value : int
+                The decrypted 128 bit block
+        '''
+
+        s0, s1, s2, s3 = self.inverseCypherWords(value >> 96, (value >> 64) & 0xFFFFFFFF, (value >> 32) & 0xFFFFFFFF, value & 0xFFFFFFFF)
+        return (s0 << 96) | (s1 << 64) | (s2 << 32) | s3
+
+    def encryptBlock(self, block:bytes) -> bytes:
+        '''
+        This method encrypts a single 16 byte block with the table based cypher, without any hex conversion
+
+        Parameters :
+            block : bytes
+                The 16 byte block to encrypt
+
+        Returns :
+            encrypted_block : bytes
+                The encrypted 16 byte block
+        '''
+
+        return struct.pack(">4I", *self.cypherWords(*struct.unpack(">4I", block)))
+
+    def decryptBlock(self, block:bytes) -> bytes:
+        '''
+        This method decrypts a single 16 byte block with the equivalent inverse cypher, without any hex conversion
+
+        Parameters :
+            block : bytes
+                The 16 byte block to decrypt
+
+        Returns :
+            decrypted_block : bytes
+                The decrypted 16 byte block
+        '''
+
+        return struct.pack(">4I", *self.inverseCypherWords(*struct.unpack(">4I", block)))
+
+    def padBytes(self, data:bytes) -> bytes:
+        '''
+        This method pads a byte string with zero bytes up to a multiple of the block size, the same way the hex string methods pad
+
+        Parameters :
+            data : bytes
+                The bytes to be padded
+
+        Returns :
+            padded_data : bytes
+                The bytes padded to a whole number of blocks
+        '''
+
+        block_bytes = self.block_size // 8
+        if len(data) % block_bytes != 0:
+            data = bytes(data) + bytes(block_bytes - len(data) % block_bytes)
+        return data
+
+    def inverseCypherWords(self, s0:int, s1:int, s2:int, s3:int) -> tuple[int, int, int, int]:
+        '''
+        This method applies the equivalent inverse cypher to a block held as four 32 bit column words using the inverse lookup tables
+        As laid out in NIST FIPS 197 section 5.3.5 "Equivalent Inverse Cipher"
+
+        Parameters :
+            s0, s1, s2, s3 : int
+                The four columns of the encyphered block, each as a big endian 32 bit int
+
+        Returns :
+            state : (int, int, int, int)
+                The four columns of the decyphered block
+        '''
+
+        table_0, table_1, table_2, table_3 = self.decryption_tables
+        inverse_sbox = self.inverse_substitution_bytes
+        round_keys = self.decryption_key_words
+        s0 ^= round_keys[0]
+        s1 ^= round_keys[1]
+        s2 ^= round_keys[2]
+        s3 ^= round_keys[3]
+        k = 4
+        for _ in range(1, self.number_of_rounds):
+            t0 = table_0[s0 >> 24] ^ table_1[(s3 >> 16) & 0xFF] ^ table_2[(s2 >> 8) & 0xFF] ^ table_3[s1 & 0xFF] ^ round_keys[k]
+            t1 = table_0[s1 >> 24] ^ table_1[(s0 >> 16) & 0xFF] ^ table_2[(s3 >> 8) & 0xFF] ^ table_3[s2 & 0xFF] ^ round_keys[k+1]
+            t2 = table_0[s2 >> 24] ^ table_1[(s1 >> 16) & 0xFF] ^ table_2[(s0 >> 8) & 0xFF] ^ table_3[s3 & 0xFF] ^ round_keys[k+2]
+            t3 = table_0[s3 >> 24] ^ table_1[(s2 >> 16) & 0xFF] ^ table_2[(s1 >> 8) & 0xFF] ^ table_3[s0 & 0xFF] ^ round_keys[k+3]
+            s0, s1, s2, s3 = t0, t1, t2, t3
+            k += 4
+        # the final round has no InvMixColumns so only the inverse substitution box is used
+        t0 = ((inverse_sbox[s0 >> 24] << 24) | (inverse_sbox[(s3 >> 16) & 0xFF] << 16) | (inverse_sbox[(s2 >> 8) & 0xFF] << 8) | inverse_sbox[s1 & 0xFF]) ^ round_keys[k]
+        t1 = ((inverse_sbox[s1 >> 24] << 24) | (inverse_sbox[(s0 >> 16) & 0xFF] << 16) | (inverse_sbox[(s3 >> 8) & 0xFF] << 8) | inverse_sbox[s2 & 0xFF]) ^ round_keys[k+1]
+        t2 = ((inverse_sbox[s2 >> 24] << 24) | (inverse_sbox[(s1 >> 16) & 0xFF] << 16) | (inverse_sbox[(s0 >> 8) & 0xFF] << 8) | inverse_sbox[s3 & 0xFF]) ^ round_keys[k+2]
+        t3 = ((inverse_sbox[s3 >> 24] << 24) | (inverse_sbox[(s2 >> 16) & 0xFF] << 16) | (inverse_sbox[(s1 >> 8) & 0xFF] << 8) | inverse_sbox[s0 & 0xFF]) ^ round_keys[k+3]
+        return t0, t1, t2, t3
 
     def cypher(self, input, is_debug = False):
         '''
@@ -471,6 +685,9 @@ class AES():
                 The encyphered hex as a 4x4 matrix
         '''
 
+        if self.use_tables and not is_debug:
+            return '{:032X}'.format(self.cypherValue(int(input, 16)))
+
         state = self.hexStringToMatrix(input)
         state = self.flipMatrix(state)
 
@@ -530,6 +747,9 @@ class AES():
                 The decyphered hex as a 4x4 matrix
         '''
 
+        if self.use_tables and not is_debug:
+            return '{:032X}'.format(self.inverseCypherValue(int(input, 16)))
+
         state = self.hexStringToMatrix(input)
         state = self.flipMatrix(state)
         if is_debug:
@@ -699,16 +919,18 @@ class AES128(AES):
     This class is a subclass of AES with a key length of 128 bits
     '''
 
-    def __init__(self, key):
+    def __init__(self, key, use_tables:bool = True):
         '''
         This method should initialize aes 128 with a given key
 
         Parameters : 
             key : str
                 The 128 bit key for the aes algorithm
+            use_tables : bool, optional
+                Whether the cypher and inverse cypher should use the 32 bit column word lookup tables, defaults to True
         '''
 
-        super().__init__(key)
+        super().__init__(key, use_tables)
         self.key_length = 128
         self.number_of_rounds = 10
         self.number_key_words = 4
@@ -720,16 +942,18 @@ class AES192(AES):
     This class is a subclass of AES with a key length of 192 bits
     '''
 
-    def __init__(self, key):
+    def __init__(self, key, use_tables:bool = True):
         '''
         This method should initialize aes192 with a given key
 
         Parameters : 
             key : str
                 The 192 bit key for the aes algorithm
+            use_tables : bool, optional
+                Whether the cypher and inverse cypher should use the 32 bit column word lookup tables, defaults to True
         '''
 
-        super().__init__(key)
+        super().__init__(key, use_tables)
         self.key_length = 192
         self.number_key_words = 6
         self.number_of_rounds = 12
@@ -740,16 +964,18 @@ class AES256(AES):
     This class is a subclass of AES with a key length of 256 bits
     '''
 
-    def __init__(self, key):
+    def __init__(self, key, use_tables:bool = True):
         '''
         This method should initialize aes 256 with a given key
 
         Parameters : 
             key : str
                 The 256 bit key for the aes algorithm
+            use_tables : bool, optional
+                Whether the cypher and inverse cypher should use the 32 bit column word lookup tables, defaults to True
         '''
 
-        super().__init__(key)
+        super().__init__(key, use_tables)
         self.key_length = 256
         self.number_of_rounds = 14
         self.number_key_words = 8
@@ -1,4 +1,5 @@
 from HelperFunctions.IntegerHandler import *
+from functools import lru_cache
 
 class DataEncryptionStandard():
     '''
@@ -91,18 +92,203 @@ class DataEncryptionStandard():
         51, 45, 33, 48, 44, 49, 39, 56,
         34, 53, 46, 42, 50, 36, 29, 32]
     left_shift_schedule = [1, 1, 2, 2, 2, 2, 2, 2, 1, 2, 2, 2, 2, 2, 2, 1]
+
+    # Lookup tables for the integer implementation, built from the matrices above the first time a DES is created
+    # sp_tables[i][x] is the output of substitution matrix i for the 6 bit input x, already passed through the permutation matrix
+    # initial_permutation_tables[j][v] and final_permutation_tables[j][v] are the permuted bits contributed by byte j having the value v
+    sp_tables = None
+    initial_permutation_tables = None
+    final_permutation_tables = None
     
-    def __init__(self, key, is_hex_key = False):
+    def __init__(self, key, is_hex_key = False, use_tables:bool = True):
         '''
         This method initializes a DataEncryptionStandard with a given key
 
         Parameters :
             key : str
                 the key for this DES
+            is_hex_key : bool, optional
+                Whether the key is a hexadecimal string, defaults to False
+            use_tables : bool, optional
+                Whether blocks are encrypted on 64 bit ints with the lookup tables rather than on binary strings, defaults to True
         '''
 
         self.key = key
         self.is_hex_key = is_hex_key
+        self.use_tables = use_tables
+        if DataEncryptionStandard.sp_tables is None:
+            self.buildTables()
+        # the key schedule is computed once per key, and instances with the same key share it through the module level cache
+        self.round_keys = cachedRoundKeys(self.getKeyBytes())
+        self.inverse_round_keys = self.round_keys[::-1]
+
+    def buildTables(self):
+        '''
+        This method builds the lookup tables used by the integer implementation, they are shared by every DES instance
+        '''
+
+        sp_tables = []
+        for i in range(0, 8):
+            sp_table = []
+            for x in range(0, 64):
+                row = ((x >> 4) & 2) | (x & 1)
+                column = (x >> 1) & 0xF
+                substituted = self.substitution_matrices[i][row][column] << (28 - 4 * i)
+                sp_table.append(self.permuteValue(substituted, 32, self.permutation_matrix))
+            sp_tables.append(sp_table)
+
+        DataEncryptionStandard.initial_permutation_tables = self.bytePermutationTables(self.initial_permutation_matrix)
+        DataEncryptionStandard.final_permutation_tables = self.bytePermutationTables(self.inverse_initial_permutation_matrix)
+        DataEncryptionStandard.sp_tables = sp_tables
+
+    @staticmethod
+    def permuteValue(value:int, bit_length:int, permutation_matrix:list[int]) -> int:
+        '''
+        This method permutes the bits of an int one bit at a time, where position 1 in the matrix is the most significant bit
+
+        Parameters :
+            value : int
+                The value being permuted
+            bit_length : int
+                The bit length of the value
+            permutation_matrix : [int]
+                The input bit position for each output bit
+
+        Returns :
+            permuted_value : int
+                The result of the permutation
+        '''
+
+        permuted_value = 0
+        for position in permutation_matrix:
+            permuted_value = (permuted_value << 1) | ((value >> (bit_length - position)) & 1)
+        return permuted_value
+
+    def bytePermutationTables(self, permutation_matrix:list[int]) -> list[list[int]]:
+        '''
+        This method builds eight 256 entry tables for a 64 bit permutation so it can be applied one input byte at a time
+
+        Parameters :
+            permutation_matrix : [int]
+                The input bit position for each of the 64 output bits
+
+        Returns :
+            tables : [[int]]
+                The permuted bits contributed by each value of each input byte
+        '''
+
+        tables = []
+        for j in range(0, 8):
+            tables.append([self.permuteValue(v << (56 - 8 * j), 64, permutation_matrix) for v in range(0, 256)])
+        return tables
+
+    def permuteBlockValue(self, value:int, tables:list[list[int]]) -> int:
+        '''
+        This method applies the initial or final permutation to a 64 bit block using the byte tables
+
+        Parameters :
+            value : int
+                The 64 bit block
+            tables : [[int]]
+                The initial or final permutation byte tables
+
+        Returns :
+            permuted_value : int
+                The permuted block
+        '''
+
+        return (tables[0][value >> 56] | tables[1][(value >> 48) & 0xFF] | tables[2][(value >> 40) & 0xFF] | tables[3][(value >> 32) & 0xFF] |
+                tables[4][(value >> 24) & 0xFF] | tables[5][(value >> 16) & 0xFF] | tables[6][(value >> 8) & 0xFF] | tables[7][value & 0xFF])
+
+    def feistelFunction(self, right_half:int, key_for_round:int) -> int:
+        '''
+        This method computes the DES round function on ints, the expansion is done with shifts and masks
+        and each substitution matrix and the permutation matrix are applied together with one lookup
+
+        Parameters :
+            right_half : int
+                The current 32 bit right half
+            key_for_round : int
+                The 48 bit key for this round
+
+        Returns :
+            result : int
+                The 32 bit output of the round function
+        '''
+
+        # bit 32 is copied in front of bit 1 and bit 1 after bit 32, so each 6 bit expansion group is a 6 bit window
+        extended = ((right_half & 1) << 33) | (right_half << 1) | (right_half >> 31)
+        sp_tables = self.sp_tables
+        return (sp_tables[0][((extended >> 28) ^ (key_for_round >> 42)) & 0x3F] |
+                sp_tables[1][((extended >> 24) ^ (key_for_round >> 36)) & 0x3F] |
+                sp_tables[2][((extended >> 20) ^ (key_for_round >> 30)) & 0x3F] |
+                sp_tables[3][((extended >> 16) ^ (key_for_round >> 24)) & 0x3F] |
+                sp_tables[4][((extended >> 12) ^ (key_for_round >> 18)) & 0x3F] |
+                sp_tables[5][((extended >> 8) ^ (key_for_round >> 12)) & 0x3F] |
+                sp_tables[6][((extended >> 4) ^ (key_for_round >> 6)) & 0x3F] |
+                sp_tables[7][(extended ^ key_for_round) & 0x3F])
+
+    def cypherBlockValue(self, block:int, round_keys:list[int]) -> int:
+        '''
+        This method runs the 16 rounds of DES on a 64 bit int, the order of the round keys decides between encryption and decryption
+
+        Parameters :
+            block : int
+                The 64 bit block
+            round_keys : [int]
+                The 16 round keys as 48 bit ints, in the order they are used
+
+        Returns :
+            result : int
+                The 64 bit result
+        '''
+
+        permuted = self.permuteBlockValue(block, self.initial_permutation_tables)
+        left_half = permuted >> 32
+        right_half = permuted & 0xFFFFFFFF
+        feistel_function = self.feistelFunction
+        for key_for_round in round_keys:
+            left_half, right_half = right_half, left_half ^ feistel_function(right_half, key_for_round)
+        return self.permuteBlockValue((right_half << 32) | left_half, self.final_permutation_tables)
+
+    def getKeyBytes(self) -> bytes:
+        '''
+        This method gets the 64 bits of the key used by the key schedule as bytes, raising a ValueError if the key is shorter than 64 bits
+
+        Returns :
+            key_bytes : bytes
+                The key as 8 bytes
+        '''
+
+        key_binary = self.getBinaryKey()
+        if len(key_binary) < 64:
+            raise ValueError(f"The DES key must be at least 64 bits, not {len(key_binary)} bits")
+        return int(key_binary[:64], 2).to_bytes(8, "big")
+
+    @staticmethod
+    def computeRoundKeys(key_bytes:bytes) -> tuple[int, ...]:
+        '''
+        This method computes the keys for each round as 48 bit ints, using the permutation matrices and the left shift schedule on ints
+
+        Parameters :
+            key_bytes : bytes
+                The key as 8 bytes
+
+        Returns :
+            round_keys : (int)
+                The 16 keys for each round of the encryption
+        '''
+
+        permute_value = DataEncryptionStandard.permuteValue
+        key_permutated = permute_value(int.from_bytes(key_bytes, "big"), 64, DataEncryptionStandard.key_first_permutation_matrix)
+        key_first_half = key_permutated >> 28
+        key_second_half = key_permutated & 0xFFFFFFF
+        round_keys = []
+        for shift in DataEncryptionStandard.left_shift_schedule:
+            key_first_half = ((key_first_half << shift) | (key_first_half >> (28 - shift))) & 0xFFFFFFF
+            key_second_half = ((key_second_half << shift) | (key_second_half >> (28 - shift))) & 0xFFFFFFF
+            round_keys.append(permute_value((key_first_half << 28) | key_second_half, 56, DataEncryptionStandard.key_second_permutation_matrix))
+        return tuple(round_keys)
 
     def stringToBinaryList(self, string_message:str):
         '''
@@ -312,6 +498,9 @@ class DataEncryptionStandard():
                 The 8 character block of the message an an encrypted binary string
         '''
 
+        if self.use_tables:
+            return format(self.cypherBlockValue(int(binary_message, 2), self.round_keys), "064b")
+
         keys_for_each_round = self.generateKeysForEachRound()
 
         initial_permuted = self.performInitialPermutation(binary_message)
@@ -384,6 +573,9 @@ class DataEncryptionStandard():
                 The decrypted 8 character block of the message an an binary string
         '''
     
+        if self.use_tables:
+            return format(self.cypherBlockValue(int(encrypted_binary, 2), self.inverse_round_keys), "064b")
+
         keys_for_each_round = self.generateKeysForEachRound()
         
         initial_permuated = self.performInitialPermutation(encrypted_binary)
@@ -449,6 +641,257 @@ class DataEncryptionStandard():
         #     result_string = result_string + IntegerHandler.fromBitString(message,False,64).getHexString()
         return decrypted_hex
     
+class BitslicedDataEncryptionStandard():
+    '''
+    This class evaluates DES on many independent (key, block) pairs at once using a bitsliced representation
+
+    Each of the 64 bit positions of the blocks and keys is held as one Python int whose bit j is that bit of the jth pair,
+    so every xor, and, or of the round runs on all of the pairs together, the permutations are only reorderings of the list of ints
+    and each substitution matrix is evaluated as a boolean circuit of its truth table
+    '''
+
+    # substitution_circuits[i][o][h] is the tuple of low three input bit values which give output bit o of substitution matrix i
+    # when the high three input bits are h, built once from the DataEncryptionStandard matrices
+    # round_key_positions[r] is the key bit position for each of the 48 bits of the round key for round r
+    substitution_circuits = None
+    round_key_positions = None
+
+    def __init__(self):
+        '''
+        This method initializes the bitsliced DES, building the circuits and the key schedule positions the first time
+        '''
+
+        if BitslicedDataEncryptionStandard.substitution_circuits is None:
+            self.buildCircuits()
+
+    def buildCircuits(self):
+        '''
+        This method builds the substitution circuits and key schedule positions, they are shared by every instance
+        '''
+
+        substitution_circuits = []
+        for substitution_matrix in DataEncryptionStandard.substitution_matrices:
+            output_circuits = []
+            for o in range(0, 4):
+                high_circuits = []
+                for h in range(0, 8):
+                    low_values = []
+                    for l in range(0, 8):
+                        x = (h << 3) | l
+                        if (substitution_matrix[((x >> 4) & 2) | (x & 1)][(x >> 1) & 0xF] >> (3 - o)) & 1:
+                            low_values.append(l)
+                    high_circuits.append(tuple(low_values))
+                output_circuits.append(high_circuits)
+            substitution_circuits.append(output_circuits)
+
+        round_key_positions = []
+        first_permutation = DataEncryptionStandard.key_first_permutation_matrix
+        shift = 0
+        for left_shift in DataEncryptionStandard.left_shift_schedule:
+            shift += left_shift
+            shifted_positions = [first_permutation[(j + shift) % 28] - 1 for j in range(0, 28)]
+            shifted_positions += [first_permutation[28 + (j + shift) % 28] - 1 for j in range(0, 28)]
+            round_key_positions.append([shifted_positions[position - 1] for position in DataEncryptionStandard.key_second_permutation_matrix])
+
+        BitslicedDataEncryptionStandard.round_key_positions = round_key_positions
+        BitslicedDataEncryptionStandard.substitution_circuits = substitution_circuits
+
+    def toSlices(self, values:list[int]) -> list[int]:
+        '''
+        This method transposes 64 bit values into 64 slices, where bit j of slice p counting from the most significant end
+        is bit p of the jth value counting from the most significant end
+
+        Parameters :
+            values : [int]
+                The 64 bit values
+
+        Returns :
+            slices : [int]
+                The 64 slices
+        '''
+
+        binary_values = ["{:064b}".format(value) for value in values]
+        return [int("".join(column), 2) for column in zip(*binary_values)]
+
+    def fromSlices(self, slices:list[int], lane_count:int) -> list[int]:
+        '''
+        This method transposes 64 slices back into one 64 bit value for each lane
+
+        Parameters :
+            slices : [int]
+                The 64 slices
+            lane_count : int
+                The number of lanes
+
+        Returns :
+            values : [int]
+                The 64 bit values
+        '''
+
+        binary_slices = [format(bit_slice, "0" + str(lane_count) + "b") for bit_slice in slices]
+        return [int("".join(row), 2) for row in zip(*binary_slices)]
+
+    def substitute(self, inputs:list[int], all_lanes:int) -> list[int]:
+        '''
+        This method evaluates the eight substitution matrices on the 48 xored input slices
+
+        The high and low three input bits of each matrix are decoded into eight slices each, and every output bit is
+        the or of each high decode anded with the or of the low decodes that set that output bit
+
+        Parameters :
+            inputs : [int]
+                The 48 slices of the expanded right half xored with the round key
+            all_lanes : int
+                The slice with every lane set, used for not
+
+        Returns :
+            outputs : [int]
+                The 32 output slices, before the permutation matrix
+        '''
+
+        outputs = []
+        for i in range(0, 8):
+            high = self.decodeThreeBits(inputs[6 * i], inputs[6 * i + 1], inputs[6 * i + 2], all_lanes)
+            low = self.decodeThreeBits(inputs[6 * i + 3], inputs[6 * i + 4], inputs[6 * i + 5], all_lanes)
+            low_ors = {(): 0, (0, 1, 2, 3, 4, 5, 6, 7): all_lanes}
+            for high_circuits in self.substitution_circuits[i]:
+                output = 0
+                for h in range(0, 8):
+                    low_values = high_circuits[h]
+                    low_or = low_ors.get(low_values)
+                    if low_or is None:
+                        low_or = 0
+                        for l in low_values:
+                            low_or |= low[l]
+                        low_ors[low_values] = low_or
+                    output |= high[h] & low_or
+                outputs.append(output)
+        return outputs
+
+    def decodeThreeBits(self, a:int, b:int, c:int, all_lanes:int) -> list[int]:
+        '''
+        This method decodes three input slices into the eight slices which are set where the three bits have each value
+
+        Parameters :
+            a, b, c : int
+                The three input slices, a being the most significant bit
+            all_lanes : int
+                The slice with every lane set, used for not
+
+        Returns :
+            decoded : [int]
+                The eight decoded slices, indexed by the value of the three bits
+        '''
+
+        not_c = c ^ all_lanes
+        pairs = [(a | b) ^ all_lanes, (a | b) ^ a, (a | b) ^ b, a & b]
+        decoded = []
+        for pair in pairs:
+            decoded.append(pair & not_c)
+            decoded.append(pair & c)
+        return decoded
+
+    def cypherMany(self, keys:list[int], blocks:list[int], is_decrypt:bool) -> list[int]:
+        '''
+        This method runs DES on every (key, block) pair at once
+
+        Parameters :
+            keys : [int]
+                The 64 bit keys, either one for each block or a single key used for every block
+            blocks : [int]
+                The 64 bit blocks, a ValueError is raised if any key or block is outside 0 <= value < 2^64
+            is_decrypt : bool
+                Whether the round keys are used in reverse order to decrypt
+
+        Returns :
+            results : [int]
+                The 64 bit result for each pair
+        '''
+
+        lane_count = len(blocks)
+        if lane_count == 0:
+            return []
+        if len(keys) != lane_count and len(keys) != 1:
+            raise ValueError("There must be one key for each block or a single key for every block")
+        for value in (*keys, *blocks):
+            if not 0 <= value < (1 << 64):
+                raise ValueError(f"Every key and block must be a 64 bit value, not {value}")
+        all_lanes = (1 << lane_count) - 1
+        if len(keys) == 1:
+            key_slices = [all_lanes if (keys[0] >> (63 - p)) & 1 else 0 for p in range(0, 64)]
+        else:
+            key_slices = self.toSlices(keys)
+        round_keys = [[key_slices[position] for position in positions] for positions in self.round_key_positions]
+        if is_decrypt:
+            round_keys.reverse()
+
+        block_slices = self.toSlices(blocks)
+        permuted = [block_slices[position - 1] for position in DataEncryptionStandard.initial_permutation_matrix]
+        left_half = permuted[:32]
+        right_half = permuted[32:]
+        expansion_matrix = DataEncryptionStandard.expansion_matrix
+        permutation_matrix = DataEncryptionStandard.permutation_matrix
+        for key_for_round in round_keys:
+            inputs = [right_half[expansion_matrix[i] - 1] ^ key_for_round[i] for i in range(0, 48)]
+            substituted = self.substitute(inputs, all_lanes)
+            new_right_half = [left_half[i] ^ substituted[permutation_matrix[i] - 1] for i in range(0, 32)]
+            left_half = right_half
+            right_half = new_right_half
+
+        final_result = right_half + left_half
+        result_slices = [final_result[position - 1] for position in DataEncryptionStandard.inverse_initial_permutation_matrix]
+        return self.fromSlices(result_slices, lane_count)
+
+    def encryptMany(self, keys:list[int], blocks:list[int]) -> list[int]:
+        '''
+        This method encrypts many independent blocks, each with its own key, in one bitsliced pass
+
+        Parameters :
+            keys : [int]
+                The 64 bit keys, either one for each block or a single key used for every block
+            blocks : [int]
+                The 64 bit blocks to be encrypted
+
+        Returns :
+            encrypted_blocks : [int]
+                The encrypted 64 bit blocks
+        '''
+
+        return self.cypherMany(keys, blocks, False)
+
+    def decryptMany(self, keys:list[int], blocks:list[int]) -> list[int]:
+        '''
+        This method decrypts many independent blocks, each with its own key, in one bitsliced pass
+
+        Parameters :
+            keys : [int]
+                The 64 bit keys, either one for each block or a single key used for every block
+            blocks : [int]
+                The 64 bit blocks to be decrypted
+
+        Returns :
+            decrypted_blocks : [int]
+                The decrypted 64 bit blocks
+        '''
+
+        return self.cypherMany(keys, blocks, True)
+
+@lru_cache(maxsize=1024)
+def cachedRoundKeys(key_bytes:bytes) -> tuple[int, ...]:
+    '''
+    This method gets the DES key schedule for a key, keeping the most recently used schedules so reused keys skip the key schedule
+
+    Parameters :
+        key_bytes : bytes
+            The key as 8 bytes
+
+    Returns :
+        round_keys : (int)
+            The 16 keys for each round of the encryption as 48 bit ints
+    '''
+
+    return DataEncryptionStandard.computeRoundKeys(key_bytes)
+
 if __name__ == '__main__':
 
     key = "key"
@@ -478,3 +921,22 @@ if __name__ == '__main__':
     print(encrypt_data)
     decrypt_data = des.decryptHexMessage(encrypt_data)
     print(decrypt_data)
+
+    # benchmark the bitsliced batch against the scalar path, one key per block with the key schedule included
+    import random
+    import time
+    pair_count = 1024
+    keys = [random.getrandbits(64) for _ in range(pair_count)]
+    blocks = [random.getrandbits(64) for _ in range(pair_count)]
+
+    start_time = time.perf_counter()
+    scalar_results = [DataEncryptionStandard(f"{key:016X}", is_hex_key=True).cypherBlockValue(block, cachedRoundKeys(key.to_bytes(8, "big"))) for key, block in zip(keys, blocks)]
+    scalar_duration = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    bitsliced_results = BitslicedDataEncryptionStandard().encryptMany(keys, blocks)
+    bitsliced_duration = time.perf_counter() - start_time
+
+    assert scalar_results == bitsliced_results
+    print(f"Scalar DES    : {pair_count} (key, block) pairs in {scalar_duration:.3f} seconds, {pair_count / scalar_duration:.0f} blocks per second")
+    print(f"Bitsliced DES : {pair_count} (key, block) pairs in {bitsliced_duration:.3f} seconds, {pair_count / bitsliced_duration:.0f} blocks per second")
@@ -1,5 +1,6 @@
 from CryptographySchemes.SymmetricEncryptionAlgorithms.DataEncryptionStandard import DataEncryptionStandard
 from HelperFunctions.IntegerHandler import *
+from HelperFunctions.ChunkedStreams import processStream
 class TripleDataEncryptionStandard():
     '''
 	This class holds the necessary methods for a basic implementation of 3DES
@@ -57,11 +58,70 @@ class TripleDataEncryptionStandard():
                 The encrypted message as a hex string
         '''
 
-        first_encrypted = self.des_1.encryptHexMessage(hex_string)
-        second_encrypted = self.des_2.decryptHexMessage(first_encrypted)
-        final_encrypted_hex = self.des_3.encryptHexMessage(second_encrypted)
-
+        final_encrypted_hex = ""
+        for i in range(0, len(hex_string), 16):
+            final_encrypted_hex += "{:016X}".format(self.encryptBlockValue(int(hex_string[i:i+16], 16)))
         return final_encrypted_hex
+
+    def encryptBlockValue(self, block:int) -> int:
+        '''
+        This method encrypts a single 64 bit block with three rounds of des (encrypt, then decrypt, then encrypt) in one pass
+
+        The final permutation of each des and the initial permutation of the next cancel out,
+        so the 48 rounds run on one int with only the outer initial and final permutations
+
+        Parameters :
+            block : int
+                The 64 bit block to be encrypted
+
+        Returns :
+            encrypted_block : int
+                The encrypted 64 bit block
+        '''
+
+        return self.cypherBlockValue(block, (self.des_1.round_keys, self.des_2.inverse_round_keys, self.des_3.round_keys))
+
+    def decryptBlockValue(self, block:int) -> int:
+        '''
+        This method decrypts a single 64 bit block with three rounds of des (decrypt, then encrypt, then decrypt) in one pass
+
+        Parameters :
+            block : int
+                The 64 bit block to be decrypted
+
+        Returns :
+            decrypted_block : int
+                The decrypted 64 bit block
+        '''
+
+        return self.cypherBlockValue(block, (self.des_3.inverse_round_keys, self.des_2.round_keys, self.des_1.inverse_round_keys))
+
+    def cypherBlockValue(self, block:int, round_key_stages:tuple) -> int:
+        '''
+        This method runs the rounds for each of the three des stages on a 64 bit int, swapping the halves between stages
+        the same way each des swaps them before its final permutation
+
+        Parameters :
+            block : int
+                The 64 bit block
+            round_key_stages : ((int))
+                The round keys for each of the three stages, in the order they are used
+
+        Returns :
+            result : int
+                The 64 bit result
+        '''
+
+        des = self.des_1
+        permuted = des.permuteBlockValue(block, des.initial_permutation_tables)
+        left_half = permuted >> 32
+        right_half = permuted & 0xFFFFFFFF
+        feistel_function = des.feistelFunction
+        for round_keys in round_key_stages:
+            for key_for_round in round_keys:
+                left_half, right_half = right_half, left_half ^ feistel_function(right_half, key_for_round)
+            left_half, right_half = right_half, left_half
+        return des.permuteBlockValue((left_half << 32) | right_half, des.final_permutation_tables)
     
     def decrypt(self, encrypted_decrypted_encrypted:str) -> str:
         '''
@@ -93,9 +153,9 @@ class TripleDataEncryptionStandard():
                 The message to be encrypted
         '''
 
-        second_encrypted = self.des_3.decryptHexMessage(encrypted_hex)
-        first_encrypted = self.des_2.encryptHexMessage(second_encrypted)
-        hex_string = self.des_1.decryptHexMessage(first_encrypted)
+        hex_string = ""
+        for i in range(0, len(encrypted_hex) // 16 * 16, 16):
+            hex_string += "{:016X}".format(self.decryptBlockValue(int(encrypted_hex[i:i+16], 16)))
         return hex_string
     
 class TDES_ECB():
@@ -184,6 +244,87 @@ class TDES_ECB():
         decrypted_hex = self.decryptHexString(encrypted_hex)
         return IntegerHandler.fromHexString(decrypted_hex,False,len(decrypted_hex)*4).getString()
 
+    def encryptStream(self, source, destination, chunk_size:int = 65536) -> int:
+        '''
+        This method encrypts a binary stream, such as an open file, one chunk at a time
+
+        The chunks are read into a reusable buffer and only the final chunk is padded
+
+        Parameters :
+            source : binary stream
+                The stream of plain text, which must support readinto
+            destination : binary stream
+                The stream the cypher text is written to
+            chunk_size : int, optional
+                The number of bytes to process at a time, defaults to 65536
+
+        Returns :
+            length : int
+                The number of bytes written
+        '''
+
+        return processStream(source, destination, chunk_size, 8, lambda chunk, state : self.streamChunk(chunk, state, False), None)
+
+    def decryptStream(self, source, destination, chunk_size:int = 65536) -> int:
+        '''
+        This method decrypts a binary stream one chunk at a time
+
+        Parameters :
+            source : binary stream
+                The stream of cypher text, which must support readinto
+            destination : binary stream
+                The stream the plain text is written to
+            chunk_size : int, optional
+                The number of bytes to process at a time, defaults to 65536
+
+        Returns :
+            length : int
+                The number of bytes written
+        '''
+
+        return processStream(source, destination, chunk_size, 8, lambda chunk, state : self.streamChunk(chunk, state, True), None)
+
+    def streamChunk(self, chunk:memoryview, state, is_decrypt:bool) -> tuple[bytes, None]:
+        '''
+        This method encrypts or decrypts one chunk of a stream, there is no state to carry between chunks in ECB mode
+
+        Parameters :
+            chunk : memoryview
+                The chunk of the stream
+            state : None
+                The chaining state, which is unused
+            is_decrypt : bool
+                Whether the chunk is being decrypted
+
+        Returns :
+            result : bytes
+                The result for the chunk
+            state : None
+                The chaining state for the next chunk
+        '''
+
+        hex_chunk = self.padBytes(chunk).hex().upper()
+        if is_decrypt:
+            return bytes.fromhex(self.decryptHexString(hex_chunk)), state
+        return bytes.fromhex(self.encryptHexString(hex_chunk)), state
+
+    def padBytes(self, data:bytes) -> bytes:
+        '''
+        This method pads bytes with zero bytes up to a multiple of the 64 bit block size
+
+        Parameters :
+            data : bytes
+                The bytes to be padded
+
+        Returns :
+            padded_data : bytes
+                The bytes padded to a whole number of blocks
+        '''
+
+        if len(data) % 8 != 0:
+            data = bytes(data) + bytes(8 - len(data) % 8)
+        return data
+
 class TDES_CBC(TDES_ECB):
     '''
     This class implements the Cipher Block Chaining (CBC) Mode for Triple Data Encryption Standard (TDES)
@@ -208,18 +349,15 @@ class TDES_CBC(TDES_ECB):
         '''
 
         if len(hex_message) % 16 != 0:
-            hex_message = hex_message + "0" * (16 - (hex_message % 16))
+            hex_message = hex_message + "0" * (16 - (len(hex_message) % 16))
 
         number_of_blocks = len(hex_message) // 16
-        current_to_xor = initialization_vector
+        encrypt_block_value = self.tdes.encryptBlockValue
+        current_to_xor = int(initialization_vector.replace(" ",""), 16)
         encrypted_hex = ""
         for i in range(0, number_of_blocks):
-            hex_segment = hex_message[i * 16 : i * 16 + 16]
-            xor_result = self.xorHexString(current_to_xor, hex_segment)
-            cipher_text = self.tdes.encryptHex(xor_result)
-            encrypted_hex += cipher_text
-            current_to_xor = cipher_text
-            # print(f"hex:{hex_segment}, xord:{xor_result}, cipher:{cipher_text}")
+            current_to_xor = encrypt_block_value(current_to_xor ^ int(hex_message[i * 16 : i * 16 + 16], 16))
+            encrypted_hex += "{:016X}".format(current_to_xor)
 
         return encrypted_hex
     
@@ -255,14 +393,13 @@ class TDES_CBC(TDES_ECB):
         '''
 
         number_of_blocks = len(hex_encrypted) // 16
-        current_to_xor = initialization_vector
+        decrypt_block_value = self.tdes.decryptBlockValue
+        current_to_xor = int(initialization_vector.replace(" ",""), 16)
         unencrypted_hex = ""
         for i in range(0, number_of_blocks):
-            hex_segment = hex_encrypted[i * 16 : i * 16 +16]
-            post_cypher = self.tdes.decryptHex(hex_segment)
-            post_xor =self.xorHexString(current_to_xor,post_cypher)
-            current_to_xor = hex_segment
-            unencrypted_hex += post_xor
+            encrypted_block = int(hex_encrypted[i * 16 : i * 16 + 16], 16)
+            unencrypted_hex += "{:016X}".format(decrypt_block_value(encrypted_block) ^ current_to_xor)
+            current_to_xor = encrypted_block
         return unencrypted_hex
     
     def encryptString(self, string_message:str, initialization_vector:str) -> str:
@@ -301,6 +438,77 @@ class TDES_CBC(TDES_ECB):
         decrypted_hex = self.decryptHexString(encrypted_hex, initialization_vector)
         return IntegerHandler.fromHexString(decrypted_hex,False,len(decrypted_hex)*4).getString()
     
+    def encryptStream(self, source, destination, initialization_vector:str, chunk_size:int = 65536) -> int:
+        '''
+        This method encrypts a binary stream, such as an open file, one chunk at a time
+
+        The chunks are read into a reusable buffer, the chaining state is carried from one chunk to the next
+        and only the final chunk is padded
+
+        Parameters :
+            source : binary stream
+                The stream of plain text, which must support readinto
+            destination : binary stream
+                The stream the cypher text is written to
+            initialization_vector : str
+                The initialization vector as a hex string
+            chunk_size : int, optional
+                The number of bytes to process at a time, defaults to 65536
+
+        Returns :
+            length : int
+                The number of bytes written
+        '''
+
+        return processStream(source, destination, chunk_size, 8, lambda chunk, state : self.streamChunk(chunk, state, False), initialization_vector)
+
+    def decryptStream(self, source, destination, initialization_vector:str, chunk_size:int = 65536) -> int:
+        '''
+        This method decrypts a binary stream one chunk at a time, carrying the chaining state from one chunk to the next
+
+        Parameters :
+            source : binary stream
+                The stream of cypher text, which must support readinto
+            destination : binary stream
+                The stream the plain text is written to
+            initialization_vector : str
+                The initialization vector as a hex string
+            chunk_size : int, optional
+                The number of bytes to process at a time, defaults to 65536
+
+        Returns :
+            length : int
+                The number of bytes written
+        '''
+
+        return processStream(source, destination, chunk_size, 8, lambda chunk, state : self.streamChunk(chunk, state, True), initialization_vector)
+
+    def streamChunk(self, chunk:memoryview, initialization_vector:str, is_decrypt:bool) -> tuple[bytes, str]:
+        '''
+        This method encrypts or decrypts one chunk of a stream in Cipher Block Chaining (CBC) mode,
+        the last cypher text block becomes the initialization vector for the next chunk
+
+        Parameters :
+            chunk : memoryview
+                The chunk of the stream
+            initialization_vector : str
+                The initialization vector for the chunk as a hex string
+            is_decrypt : bool
+                Whether the chunk is being decrypted
+
+        Returns :
+            result : bytes
+                The result for the chunk
+            initialization_vector : str
+                The initialization vector for the next chunk as a hex string
+        '''
+
+        hex_chunk = self.padBytes(chunk).hex().upper()
+        if is_decrypt:
+            return bytes.fromhex(self.decryptHexString(hex_chunk, initialization_vector)), hex_chunk[-16:]
+        encrypted_hex = self.encryptHexString(hex_chunk, initialization_vector)
+        return bytes.fromhex(encrypted_hex), encrypted_hex[-16:]
+
 class TDES_CFB(TDES_CBC):
     '''
     This class implements the Cipher Feedback (CFB) Mode for TDES
@@ -341,26 +549,45 @@ class TDES_CFB(TDES_CBC):
             encrypted_hex : str
                 The result of the encryption as a list of hex strings
         '''
+        return self.cfbHexString(hex_string, initialization_vector, False)
+
+    def cfbHexString(self, hex_string:str, initialization_vector:str, is_decrypt:bool) -> str:
+        '''
+        This method runs the Cipher Feedback (CFB) shift register over a hex string, keeping the input block as a 64 bit int
+
+        Parameters :
+            hex_string : str
+                The content to be encrypted or decrypted as a hex string
+            initialization_vector : str
+                The initializtion vector as a hex string
+            is_decrypt : bool
+                Whether the content is cypher text, in which case the input segments are fed back instead of the output segments
+
+        Returns :
+            result_hex : str
+                The result of the encryption or decryption as a hex string
+        '''
+
         number_of_message_blocks = len(hex_string) // 16
         b = 64
         s = self.s
-        rotations_per_segment = b // s        
-        result_string = ""
-        I = initialization_vector
+        rotations_per_segment = b // s
+        segment_mask = (1 << s) - 1
+        encrypt_block_value = self.tdes.encryptBlockValue
+        result_hex = ""
+        I = int(initialization_vector.replace(" ",""), 16)
         for i in range (0, number_of_message_blocks):
-            message_chunk = IntegerHandler.fromHexString(hex_string[i*16:i*16+16],False,b)
-            encrypted_message = IntegerHandler(0,False,0)
+            message_chunk = int(hex_string[i * 16 : i * 16 + 16], 16)
+            result_chunk = 0
             for j in range (0, rotations_per_segment):
-                O = self.tdes.encryptHex(I)
-                # result_list.append(O)
-                most_sig_O = IntegerHandler.fromHexString(O,False,b).getMostSignificantBits(s)
-                P = IntegerHandler.fromBitArray(message_chunk.getBitArray()[j*s:j*s+s],False,s)
-                C = bitwiseXor([P,most_sig_O],False,s)
-                encrypted_message = concatenate([encrypted_message,C],False)
-                lsb = IntegerHandler.fromHexString(I,False,64).getLeastSignificantBits(b-s)
-                I = concatenate([lsb,C],False).getHexString()
-            result_string += encrypted_message.getHexString()
-        return result_string
+                O = encrypt_block_value(I) >> (b - s)
+                segment = (message_chunk >> (b - s * (j + 1))) & segment_mask
+                result_segment = segment ^ O
+                result_chunk = (result_chunk << s) | result_segment
+                feedback = segment if is_decrypt else result_segment
+                I = ((I << s) | feedback) & 0xFFFFFFFFFFFFFFFF
+            result_hex += "{:016X}".format(result_chunk)
+        return result_hex
     
     def decryptHexString(self, encrypted_hex:str, initialization_vector:str) -> list[str]:
         '''
@@ -380,26 +607,37 @@ class TDES_CFB(TDES_CBC):
                 The message that was encrypted using TDES
         '''
 
-        b = 64
-        s = self.s
-        rotations_per_segment = b // s    
-        number_of_message_blocks = len(encrypted_hex) // 16
-        result_hex = ""
-        I = initialization_vector
-        for i in range (0, number_of_message_blocks):
-            message_chunk = IntegerHandler(0, False, 0)
-            encrypted_chunk = IntegerHandler.fromHexString(encrypted_hex[i * 16 : i * 16 + 16], False, b)
-            for j in range (0, rotations_per_segment):
-                O = self.tdes.encryptHex(I)
-                most_sig_O = IntegerHandler.fromHexString(O,False,b).getMostSignificantBits(s)
-                C = IntegerHandler.fromBitArray(encrypted_chunk.getBitArray()[j * s : j * s + s], False, s)
-                P = bitwiseXor([C, most_sig_O], False, s)
-                message_chunk = concatenate([message_chunk,P],False)
-                lsb = IntegerHandler.fromHexString(I, False, 64).getLeastSignificantBits(b - s)
-                I = concatenate([lsb, C], False).getHexString()
-            result_hex += message_chunk.getHexString()
-        return result_hex
+        return self.cfbHexString(encrypted_hex, initialization_vector, True)
     
+    def streamChunk(self, chunk:memoryview, initialization_vector:str, is_decrypt:bool) -> tuple[bytes, str]:
+        '''
+        This method encrypts or decrypts one chunk of a stream in Cipher Feedback (CFB) mode
+
+        Every chunk but the last is a whole number of blocks, so after it the shift register holds the last cypher text block,
+        and a partial final block is padded and its result cut back to the length of the chunk
+
+        Parameters :
+            chunk : memoryview
+                The chunk of the stream
+            initialization_vector : str
+                The input block for the chunk as a hex string
+            is_decrypt : bool
+                Whether the chunk is being decrypted
+
+        Returns :
+            result : bytes
+                The result for the chunk
+            initialization_vector : str
+                The input block for the next chunk as a hex string
+        '''
+
+        hex_chunk = self.padBytes(chunk).hex().upper()
+        if is_decrypt:
+            result_hex = self.decryptHexString(hex_chunk, initialization_vector)
+            return bytes.fromhex(result_hex)[:len(chunk)], hex_chunk[-16:]
+        result_hex = self.encryptHexString(hex_chunk, initialization_vector)
+        return bytes.fromhex(result_hex)[:len(chunk)], result_hex[-16:]
+
 class TDES_OFB(TDES_CBC):
     '''
     This class implements the Output Feedback (OFB) Mode for TDES
@@ -426,14 +664,12 @@ class TDES_OFB(TDES_CBC):
                 The result of the encryption as a list of hex strings
         '''
         number_of_message_blocks = len(hex_string) // 16
+        encrypt_block_value = self.tdes.encryptBlockValue
         encrypted_hex = ""
-        I = initialization_vector
+        O = int(initialization_vector.replace(" ",""), 16)
         for i in range (0, number_of_message_blocks):
-            hex_segment = hex_string[i * 16 : i * 16 + 16]
-            O = self.tdes.encryptHex(I)
-            C = self.xorHexString(hex_segment, O)
-            encrypted_hex += C
-            I = O
+            O = encrypt_block_value(O)
+            encrypted_hex += "{:016X}".format(int(hex_string[i * 16 : i * 16 + 16], 16) ^ O)
         return encrypted_hex
     
     def decryptHexString(self, encrypted_hex:str, initialization_vector:str) -> list[str]:
@@ -455,17 +691,32 @@ class TDES_OFB(TDES_CBC):
             
         '''
 
-        number_of_message_blocks = len(encrypted_hex) // 16
-        decrypted_hex = ""
-        I = initialization_vector
-        for i in range (0, number_of_message_blocks):
-            hex_segment = encrypted_hex[i * 16 : i * 16 + 16]
-            O = self.tdes.encryptHex(I)
-            P = self.xorHexString(hex_segment, O)
-            decrypted_hex += P
-            I = O
-        return decrypted_hex
+        return self.encryptHexString(encrypted_hex, initialization_vector)
     
+    def streamChunk(self, chunk:memoryview, initialization_vector:str, is_decrypt:bool) -> tuple[bytes, str]:
+        '''
+        This method encrypts or decrypts one chunk of a stream in Output Feedback (OFB) mode,
+        the last output block, recovered by xoring the last input and result blocks, is the input block for the next chunk
+
+        Parameters :
+            chunk : memoryview
+                The chunk of the stream
+            initialization_vector : str
+                The input block for the chunk as a hex string
+            is_decrypt : bool
+                Whether the chunk is being decrypted, which is the same as encrypting in OFB mode
+
+        Returns :
+            result : bytes
+                The result for the chunk
+            initialization_vector : str
+                The input block for the next chunk as a hex string
+        '''
+
+        hex_chunk = self.padBytes(chunk).hex().upper()
+        result_hex = self.encryptHexString(hex_chunk, initialization_vector)
+        return bytes.fromhex(result_hex)[:len(chunk)], self.xorHexString(hex_chunk[-16:], result_hex[-16:])
+
 class TDES_CTR(TDES_CBC):
     '''
     This class implements the Counter (CTR) Mode for TDES
@@ -492,14 +743,12 @@ class TDES_CTR(TDES_CBC):
                 The result of the encryption as a list of hex strings
         '''
         number_of_message_blocks = len(hex_string) // 16
+        encrypt_block_value = self.tdes.encryptBlockValue
         encrypted_hex = ""
-        T = IntegerHandler.fromHexString(initialization_vector,False,64)
+        T = int(initialization_vector.replace(" ",""), 16)
         for i in range (0, number_of_message_blocks):
-            hex_segment = hex_string[i * 16 : i * 16 + 16]
-            O = self.tdes.encryptHex(T.getHexString())
-            C = self.xorHexString(hex_segment,O)
-            encrypted_hex += C
-            T.setValue(T.getValue()+1)
+            encrypted_hex += "{:016X}".format(int(hex_string[i * 16 : i * 16 + 16], 16) ^ encrypt_block_value(T))
+            T = (T + 1) & 0xFFFFFFFFFFFFFFFF
         return encrypted_hex
     
     def decryptHexString(self, encrypted_hex:str, initialization_vector:str) -> list[str]:
@@ -520,16 +769,32 @@ class TDES_CTR(TDES_CBC):
                 The message that was encrypted using TDES
             
         '''
-        number_of_message_blocks = len(encrypted_hex) // 16
-        decrypted_hex = ""        
-        T = IntegerHandler.fromHexString(initialization_vector, False, 64)
-        for i in range (0, number_of_message_blocks):
-            hex_segment = encrypted_hex[i * 16 : i * 16 + 16]
-            O = self.tdes.encryptHex(T.getHexString())
-            P = self.xorHexString(hex_segment, O)
-            decrypted_hex += P
-            T.setValue(T.getValue()+1)
-        return decrypted_hex
+        return self.encryptHexString(encrypted_hex, initialization_vector)
+    
+    def streamChunk(self, chunk:memoryview, initialization_vector:str, is_decrypt:bool) -> tuple[bytes, str]:
+        '''
+        This method encrypts or decrypts one chunk of a stream in Counter (CTR) mode,
+        the counter block is advanced by the number of blocks in the chunk
+
+        Parameters :
+            chunk : memoryview
+                The chunk of the stream
+            initialization_vector : str
+                The counter block for the first block of the chunk as a hex string
+            is_decrypt : bool
+                Whether the chunk is being decrypted, which is the same as encrypting in CTR mode
+
+        Returns :
+            result : bytes
+                The result for the chunk
+            initialization_vector : str
+                The counter block for the next chunk as a hex string
+        '''
+
+        hex_chunk = self.padBytes(chunk).hex().upper()
+        result_hex = self.encryptHexString(hex_chunk, initialization_vector)
+        next_counter = (int(initialization_vector, 16) + len(hex_chunk) // 16) & 0xFFFFFFFFFFFFFFFF
+        return bytes.fromhex(result_hex)[:len(chunk)], "{:016X}".format(next_counter)
     
 if __name__ == '__main__':
 
@@ -538,6 +538,239 @@ class AES_GCM_UnitTest(unittest.TestCase):
         # verify that the test's results are as expected
         self.verify_test_results(plain_text, expected_tag, expected_cypher, cypher_text, tag, authenticated, unencrypted_text)
 
+    def test_019_ghash_tables(self):
+        '''
+        This method tests that multiplying by the hash subkey with the 4 bit and 8 bit tables 
+        gives the same result as the textbook block multiplication
+        '''
+
+        key = "feffe9928665731c6d6a8f9467308308".upper()
+        test_values = [0, 1, 0x80000000000000000000000000000000, 0x0388DACE60B6A392F328C2B971B2FE78, (1 << 128) - 1]
+        for table_bits in [4, 8]:
+            aes_128_gcm = AES_GCM_128(key, table_bits=table_bits)
+            hash_block = GCM_Block(aes_128_gcm.hash_subkey)
+            print(f"Testing GHASH tables with {table_bits} bits, H : {hash_block.getHexString()}")
+            for value in test_values:
+                expected_result = GCM_Block(value).blockMultiplication(hash_block).getValue()
+                table_result = aes_128_gcm.multiplyByHashSubkey(value)
+                print(f"X : {value:032X} Expected : {expected_result:032X} Table : {table_result:032X}")
+                self.assertEqual(table_result, expected_result)
+        for table_bits in [0, 2, 16]:
+            with self.assertRaises(ValueError):
+                AES_GCM_128(key, table_bits=table_bits)
+
+    def test_020_4bit_tables(self):
+        '''
+        This method tests AES GCM using the smaller 4 bit GHASH tables
+
+        Test Case 4 from "The Galois/Counter Mode of Operation (GCM)" : Appendix B "AES Test Vectors"
+        https://csrc.nist.rip/groups/ST/toolkit/BCM/documents/proposedmodes/gcm/gcm-spec.pdf
+        '''
+
+        # load test data
+        key = "feffe9928665731c6d6a8f9467308308".upper()
+        initialization_vector = "cafebabefacedbaddecaf888".upper()
+        plain_text = "d9313225f88406e5a55909c5aff5269a86a7a9531534f7da2e4c303d8a318a721c3c0c95956809532fcf0e2449a6b525b16aedf5aa0de657ba637b39".upper()
+        expected_tag = "5bc94fbc3221a5db94fae95ae7121a47".upper()
+        expected_cypher = "42831ec2217774244b7221b784d0d49ce3aa212f2c02a4e035c17e2329aca12e21d514b25466931c7d8f6a5aac84aa051ba30b396a0aac973d58e091".upper()
+        additional_data="feedfacedeadbeeffeedfacedeadbeefabaddad2".upper()
+        tag_length = 128
+
+        # run the aes 128 gcm on the test data
+        aes_128_gcm = AES_GCM_128(key, table_bits=4)
+        cypher_text, tag = aes_128_gcm.authenticatedEncryption(initialization_vector,plain_text,additional_data,tag_length)
+        authenticated, unencrypted_text = aes_128_gcm.authenticatedDecryption(initialization_vector,cypher_text,additional_data,tag)
+        if authenticated:   
+            unencrypted_text = unencrypted_text.getHexString()
+
+        # output the test results
+        self.print_test_results(20, "AES 128", "With 4 Bit GHASH Tables", key, initialization_vector, additional_data, plain_text, cypher_text, tag, authenticated, unencrypted_text)
+
+        # verify that the test's results are as expected
+        self.verify_test_results(plain_text, expected_tag, expected_cypher, cypher_text, tag, authenticated, unencrypted_text)
+
+    def test_021_gctr_counter(self):
+        '''
+        This method tests that the GCTR counter only increments the least significant 32 bits 
+        and that the byte GCTR matches encrypting each counter block
+        '''
+
+        key = "feffe9928665731c6d6a8f9467308308".upper()
+        aes_128_gcm = AES_GCM_128(key)
+        counter = 0xCAFEBABEFACEDBADDECAF888FFFFFFFF
+        expected_counter = "CAFEBABEFACEDBADDECAF88800000000"
+        incremented = GCM_Block(counter).inc(32).getHexString()
+        print(f"Counter : {counter:032X} Incremented : {incremented} Expected : {expected_counter}")
+        self.assertEqual(incremented, expected_counter)
+
+        data = bytes(range(0, 40))
+        expected_result = ""
+        counter_block = GCM_Block(counter)
+        for i in range(0, 3):
+            keystream = int(aes_128_gcm.cypher(counter_block.getHexString()), 16)
+            expected_result += f"{int.from_bytes(data[16*i:16*i+16].ljust(16, bytes(1)), 'big') ^ keystream:032X}"
+            counter_block = counter_block.inc(32)
+        expected_result = expected_result[:len(data)*2]
+        result = aes_128_gcm.gctrBytes(counter, data).hex().upper()
+        print(f"Expected : {expected_result}")
+        print(f"GCTR     : {result}")
+        self.assertEqual(result, expected_result)
+
+    def test_022_streaming_context(self):
+        '''
+        This method tests the streaming AES GCM context, feeding the data in uneven chunks
+
+        Test Case 4 from "The Galois/Counter Mode of Operation (GCM)" : Appendix B "AES Test Vectors"
+        https://csrc.nist.rip/groups/ST/toolkit/BCM/documents/proposedmodes/gcm/gcm-spec.pdf
+        '''
+
+        key = "feffe9928665731c6d6a8f9467308308".upper()
+        initialization_vector = bytes.fromhex("cafebabefacedbaddecaf888")
+        plain_text = bytes.fromhex("d9313225f88406e5a55909c5aff5269a86a7a9531534f7da2e4c303d8a318a721c3c0c95956809532fcf0e2449a6b525b16aedf5aa0de657ba637b39")
+        expected_tag = "5bc94fbc3221a5db94fae95ae7121a47".upper()
+        expected_cypher = "42831ec2217774244b7221b784d0d49ce3aa212f2c02a4e035c17e2329aca12e21d514b25466931c7d8f6a5aac84aa051ba30b396a0aac973d58e091".upper()
+        additional_data = bytes.fromhex("feedfacedeadbeeffeedfacedeadbeefabaddad2")
+
+        aes_128_gcm = AES_GCM_128(key)
+        encryptor = aes_128_gcm.createContext(initialization_vector)
+        encryptor.updateAad(additional_data[:7])
+        encryptor.updateAad(additional_data[7:])
+        cypher_text = encryptor.update(plain_text[:5]) + encryptor.update(plain_text[5:37]) + encryptor.update(plain_text[37:])
+        tag = encryptor.finalize()
+
+        decryptor = aes_128_gcm.createContext(initialization_vector, is_decrypt=True)
+        decryptor.updateAad(additional_data)
+        unencrypted_text = decryptor.update(cypher_text[:20]) + decryptor.update(cypher_text[20:])
+        authenticated = decryptor.verify(tag)
+
+        print("Testing Streaming AES 128 Galois/Counter Mode Context")
+        print(f"Tag            : {tag.hex().upper()}")
+        print(f"Encrypted Text : {cypher_text.hex().upper()}")
+        print(f"Authenticate   : {authenticated}")
+        print(f"Decrypted Text : {unencrypted_text.hex().upper()}")
+        self.assertEqual(cypher_text.hex().upper(), expected_cypher)
+        self.assertEqual(tag.hex().upper(), expected_tag)
+        self.assertTrue(authenticated)
+        self.assertEqual(unencrypted_text, plain_text)
+        self.assertFalse(aes_128_gcm.createContext(initialization_vector, is_decrypt=True).verify(tag))
+        self.assertFalse(decryptor.verify(b""))
+        self.assertFalse(decryptor.verify(tag[:12]))
+        with self.assertRaises(ValueError):
+            decryptor.update(cypher_text)
+        with self.assertRaises(ValueError):
+            encryptor.updateAad(additional_data)
+
+        truncated_encryptor = aes_128_gcm.createContext(initialization_vector, tag_length=96)
+        truncated_encryptor.updateAad(additional_data)
+        truncated_encryptor.update(plain_text)
+        truncated_tag = truncated_encryptor.finalize()
+        truncated_decryptor = aes_128_gcm.createContext(initialization_vector, is_decrypt=True, tag_length=96)
+        truncated_decryptor.updateAad(additional_data)
+        truncated_decryptor.update(cypher_text)
+        self.assertEqual(truncated_tag, tag[:12])
+        self.assertTrue(truncated_decryptor.verify(truncated_tag))
+        self.assertFalse(truncated_decryptor.verify(tag))
+        with self.assertRaises(ValueError):
+            aes_128_gcm.createContext(initialization_vector, tag_length=8)
+
+    def test_023_parallel_encryption(self):
+        '''
+        This method tests that the parallel AES GCM encryption gives the same cypher text and tag as the serial encryption
+        when the plain text is split into several ranges, including a final partial block
+        '''
+
+        key = "feffe9928665731c6d6a8f9467308308feffe9928665731c6d6a8f9467308308".upper()
+        initialization_vector = bytes.fromhex("cafebabefacedbaddecaf888")
+        plain_text = bytes(range(0, 256)) * 2 + bytes(range(0, 27))
+        additional_data = bytes.fromhex("feedfacedeadbeeffeedfacedeadbeefabaddad2")
+
+        aes_256_gcm = AES_GCM_256(key)
+        expected_cypher, expected_tag = aes_256_gcm.authenticatedEncryption(initialization_vector.hex().upper(), plain_text.hex().upper(), additional_data.hex().upper(), 128)
+        cypher_text, tag = aes_256_gcm.parallelAuthenticatedEncryption(initialization_vector, plain_text, additional_data, max_workers=2, chunk_size=96)
+
+        print("Testing Parallel AES 256 Galois/Counter Mode Encryption")
+        print(f"Expected Tag   : {expected_tag.getHexString()}")
+        print(f"Tag            : {tag.hex().upper()}")
+        self.assertEqual(cypher_text.hex().upper(), expected_cypher.getHexString())
+        self.assertEqual(tag.hex().upper(), expected_tag.getHexString())
+        for tag_length in [0, 20, 200]:
+            with self.assertRaises(ValueError):
+                aes_256_gcm.parallelAuthenticatedEncryption(initialization_vector, plain_text, additional_data, tag_length=tag_length)
+
+    def test_024_open_many(self):
+        '''
+        This method tests opening a batch of records where some have been tampered with,
+        checking that the tampered records are rejected and counted
+
+        Test Case 4 from "The Galois/Counter Mode of Operation (GCM)" : Appendix B "AES Test Vectors"
+        https://csrc.nist.rip/groups/ST/toolkit/BCM/documents/proposedmodes/gcm/gcm-spec.pdf
+        '''
+
+        key = "feffe9928665731c6d6a8f9467308308".upper()
+        initialization_vector = bytes.fromhex("cafebabefacedbaddecaf888")
+        plain_text = bytes.fromhex("d9313225f88406e5a55909c5aff5269a86a7a9531534f7da2e4c303d8a318a721c3c0c95956809532fcf0e2449a6b525b16aedf5aa0de657ba637b39")
+        cypher_text = bytes.fromhex("42831ec2217774244b7221b784d0d49ce3aa212f2c02a4e035c17e2329aca12e21d514b25466931c7d8f6a5aac84aa051ba30b396a0aac973d58e091")
+        tag = bytes.fromhex("5bc94fbc3221a5db94fae95ae7121a47")
+        additional_data = bytes.fromhex("feedfacedeadbeeffeedfacedeadbeefabaddad2")
+        tampered_cypher_text = bytes([cypher_text[0] ^ 1]) + cypher_text[1:]
+        tampered_tag = tag[:-1] + bytes([tag[-1] ^ 0x80])
+
+        records = [(initialization_vector, cypher_text, additional_data, tag),
+                   (initialization_vector, tampered_cypher_text, additional_data, tag),
+                   (initialization_vector, cypher_text, additional_data, tampered_tag),
+                   (initialization_vector, cypher_text, additional_data[1:], tag),
+                   (initialization_vector, cypher_text, additional_data, tag[:12]),
+                   (initialization_vector, cypher_text, additional_data, b"")]
+        aes_128_gcm = AES_GCM_128(key)
+        plain_texts, accepted_count, rejected_count = aes_128_gcm.openMany(records)
+
+        print("Testing Opening A Batch Of AES 128 Galois/Counter Mode Records")
+        print(f"Accepted : {accepted_count} Rejected : {rejected_count}")
+        self.assertEqual(accepted_count, 1)
+        self.assertEqual(rejected_count, 5)
+        self.assertListEqual(plain_texts, [plain_text, None, None, None, None, None])
+
+        plain_texts, accepted_count, rejected_count = aes_128_gcm.openMany(records, tag_length=96)
+        print(f"Accepted With 96 Bit Tags : {accepted_count} Rejected : {rejected_count}")
+        self.assertEqual(accepted_count, 1)
+        self.assertListEqual(plain_texts, [None, None, None, None, plain_text, None])
+
+    def test_025_seal_many(self):
+        '''
+        This method tests sealing a batch of records, comparing each record with a single authenticated encryption
+        and then opening the sealed batch
+        '''
+
+        key = "feffe9928665731c6d6a8f9467308308".upper()
+        aes_128_gcm = AES_GCM_128(key)
+        records = [(bytes.fromhex("cafebabefacedbaddecaf888"), bytes(range(0, 60)), bytes.fromhex("feedfacedeadbeef")),
+                   (bytes.fromhex("cafebabefacedbad"), bytes(range(60, 160)), b""),
+                   (bytes.fromhex("000000000000000000000000"), b"", bytes(range(0, 20)))]
+        sealed, offsets = aes_128_gcm.sealMany(records)
+        print("Testing Sealing A Batch Of AES 128 Galois/Counter Mode Records")
+        print(f"Statistics : {aes_128_gcm.batch_statistics}")
+        self.assertEqual(aes_128_gcm.batch_statistics["records"], 3)
+
+        start = 0
+        opened_records = []
+        for i in range(0, len(records)):
+            initialization_vector, plain_text, additional_data = records[i]
+            expected_cypher, expected_tag = aes_128_gcm.parallelAuthenticatedEncryption(initialization_vector, plain_text, additional_data)
+            record = bytes(sealed[start:offsets[i]])
+            print(f"Record {i} : {record.hex().upper()}")
+            self.assertEqual(record, expected_cypher + expected_tag)
+            opened_records.append((initialization_vector, record[:-16], additional_data, record[-16:]))
+            start = offsets[i]
+
+        plain_texts, accepted_count, rejected_count = aes_128_gcm.openMany(opened_records)
+        self.assertEqual(accepted_count, 3)
+        self.assertEqual(rejected_count, 0)
+        self.assertListEqual(plain_texts, [record[1] for record in records])
+
+        for tag_length in [0, 20, 200]:
+            with self.assertRaises(ValueError):
+                aes_128_gcm.sealMany(records, tag_length)
+
     def verify_test_results(self, plain_text, expected_tag, expected_cypher, cypher_text:GCM_Block, tag:GCM_Block, authenticated, unencrypted_text):
         self.assertEqual(cypher_text.getHexString(), expected_cypher)
         self.assertEqual(tag.getHexString(), expected_tag)
@@ -555,6 +788,33 @@ class AES_GCM_UnitTest(unittest.TestCase):
         print(f"Authenticate   : {"Tag successfully authenticated" if authenticated else "Tag failed authentication"}")
         print(f"Decrypted Text : {unencrypted_text}")
 
+    def test_026_truncated_tag_rejected(self):
+        '''
+        This method tests that decrypting bytes rejects tags which are not exactly the expected tag length,
+        so a truncated tag cannot be used to guess a forgery
+
+        Test Case 4 from "The Galois/Counter Mode of Operation (GCM)" : Appendix B "AES Test Vectors"
+        https://csrc.nist.rip/groups/ST/toolkit/BCM/documents/proposedmodes/gcm/gcm-spec.pdf
+        '''
+
+        key = "feffe9928665731c6d6a8f9467308308".upper()
+        initialization_vector = bytes.fromhex("cafebabefacedbaddecaf888")
+        plain_text = bytes.fromhex("d9313225f88406e5a55909c5aff5269a86a7a9531534f7da2e4c303d8a318a721c3c0c95956809532fcf0e2449a6b525b16aedf5aa0de657ba637b39")
+        cypher_text = bytes.fromhex("42831ec2217774244b7221b784d0d49ce3aa212f2c02a4e035c17e2329aca12e21d514b25466931c7d8f6a5aac84aa051ba30b396a0aac973d58e091")
+        tag = bytes.fromhex("5bc94fbc3221a5db94fae95ae7121a47")
+        additional_data = bytes.fromhex("feedfacedeadbeeffeedfacedeadbeefabaddad2")
+
+        aes_128_gcm = AES_GCM_128(key)
+        print("Testing Truncated Tags With AES 128 Galois/Counter Mode")
+        self.assertEqual(aes_128_gcm.authenticatedDecryptionBytes(initialization_vector, cypher_text, additional_data, tag), plain_text)
+        self.assertEqual(aes_128_gcm.authenticatedDecryptionBytes(initialization_vector, cypher_text, additional_data, tag[:12], 96), plain_text)
+        for truncated_length in [0, 1, 12, 15]:
+            print(f"Tag Of {truncated_length} Bytes : {tag[:truncated_length].hex().upper()}")
+            self.assertIsNone(aes_128_gcm.authenticatedDecryptionBytes(initialization_vector, cypher_text, additional_data, tag[:truncated_length]))
+        self.assertIsNone(aes_128_gcm.authenticatedDecryptionBytes(initialization_vector, cypher_text, additional_data, tag, 96))
+        with self.assertRaises(ValueError):
+            aes_128_gcm.authenticatedDecryptionBytes(initialization_vector, cypher_text, additional_data, tag[:1], 8)
+
 
 if __name__ == '__main__':
     print("Testing AES With Galois/Counter Mode")
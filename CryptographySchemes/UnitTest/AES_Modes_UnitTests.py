@@ -1,4 +1,7 @@
 import unittest
+import mmap
+import tempfile
+import io
 from CryptographySchemes.SymmetricEncryptionAlgorithms.AES_ModesOfOperation import*
 from HelperFunctions.IntegerHandler import *
 
@@ -769,6 +772,401 @@ class AES_UnitTest(unittest.TestCase):
         print(f"Expected Plain Text  : {expected_results}")
         print(f"Decrypted Text       : {result_list}")
 
+    def test_aes_ecb_128_3bytes(self):
+        '''
+        This method tests that encrypting and decrypting bytes for AES 128 in Electronic Cookbook (ECB) Mode matches the hex list results
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        expected_cypher_text = bytes.fromhex("3AD77BB40D7A3660A89ECAF32466EF97"
+                                             "F5D3D58503B9699DE785895A96FDBAAF"
+                                             "43B1CD7F598ECE23881B00E3ED030688"
+                                             "7B0C785E27E8AD3F8223207104725DD4")
+
+        cypher_text = self.aes_ecb_128.encrypt(plain_text)
+        decrypted_text = self.aes_ecb_128.decrypt(cypher_text)
+        print("Testing Byte Encryption With AES 128 In Electronic Cookbook (ECB) Mode")
+        print(f"Plain Text           : {plain_text.hex().upper()}")
+        print(f"Expected Cypher Text : {expected_cypher_text.hex().upper()}")
+        print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        self.assertEqual(expected_cypher_text, cypher_text)
+        self.assertEqual(plain_text, decrypted_text)
+
+    def test_aes_ecb_256_3bytes(self):
+        '''
+        This method tests that encrypting and decrypting bytes for AES 256 in Electronic Cookbook (ECB) Mode matches the hex list results
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        expected_cypher_text = bytes.fromhex("F3EED1BDB5D2A03C064B5A7E3DB181F8"
+                                             "591CCB10D410ED26DC5BA74A31362870"
+                                             "B6ED21B99CA6F4F9F153E7B1BEAFED1D"
+                                             "23304B7A39F9F3FF067D8D8F9E24ECC7")
+
+        cypher_text = self.aes_ecb_256.encrypt(plain_text)
+        decrypted_text = self.aes_ecb_256.decrypt(cypher_text)
+        print("Testing Byte Encryption With AES 256 In Electronic Cookbook (ECB) Mode")
+        print(f"Plain Text           : {plain_text.hex().upper()}")
+        print(f"Expected Cypher Text : {expected_cypher_text.hex().upper()}")
+        print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        self.assertEqual(expected_cypher_text, cypher_text)
+        self.assertEqual(plain_text, decrypted_text)
+
+    def test_aes_cbc_128_3bytes(self):
+        '''
+        This method tests that encrypting and decrypting bytes for AES 128 in Cipher Block Chaining (CBC) Mode matches the hex list results
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        expected_cypher_text = bytes.fromhex("7649ABAC8119B246CEE98E9B12E9197D"
+                                             "5086CB9B507219EE95DB113A917678B2"
+                                             "73BED6B8E3C1743B7116E69E22229516"
+                                             "3FF1CAA1681FAC09120ECA307586E1A7")
+
+        cypher_text = self.aes_cbc_128.encrypt(plain_text, bytes.fromhex(self.initialization_vector))
+        decrypted_text = self.aes_cbc_128.decrypt(cypher_text, bytes.fromhex(self.initialization_vector))
+        print("Testing Byte Encryption With AES 128 In Cipher Block Chaining (CBC) Mode")
+        print(f"Plain Text           : {plain_text.hex().upper()}")
+        print(f"Expected Cypher Text : {expected_cypher_text.hex().upper()}")
+        print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        self.assertEqual(expected_cypher_text, cypher_text)
+        self.assertEqual(plain_text, decrypted_text)
+
+    def test_aes_cfb_128_3bytes(self):
+        '''
+        This method tests that encrypting and decrypting bytes for AES 128 in Cipher Feedback (CFB) Mode With 8 Bits matches the hex list results
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        expected_cypher_text = bytes.fromhex("3B79424C9C0DD436BACE9E0ED4586A4F"
+                                             "32B9DED50AE3BA69D472E88267FB5052"
+                                             "70CBAD1E257691F7C47C5038297EDDA3"
+                                             "2FF26D0ED19174096161ECC14086DD62")
+
+        cypher_text = self.aes_cfb8_128.encrypt(plain_text, bytes.fromhex(self.initialization_vector))
+        decrypted_text = self.aes_cfb8_128.decrypt(cypher_text, bytes.fromhex(self.initialization_vector))
+        print("Testing Byte Encryption With AES 128 In Cipher Feedback (CFB) Mode With 8 Bits")
+        print(f"Plain Text           : {plain_text.hex().upper()}")
+        print(f"Expected Cypher Text : {expected_cypher_text.hex().upper()}")
+        print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        self.assertEqual(expected_cypher_text, cypher_text)
+        self.assertEqual(plain_text, decrypted_text)
+
+    def test_aes_cfb1_128_3bytes(self):
+        '''
+        This method tests that encrypting and decrypting bytes for AES 128 in Cipher Feedback (CFB) Mode With 1 Bit matches the hex list results
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        expected_cypher_text = bytes.fromhex("68B3A264F838F5F8C3101070D1AB4C2E"
+                                             "22E7F950383A0B71ADE4FAD0095CB188"
+                                             "A57972C3C1882615F7511411FBEBF119"
+                                             "3997069704FC1D1F27028434C99E60F4")
+
+        cypher_text = self.aes_cfb1_128.encrypt(plain_text, bytes.fromhex(self.initialization_vector))
+        decrypted_text = self.aes_cfb1_128.decrypt(cypher_text, bytes.fromhex(self.initialization_vector))
+        print("Testing Byte Encryption With AES 128 In Cipher Feedback (CFB) Mode With 1 Bit")
+        print(f"Plain Text           : {plain_text.hex().upper()}")
+        print(f"Expected Cypher Text : {expected_cypher_text.hex().upper()}")
+        print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        self.assertEqual(expected_cypher_text, cypher_text)
+        self.assertEqual(plain_text, decrypted_text)
+
+    def test_aes_cfb128_128_3bytes(self):
+        '''
+        This method tests that encrypting and decrypting bytes for AES 128 in Cipher Feedback (CFB) Mode With 128 Bits matches the hex list results
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        expected_cypher_text = bytes.fromhex("3B3FD92EB72DAD20333449F8E83CFB4A"
+                                             "C8A64537A0B3A93FCDE3CDAD9F1CE58B"
+                                             "26751F67A3CBB140B1808CF187A4F4DF"
+                                             "C04B05357C5D1C0EEAC4C66F9FF7F2E6")
+
+        cypher_text = self.aes_cfb128_128.encrypt(plain_text, bytes.fromhex(self.initialization_vector))
+        decrypted_text = self.aes_cfb128_128.decrypt(cypher_text, bytes.fromhex(self.initialization_vector))
+        print("Testing Byte Encryption With AES 128 In Cipher Feedback (CFB) Mode With 128 Bits")
+        print(f"Plain Text           : {plain_text.hex().upper()}")
+        print(f"Expected Cypher Text : {expected_cypher_text.hex().upper()}")
+        print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        self.assertEqual(expected_cypher_text, cypher_text)
+        self.assertEqual(plain_text, decrypted_text)
+
+    def test_aes_cfb128_128_4unaligned(self):
+        '''
+        This method tests that AES 128 in Cipher Feedback (CFB) Mode With 128 Bits encrypts a partial final segment,
+        matching the first bytes of the full block cypher text and decrypting back to the plain text
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C")
+        expected_cypher_text = bytes.fromhex("3B3FD92EB72DAD20333449F8E83CFB4A"
+                                             "C8A64537A0B3A93F")
+
+        cypher_text = self.aes_cfb128_128.encrypt(plain_text, bytes.fromhex(self.initialization_vector))
+        decrypted_text = self.aes_cfb128_128.decrypt(cypher_text, bytes.fromhex(self.initialization_vector))
+        print("Testing Unaligned Byte Encryption With AES 128 In Cipher Feedback (CFB) Mode With 128 Bits")
+        print(f"Plain Text           : {plain_text.hex().upper()}")
+        print(f"Expected Cypher Text : {expected_cypher_text.hex().upper()}")
+        print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        self.assertEqual(expected_cypher_text, cypher_text)
+        self.assertEqual(plain_text, decrypted_text)
+
+    def test_aes_ofb_128_3bytes(self):
+        '''
+        This method tests that encrypting and decrypting bytes for AES 128 in Output Feedback (OFB) Mode matches the hex list results
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        expected_cypher_text = bytes.fromhex("3B3FD92EB72DAD20333449F8E83CFB4A"
+                                             "7789508D16918F03F53C52DAC54ED825"
+                                             "9740051E9C5FECF64344F7A82260EDCC"
+                                             "304C6528F659C77866A510D9C1D6AE5E")
+
+        cypher_text = self.aes_ofb_128.encrypt(plain_text, bytes.fromhex(self.initialization_vector))
+        decrypted_text = self.aes_ofb_128.decrypt(cypher_text, bytes.fromhex(self.initialization_vector))
+        print("Testing Byte Encryption With AES 128 In Output Feedback (OFB) Mode")
+        print(f"Plain Text           : {plain_text.hex().upper()}")
+        print(f"Expected Cypher Text : {expected_cypher_text.hex().upper()}")
+        print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        self.assertEqual(expected_cypher_text, cypher_text)
+        self.assertEqual(plain_text, decrypted_text)
+
+    def test_aes_ctr_128_3bytes(self):
+        '''
+        This method tests that encrypting and decrypting bytes for AES 128 in Counter (CTR) Mode matches the hex list results
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        expected_cypher_text = bytes.fromhex("874D6191B620E3261BEF6864990DB6CE"
+                                             "9806F66B7970FDFF8617187BB9FFFDFF"
+                                             "5AE4DF3EDBD5D35E5B4F09020DB03EAB"
+                                             "1E031DDA2FBE03D1792170A0F3009CEE")
+
+        cypher_text = self.aes_ctr_128.encrypt(plain_text, bytes.fromhex(self.initialization_counter))
+        decrypted_text = self.aes_ctr_128.decrypt(cypher_text, bytes.fromhex(self.initialization_counter))
+        print("Testing Byte Encryption With AES 128 In Counter (CTR) Mode")
+        print(f"Plain Text           : {plain_text.hex().upper()}")
+        print(f"Expected Cypher Text : {expected_cypher_text.hex().upper()}")
+        print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        self.assertEqual(expected_cypher_text, cypher_text)
+        self.assertEqual(plain_text, decrypted_text)
+
+    def test_aes_ecb_128_parallel(self):
+        '''
+        This method tests that encrypting and decrypting bytes for AES 128 in Electronic Codebook (ECB) Mode across a worker pool
+        matches the serial results, using chunks of two blocks, with the worker pool reused until the mode is closed
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        expected_cypher_text = bytes.fromhex("3AD77BB40D7A3660A89ECAF32466EF97"
+                                             "F5D3D58503B9699DE785895A96FDBAAF"
+                                             "43B1CD7F598ECE23881B00E3ED030688"
+                                             "7B0C785E27E8AD3F8223207104725DD4")
+
+        with AES_ECB_128(self.aes_ecb_128.key) as aes_ecb_128:
+            aes_ecb_128.parallel_threshold = 0
+            aes_ecb_128.parallel_chunk_size = 32
+            aes_ecb_128.parallel_workers = 2
+            cypher_text = aes_ecb_128.encrypt(plain_text)
+            executor = aes_ecb_128.parallel_executor
+            decrypted_text = aes_ecb_128.decrypt(cypher_text)
+            self.assertIsNotNone(executor)
+            self.assertIs(executor, aes_ecb_128.parallel_executor)
+            with self.assertRaises(ValueError):
+                aes_ecb_128.decrypt(cypher_text[:-1])
+        self.assertIsNone(aes_ecb_128.parallel_executor)
+        print("Testing Parallel Byte Encryption With AES 128 In Electronic Codebook (ECB) Mode")
+        print(f"Plain Text           : {plain_text.hex().upper()}")
+        print(f"Expected Cypher Text : {expected_cypher_text.hex().upper()}")
+        print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        self.assertEqual(expected_cypher_text, cypher_text)
+        self.assertEqual(plain_text, decrypted_text)
+
+    def test_aes_cbc_128_parallel(self):
+        '''
+        This method tests that decrypting bytes and hex lists for AES 128 in Cipher Block Chaining (CBC) Mode across a worker pool
+        matches the serial results, using chunks of one block
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        cypher_text = bytes.fromhex("7649ABAC8119B246CEE98E9B12E9197D"
+                                    "5086CB9B507219EE95DB113A917678B2"
+                                    "73BED6B8E3C1743B7116E69E22229516"
+                                    "3FF1CAA1681FAC09120ECA307586E1A7")
+
+        aes_cbc_128 = AES_CBC_128(self.aes_cbc_128.key)
+        aes_cbc_128.parallel_threshold = 0
+        aes_cbc_128.parallel_chunk_size = 16
+        aes_cbc_128.parallel_workers = 2
+        decrypted_text = aes_cbc_128.decrypt(cypher_text, bytes.fromhex(self.initialization_vector))
+        decrypted_list = aes_cbc_128.decryptHexList(aes_cbc_128.bytesToHexList(cypher_text), self.initialization_vector)
+        with self.assertRaises(ValueError):
+            aes_cbc_128.decrypt(cypher_text[:40], bytes.fromhex(self.initialization_vector))
+        aes_cbc_128.close()
+        print("Testing Parallel Byte Decryption With AES 128 In Cipher Block Chaining (CBC) Mode")
+        print(f"Cypher Text          : {cypher_text.hex().upper()}")
+        print(f"Expected Plain Text  : {plain_text.hex().upper()}")
+        print(f"Decrypted Text       : {decrypted_text.hex().upper()}")
+        print(f"Decrypted List       : {decrypted_list}")
+        self.assertEqual(plain_text, decrypted_text)
+        self.assertEqual(aes_cbc_128.bytesToHexList(plain_text), decrypted_list)
+
+    def test_aes_ctr_128_decrypt_range(self):
+        '''
+        This method tests decrypting byte ranges from the middle of AES 128 Counter (CTR) Mode cypher text,
+        with partial leading and trailing blocks, from bytes and from an mmap
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        cypher_text = bytes.fromhex("874D6191B620E3261BEF6864990DB6CE"
+                                    "9806F66B7970FDFF8617187BB9FFFDFF"
+                                    "5AE4DF3EDBD5D35E5B4F09020DB03EAB"
+                                    "1E031DDA2FBE03D1792170A0F3009CEE")
+        initial_counter = bytes.fromhex(self.initialization_counter)
+
+        with tempfile.TemporaryFile() as file:
+            file.write(cypher_text)
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_cypher_text:
+                for offset, length in [(0, 64), (16, 16), (5, 7), (13, 40), (31, 33), (60, 10)]:
+                    decrypted_range = self.aes_ctr_128.decryptRange(cypher_text, initial_counter, offset, length)
+                    mapped_range = self.aes_ctr_128.decryptRange(mapped_cypher_text, initial_counter, offset, length)
+                    print(f"Testing Range Decryption With AES 128 In Counter (CTR) Mode From Offset {offset} With Length {length}")
+                    print(f"Expected Plain Text  : {plain_text[offset:offset+length].hex().upper()}")
+                    print(f"Decrypted Range      : {decrypted_range.hex().upper()}")
+                    self.assertEqual(plain_text[offset:offset+length], decrypted_range)
+                    self.assertEqual(plain_text[offset:offset+length], mapped_range)
+
+        for offset, length in [(-1, 16), (16, -1), (-16, -16)]:
+            with self.assertRaises(ValueError):
+                self.aes_ctr_128.decryptRange(cypher_text, initial_counter, offset, length)
+
+    def test_aes_stream_128(self):
+        '''
+        This method tests that streaming encryption and decryption with AES 128 carries the chaining state between chunks
+        in Electronic Codebook (ECB), Cipher Block Chaining (CBC), Cipher Feedback (CFB), Output Feedback (OFB) and Counter (CTR) Mode,
+        and that the modes without padding handle a stream which ends part way through a block
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        test_cases = [("Electronic Codebook (ECB)", self.aes_ecb_128, (), "3AD77BB40D7A3660A89ECAF32466EF97F5D3D58503B9699DE785895A96FDBAAF"
+                                                                        "43B1CD7F598ECE23881B00E3ED0306887B0C785E27E8AD3F8223207104725DD4"),
+                      ("Cipher Block Chaining (CBC)", self.aes_cbc_128, (bytes.fromhex(self.initialization_vector),), "7649ABAC8119B246CEE98E9B12E9197D5086CB9B507219EE95DB113A917678B2"
+                                                                                                                  "73BED6B8E3C1743B7116E69E222295163FF1CAA1681FAC09120ECA307586E1A7"),
+                      ("Cipher Feedback (CFB) 128 Bit", self.aes_cfb128_128, (bytes.fromhex(self.initialization_vector),), "3B3FD92EB72DAD20333449F8E83CFB4AC8A64537A0B3A93FCDE3CDAD9F1CE58B"
+                                                                                                                           "26751F67A3CBB140B1808CF187A4F4DFC04B05357C5D1C0EEAC4C66F9FF7F2E6"),
+                      ("Output Feedback (OFB)", self.aes_ofb_128, (bytes.fromhex(self.initialization_vector),), "3B3FD92EB72DAD20333449F8E83CFB4A7789508D16918F03F53C52DAC54ED825"
+                                                                                                          "9740051E9C5FECF64344F7A82260EDCC304C6528F659C77866A510D9C1D6AE5E"),
+                      ("Counter (CTR)", self.aes_ctr_128, (bytes.fromhex(self.initialization_counter),), "874D6191B620E3261BEF6864990DB6CE9806F66B7970FDFF8617187BB9FFFDFF"
+                                                                                                   "5AE4DF3EDBD5D35E5B4F09020DB03EAB1E031DDA2FBE03D1792170A0F3009CEE")]
+
+        for mode_name, aes, initialization_vector, expected_cypher_text in test_cases:
+            for chunk_size in [16, 48]:
+                encrypted_stream = io.BytesIO()
+                decrypted_stream = io.BytesIO()
+                aes.encryptStream(io.BytesIO(plain_text), encrypted_stream, *initialization_vector, chunk_size=chunk_size)
+                aes.decryptStream(io.BytesIO(encrypted_stream.getvalue()), decrypted_stream, *initialization_vector, chunk_size=chunk_size)
+                print(f"Testing Stream Encryption With AES 128 In {mode_name} Mode With {chunk_size} Byte Chunks")
+                print(f"Expected Cypher Text : {expected_cypher_text}")
+                print(f"Encrypted Text       : {encrypted_stream.getvalue().hex().upper()}")
+                print(f"Decrypted Text       : {decrypted_stream.getvalue().hex().upper()}")
+                self.assertEqual(expected_cypher_text, encrypted_stream.getvalue().hex().upper())
+                self.assertEqual(plain_text, decrypted_stream.getvalue())
+
+        unaligned_length = 37
+        for mode_name, aes, initialization_vector, expected_cypher_text in test_cases[2:]:
+            for chunk_size in [16, 48]:
+                encrypted_stream = io.BytesIO()
+                decrypted_stream = io.BytesIO()
+                aes.encryptStream(io.BytesIO(plain_text[:unaligned_length]), encrypted_stream, *initialization_vector, chunk_size=chunk_size)
+                aes.decryptStream(io.BytesIO(encrypted_stream.getvalue()), decrypted_stream, *initialization_vector, chunk_size=chunk_size)
+                print(f"Testing {unaligned_length} Byte Stream Encryption With AES 128 In {mode_name} Mode With {chunk_size} Byte Chunks")
+                print(f"Expected Cypher Text : {expected_cypher_text[:unaligned_length * 2]}")
+                print(f"Encrypted Text       : {encrypted_stream.getvalue().hex().upper()}")
+                print(f"Decrypted Text       : {decrypted_stream.getvalue().hex().upper()}")
+                self.assertEqual(expected_cypher_text[:unaligned_length * 2], encrypted_stream.getvalue().hex().upper())
+                self.assertEqual(plain_text[:unaligned_length], decrypted_stream.getvalue())
+
+    def test_aes_keystream_producer_128(self):
+        '''
+        This method tests that encrypting with a precomputed keystream gives the same results as AES 128 in
+        Output Feedback (OFB) and Counter (CTR) Mode, with the data split unevenly between calls
+        Uses test vectors from https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf
+        '''
+        plain_text = bytes.fromhex("6BC1BEE22E409F96E93D7E117393172A"
+                                   "AE2D8A571E03AC9C9EB76FAC45AF8E51"
+                                   "30C81C46A35CE411E5FBC1191A0A52EF"
+                                   "F69F2445DF4F9B17AD2B417BE66C3710")
+        test_cases = [("Output Feedback (OFB)", self.aes_ofb_128, self.initialization_vector, "3B3FD92EB72DAD20333449F8E83CFB4A7789508D16918F03F53C52DAC54ED825"
+                                                                                            "9740051E9C5FECF64344F7A82260EDCC304C6528F659C77866A510D9C1D6AE5E"),
+                      ("Counter (CTR)", self.aes_ctr_128, self.initialization_counter, "874D6191B620E3261BEF6864990DB6CE9806F66B7970FDFF8617187BB9FFFDFF"
+                                                                                     "5AE4DF3EDBD5D35E5B4F09020DB03EAB1E031DDA2FBE03D1792170A0F3009CEE")]
+
+        for mode_name, aes, initialization_vector, expected_cypher_text in test_cases:
+            producer = AES_KeystreamProducer(aes, bytes.fromhex(initialization_vector), queue_depth=2)
+            cypher_text = producer.xorBytes(plain_text[:5]) + producer.xorBytes(plain_text[5:40]) + producer.xorBytes(plain_text[40:])
+            producer.stop()
+            producer = AES_KeystreamProducer(aes, bytes.fromhex(initialization_vector), queue_depth=2)
+            decrypted_list = producer.xorHexList(aes.bytesToHexList(cypher_text))
+            producer.stop()
+            print(f"Testing Precomputed Keystream Encryption With AES 128 In {mode_name} Mode")
+            print(f"Expected Cypher Text : {expected_cypher_text}")
+            print(f"Encrypted Text       : {cypher_text.hex().upper()}")
+            print(f"Decrypted List       : {decrypted_list}")
+            print(f"Hits : {producer.hits}  Misses : {producer.misses}")
+            self.assertEqual(expected_cypher_text, cypher_text.hex().upper())
+            self.assertEqual(aes.bytesToHexList(plain_text), decrypted_list)
+            self.assertEqual(producer.hits + producer.misses, 4)
+            with self.assertRaises(ValueError):
+                producer.keystream(16)
+
 if __name__ == '__main__':
     print("Testing AES With Block Cypher Modes Of Operation")
     print("Electronic Cookbook (ECB) Mode, Cipher Block Chaining (CBC) Mode, Cipher Feedback (CFB) Mode, Output Feedback (OFB) Mode and Counter (CTR) Mode")
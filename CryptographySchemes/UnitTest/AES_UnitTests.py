@@ -242,6 +242,47 @@ class AES_UnitTest(unittest.TestCase):
         print(mixed_columns)
         self.assertEqual(mixed_columns,expected_result)
 
+    def test_table_cypher_matches_matrix_cypher(self):
+        '''
+        This method tests that the table based cypher gives the same result as the 4x4 matrix cypher
+        for each key length
+        '''
+
+        hex_to_encrypt = ["6BC1BEE22E409F96E93D7E117393172A",
+                          "00000000000000000000000000000000",
+                          "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF",
+                          "00112233445566778899aabbccddeeff"]
+        for aes in [self.aes_128, self.aes_192, self.aes_256]:
+            matrix_aes = type(aes)(aes.key, use_tables=False)
+            for hex_block in hex_to_encrypt:
+                table_result = aes.cypher(hex_block)
+                matrix_result = matrix_aes.cypher(hex_block)
+                print(f"AES {aes.key_length} : {hex_block}")
+                print(f"Table  : {table_result}")
+                print(f"Matrix : {matrix_result}")
+                self.assertEqual(table_result, matrix_result)
+
+    def test_table_inverse_cypher_matches_matrix_inverse_cypher(self):
+        '''
+        This method tests that the equivalent inverse cypher gives the same result as the 4x4 matrix inverse cypher
+        and that it reverses the table based cypher for each key length
+        '''
+
+        hex_to_decrypt = ["3AD77BB40D7A3660A89ECAF32466EF97",
+                          "00000000000000000000000000000000",
+                          "FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF",
+                          "00112233445566778899AABBCCDDEEFF"]
+        for aes in [self.aes_128, self.aes_192, self.aes_256]:
+            matrix_aes = type(aes)(aes.key, use_tables=False)
+            for hex_block in hex_to_decrypt:
+                table_result = aes.inverseCypher(hex_block)
+                matrix_result = matrix_aes.inverseCypher(hex_block)
+                print(f"AES {aes.key_length} : {hex_block}")
+                print(f"Table  : {table_result}")
+                print(f"Matrix : {matrix_result}")
+                self.assertEqual(table_result, matrix_result)
+                self.assertEqual(aes.cypher(table_result), hex_block)
+
     
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -617,6 +617,126 @@ class CMAS_UnitTest(unittest.TestCase):
         print(f"Tag         : {tag}")
         print(f"Verified    : {"The tag was successfully verified" if verified else "The tag failed verification"}")
 
+    def test_aes128_streaming_context(self):
+        '''
+        This method tests CMAC with the AES 128 block cypher when the four block message is added to a context in uneven chunks
+
+        CMAC is Laid Out In Nist SP 800-38b : https://nvlpubs.nist.gov/nistpubs/SpecialPublications/NIST.SP.800-38b.pdf
+        Test vectors from https://csrc.nist.gov/CSRC/media/Projects/Cryptographic-Standards-and-Guidelines/documents/examples/AES_CMAC.pdf
+        '''
+
+        key = "2B7E1516 28AED2A6 ABF71588 09CF4F3C".replace(" ","")
+        plain_text = bytes.fromhex("6BC1BEE2 2E409F96 E93D7E11 7393172A AE2D8A57 1E03AC9C 9EB76FAC 45AF8E51 30C81C46 A35CE411 E5FBC119 1A0A52EF F69F2445 DF4F9B17 AD2B417B E66C3710".replace(" ",""))
+        expected_tags = {64: "51F0BEBF 7E3B9D92 FC497417 79363CFE".replace(" ",""),
+                         40: "DFA66747 DE9AE630 30CA3261 1497C827".replace(" ",""),
+                         16: "070A16B4 6B4D4144 F79BDD9D D04A287C".replace(" ",""),
+                         0: "BB1D6929 E9593728 7FA37D12 9B756746".replace(" ","")}
+
+        cmac = CMAC_AES128(key=key)
+        for message_length, expected_tag in expected_tags.items():
+            context = cmac.createContext()
+            truncated_context = cmac.createContext(tag_length=64)
+            offset = 0
+            chunk_sizes = [1, 7, 16, 5, 9, 32]
+            for chunk_size in chunk_sizes:
+                context.update(plain_text[offset:min(offset + chunk_size, message_length)])
+                truncated_context.update(plain_text[offset:min(offset + chunk_size, message_length)])
+                offset = min(offset + chunk_size, message_length)
+            tag = context.finalize()
+            verified = context.verify(tag)
+
+            print(f"Testing Streaming CMAC With AES 128 And A {message_length} Byte Message")
+            print(f"Tag         : {tag.hex().upper()}")
+            print(f"Expected    : {expected_tag}")
+            print(f"Verified    : {verified}")
+            self.assertEqual(tag.hex().upper(), expected_tag)
+            self.assertTrue(verified)
+            self.assertFalse(context.verify(bytes(16)))
+            self.assertEqual(truncated_context.finalize(), tag[:8])
+            self.assertTrue(truncated_context.verify(tag[:8]))
+
+            # a tag which is not exactly the tag length of the context is rejected, even if it matches the start of the tag
+            for truncated_length in [0, 1, 8, 15]:
+                self.assertFalse(context.verify(tag[:truncated_length]))
+            self.assertFalse(truncated_context.verify(tag[:1]))
+            self.assertFalse(truncated_context.verify(tag))
+        with self.assertRaises(ValueError):
+            cmac.createContext(tag_length=60)
+
+    def test_aes128_update_after_finalize(self):
+        '''
+        This method tests that a CMAC context can not have more of the message added once its tag has been generated,
+        so the tag never silently covers only part of the message
+        '''
+
+        key = "2B7E1516 28AED2A6 ABF71588 09CF4F3C".replace(" ","")
+        cmac = CMAC_AES128(key=key)
+        context = cmac.createContext()
+        context.update(b"hello")
+        tag = context.finalize()
+
+        print("Testing Adding To A CMAC Context With AES 128 After It Is Finalized")
+        print(f"Tag         : {tag.hex().upper()}")
+        with self.assertRaises(ValueError):
+            context.update(b" world")
+        self.assertEqual(context.finalize(), tag)
+        self.assertEqual(tag.hex().upper(), cmac.cmacGeneration(b"hello".hex(), 128))
+
+    def test_aes128_verify_many(self):
+        '''
+        This method tests verifying a batch of CMAC tags which use two keys across a worker pool, including tampered tags, an unknown key
+        and tags which are shorter or longer than the tag length
+
+        Test vectors from https://csrc.nist.gov/CSRC/media/Projects/Cryptographic-Standards-and-Guidelines/documents/examples/AES_CMAC.pdf
+        '''
+
+        keys = {"first" : "2B7E1516 28AED2A6 ABF71588 09CF4F3C".replace(" ",""),
+                "second" : "000102030405060708090A0B0C0D0E0F"}
+        plain_text = bytes.fromhex("6BC1BEE2 2E409F96 E93D7E11 7393172A AE2D8A57 1E03AC9C 9EB76FAC 45AF8E51 30C81C46 A35CE411 E5FBC119 1A0A52EF F69F2445 DF4F9B17 AD2B417B E66C3710".replace(" ",""))
+        records = []
+        expected_bits = 0
+        for index in range(20):
+            key_id = "first" if index % 3 else "second"
+            message = plain_text[:index * 3]
+            context = CMAC_AES128(key=keys[key_id]).createContext(tag_length=64)
+            context.update(message)
+            tag = context.finalize()
+            if index % 4 == 1:
+                tag = bytes([tag[0] ^ 0x01]) + tag[1:]
+            elif index == 6:
+                key_id = "unknown"
+            else:
+                expected_bits |= 1 << index
+            records.append((key_id, message, tag))
+        records.append(("first", plain_text, bytes.fromhex("51F0BEBF7E3B9D92")))
+        expected_bits |= 1 << 20
+        records.append(("first", plain_text, bytes.fromhex("51")))
+        records.append(("first", plain_text, b""))
+        records.append(("first", plain_text, bytes.fromhex("51F0BEBF7E3B9D92FC49741779363CFE")))
+
+        with CMAC_BatchVerifier(CMAC_AES128, keys, 64, max_workers=2, chunk_size=3) as verifier:
+            verified_bits = verifier.verifyMany(records)
+            executor = verifier.executor
+            second_bits = verifier.verifyMany(records[::-1])
+            self.assertIs(executor, verifier.executor)
+        self.assertIsNone(verifier.executor)
+        serial_bits = CMAC_BatchVerifier(CMAC_AES128, keys, 64, max_workers=1).verifyMany(records)
+
+        print(f"Testing Batched CMAC Verification With AES 128 And {len(records)} Records")
+        print(f"Verified    : {verified_bits:024b}")
+        print(f"Expected    : {expected_bits:024b}")
+        print(f"Statistics  : {verifier.batch_statistics}")
+        self.assertEqual(verified_bits, expected_bits)
+        self.assertEqual(serial_bits, expected_bits)
+        self.assertEqual(second_bits, int(f"{expected_bits:0{len(records)}b}"[::-1], 2))
+        self.assertEqual(verifier.batch_statistics["records"], len(records))
+        self.assertEqual(verifier.batch_statistics["verified"], bin(expected_bits).count("1"))
+        for tag_length in [60, 0, 136, 256]:
+            with self.assertRaises(ValueError):
+                CMAC_BatchVerifier(CMAC_AES128, keys, tag_length)
+        with self.assertRaises(ValueError):
+            CMAC_BatchVerifier(CMAC_3DES, keys, 128)
+
 if __name__ == '__main__':
     print("- - - - - - - - - - - -")
     print("Testing CMAC")
@@ -89,6 +89,79 @@ class DES_UnitTest(unittest.TestCase):
             self.assertEqual(decrypted,expected_results[i])
             print(f"Cypher Text : {hex_to_decrypt[i]}  ->  Plain Text : {decrypted} (expected was {expected_results[i]})")
 
+    def test_des_table_cypher_matches_string_cypher(self):
+        '''
+        This method tests that the integer implementation with lookup tables gives the same results as the binary string implementation
+        '''
+
+        hex_keys = ["0101010101010101", "133457799BBCDFF1", "0123456789ABCDEF", "FEDCBA9876543210"]
+        hex_blocks = ["0000000000000000", "0123456789ABCDEF", "95F8A5E5DD31D900", "FFFFFFFFFFFFFFFF"]
+        for hex_key in hex_keys:
+            table_des = DataEncryptionStandard(hex_key, is_hex_key=True)
+            string_des = DataEncryptionStandard(hex_key, is_hex_key=True, use_tables=False)
+            for hex_block in hex_blocks:
+                binary_block = format(int(hex_block, 16), "064b")
+                table_encrypted = table_des.encryptSingleBlock(binary_block)
+                string_encrypted = string_des.encryptSingleBlock(binary_block)
+                print(f"Key : {hex_key}  Plain Text : {hex_block}  ->  Table Cypher Text : {int(table_encrypted, 2):016X} String Cypher Text : {int(string_encrypted, 2):016X}")
+                self.assertEqual(table_encrypted, string_encrypted)
+                self.assertEqual(table_des.decryptSingleBlock(table_encrypted), binary_block)
+                self.assertEqual(table_des.decryptSingleBlock(binary_block), string_des.decryptSingleBlock(binary_block))
+
+    def test_des_cached_round_keys(self):
+        '''
+        This method tests that the key schedule computed on ints once per key matches the binary string key schedule
+        and that instances with the same key share the cached schedule
+        '''
+
+        hex_key = "133457799BBCDFF1"
+        des = DataEncryptionStandard(hex_key, is_hex_key=True)
+        string_round_keys = [int(key_for_round, 2) for key_for_round in des.generateKeysForEachRound()]
+        print(f"Key : {hex_key}")
+        print(f"Round Keys        : {[f'{key_for_round:012X}' for key_for_round in des.round_keys]}")
+        print(f"String Round Keys : {[f'{key_for_round:012X}' for key_for_round in string_round_keys]}")
+        self.assertEqual(list(des.round_keys), string_round_keys)
+        self.assertEqual(des.round_keys[0], 0x1B02EFFC7072)
+        self.assertIs(DataEncryptionStandard(hex_key, is_hex_key=True).round_keys, des.round_keys)
+        self.assertEqual(list(des.inverse_round_keys), string_round_keys[::-1])
+        for short_key in ["133457799BBCDF", "1334"]:
+            with self.assertRaises(ValueError):
+                DataEncryptionStandard(short_key, is_hex_key=True)
+
+    def test_des_bitsliced_many(self):
+        '''
+        This method tests the bitsliced batch DES against the known answers for a single key and against the scalar cypher for many keys
+
+        Test vectors are from page 28 of "Validating the correctness of hardware implementations of the NBS data encryption standard" by Jason Gait in 1977
+        https://archive.org/details/validatingcorrec00gait/page/28/mode/2up
+        '''
+
+        hex_to_encrypt   = ["95F8A5E5DD31D900", "DD7F121CA5015619", "2E8653104F3834EA", "4BD388FF6CD81D4F"]
+        expected_results = ["8000000000000000", "4000000000000000", "2000000000000000", "1000000000000000"]
+        bitsliced_des = BitslicedDataEncryptionStandard()
+        encrypted = bitsliced_des.encryptMany([0x0101010101010101], [int(hex_block, 16) for hex_block in hex_to_encrypt])
+        encrypted = [f"{block:016X}" for block in encrypted]
+        print(f"Plain Text  : {hex_to_encrypt}")
+        print(f"Cypher Text : {encrypted} (expected was {expected_results})")
+        self.assertEqual(encrypted, expected_results)
+
+        hex_keys = ["133457799BBCDFF1", "0123456789ABCDEF", "FEDCBA9876543210", "0E329232EA6D0D73", "FFFFFFFFFFFFFFFF"]
+        blocks = [0x0123456789ABCDEF, 0x0000000000000000, 0xFFFFFFFFFFFFFFFF, 0x8787878787878787, 0x95F8A5E5DD31D900]
+        expected_blocks = [DataEncryptionStandard(hex_key, is_hex_key=True).cypherBlockValue(block, DataEncryptionStandard(hex_key, is_hex_key=True).round_keys) for hex_key, block in zip(hex_keys, blocks)]
+        encrypted_blocks = bitsliced_des.encryptMany([int(hex_key, 16) for hex_key in hex_keys], blocks)
+        print(f"Bitsliced Cypher Text : {[f'{block:016X}' for block in encrypted_blocks]}")
+        print(f"Scalar Cypher Text    : {[f'{block:016X}' for block in expected_blocks]}")
+        self.assertEqual(encrypted_blocks, expected_blocks)
+        self.assertEqual(encrypted_blocks[0], 0x85E813540F0AB405)
+        self.assertEqual(bitsliced_des.decryptMany([int(hex_key, 16) for hex_key in hex_keys], encrypted_blocks), blocks)
+
+        for keys, out_of_range_blocks in [([1 << 64], blocks), ([-1], blocks), ([int(hex_key, 16) for hex_key in hex_keys], blocks[:4] + [1 << 64]),
+                                          ([0x0101010101010101], [-1]), ([0x0101010101010101, 1 << 65], blocks[:2])]:
+            with self.assertRaises(ValueError):
+                bitsliced_des.encryptMany(keys, out_of_range_blocks)
+            with self.assertRaises(ValueError):
+                bitsliced_des.decryptMany(keys, out_of_range_blocks)
+
 if __name__ == '__main__':
     print("- - - - - - - - - - - -")
     print("Testing Data Encryption Standard (DES) Implementation")
@@ -0,0 +1,112 @@
+import unittest
+from CryptographySchemes.MessageAuthenticationCodes.GMAC import *
+
+class GMAC_UnitTest(unittest.TestCase):
+    '''
+    This class contains basic unit tests for GMAC
+    '''
+
+    def setUp(self):
+        print("- - - - - - - - - - - -")
+
+    def test_aes128_gmac(self):
+        '''
+        This method tests GMAC with AES 128 using a GCM test vector with no plain text
+
+        GMAC is Laid Out In Nist SP 800-38d : https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38d.pdf
+        Test vector from the NIST CAVP GCM test vectors, gcmEncryptExtIV128 with PTlen = 0 and AADlen = 128
+        '''
+
+        key = "77be63708971c4e240d1cb79e8d77feb".upper()
+        initialization_vector = bytes.fromhex("e0e00f19fed7ba0136a797f3")
+        data = bytes.fromhex("7a43ec1d9c0a5a78a0b16533a6213cab")
+        expected_tag = "209fcc8d3675ed938e9c7166709dd946".upper()
+
+        for table_bits in [4, 8]:
+            gmac = GMAC_AES128(key, table_bits=table_bits)
+            tag = gmac.gmacGeneration(initialization_vector, data)
+            verified = gmac.gmacVerification(initialization_vector, data, tag, 128)
+
+            print(f"Testing GMAC With AES 128 And {table_bits} Bit GHASH Tables")
+            print(f"Data        : {data.hex().upper()}")
+            print(f"Tag         : {tag.hex().upper()}")
+            print(f"Verified    : {verified}")
+            self.assertEqual(tag.hex().upper(), expected_tag)
+            self.assertTrue(verified)
+
+    def test_incremental_gmac(self):
+        '''
+        This method tests that adding the data to a GMAC context in chunks gives the same tag as a single call,
+        and that it matches AES GCM with an empty plain text
+        '''
+
+        key = "feffe9928665731c6d6a8f9467308308feffe9928665731c6d6a8f9467308308".upper()
+        initialization_vector = bytes.fromhex("cafebabefacedbaddecaf888")
+        data = bytes(range(0, 256)) + bytes(range(0, 37))
+
+        gmac = GMAC_AES256(key)
+        expected_tag = gmac.gmacGeneration(initialization_vector, data)
+        context = gmac.createContext(initialization_vector)
+        for start in range(0, len(data), 23):
+            context.update(data[start:start+23])
+        tag = context.finalize()
+        _, gcm_tag = gmac.gcm.authenticatedEncryption(initialization_vector.hex().upper(), "", data.hex().upper(), 128)
+
+        print("Testing Incremental GMAC With AES 256")
+        print(f"Expected Tag : {expected_tag.hex().upper()}")
+        print(f"Tag          : {tag.hex().upper()}")
+        print(f"GCM Tag      : {gcm_tag.getHexString()}")
+        self.assertEqual(tag, expected_tag)
+        self.assertEqual(tag.hex().upper(), gcm_tag.getHexString())
+
+    def test_gmac_verification_failure(self):
+        '''
+        This method tests that GMAC verification fails when the data or tag has been changed
+        '''
+
+        key = "8e73b0f7da0e6452c810f32b809079e562f8ead2522c6b7b".upper()
+        initialization_vector = bytes.fromhex("cafebabefacedbad")
+        data = b"authenticated but not encrypted"
+
+        gmac = GMAC_AES192(key)
+        tag = gmac.gmacGeneration(initialization_vector, data, 96)
+        tampered_tag = bytes([tag[0] ^ 1]) + tag[1:]
+
+        print("Testing GMAC Verification Failure With AES 192")
+        print(f"Tag         : {tag.hex().upper()}")
+        self.assertEqual(len(tag), 12)
+        self.assertTrue(gmac.gmacVerification(initialization_vector, data, tag, 96))
+        self.assertFalse(gmac.gmacVerification(initialization_vector, data + b".", tag, 96))
+        self.assertFalse(gmac.gmacVerification(initialization_vector, data, tampered_tag, 96))
+
+    def test_gmac_truncated_tag_rejected(self):
+        '''
+        This method tests that GMAC verification rejects an empty or truncated tag for any data,
+        and that only the tag lengths from NIST SP 800-38d can be used
+        '''
+
+        key = "8e73b0f7da0e6452c810f32b809079e562f8ead2522c6b7b".upper()
+        initialization_vector = bytes.fromhex("cafebabefacedbad")
+        data = b"authenticated but not encrypted"
+
+        gmac = GMAC_AES192(key)
+        tag = gmac.gmacGeneration(initialization_vector, data)
+
+        print("Testing GMAC Rejects Empty And Truncated Tags With AES 192")
+        print(f"Tag         : {tag.hex().upper()}")
+        self.assertTrue(gmac.gmacVerification(initialization_vector, data, tag, 128))
+        self.assertFalse(gmac.gmacVerification(initialization_vector, data, b"", 128))
+        self.assertFalse(gmac.gmacVerification(initialization_vector, b"forged data", b"", 128))
+        self.assertFalse(gmac.gmacVerification(initialization_vector, data, tag[:1], 128))
+        self.assertFalse(gmac.gmacVerification(initialization_vector, data, tag[:12], 128))
+        self.assertFalse(gmac.gmacVerification(initialization_vector, data, tag, 96))
+        with self.assertRaises(ValueError):
+            gmac.gmacVerification(initialization_vector, data, tag[:1], 8)
+        with self.assertRaises(ValueError):
+            gmac.gmacGeneration(initialization_vector, data, 0)
+
+if __name__ == '__main__':
+    print("- - - - - - - - - - - -")
+    print("Testing GMAC")
+    print("GMAC is Laid Out In Nist SP 800-38d : https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38d.pdf")
+    unittest.main()
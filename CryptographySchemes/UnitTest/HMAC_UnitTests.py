@@ -268,6 +268,30 @@ class HMAC_UnitTests(unittest.TestCase):
         
         self.assertEqual(result.getHexString(),expected_handler.getHexString())
 
+    def test_context_matches_hmac(self):
+        '''
+        This function tests that the keyed hmac context, with its cached key states, gives the same macs as HMAC for every variant
+        '''
+
+        short_key = "00010203 04050607 08090A0B 0C0D0E0F 10111213 14151617 18191A1B"
+        long_key = "00" * 200
+        messages = ["Sample message for keylen<blocklen", "Another message under the same key", "", "héllo wörld"]
+        for hmac in [HMAC_SHA224(), HMAC_SHA256(), HMAC_SHA384(), HMAC_SHA512(), HMAC_SHA512_224(), HMAC_SHA512_256(),
+                     HMAC_SHA3_224(), HMAC_SHA3_256(), HMAC_SHA3_384(), HMAC_SHA3_512()]:
+            for key in [short_key, long_key]:
+                context = hmac.createContext(key)
+                for message in messages:
+                    expected = hmac.HMAC(message=message, key=key)
+                    result = context.HMAC(message)
+                    print(f"Testing {type(hmac).__name__} Context With Message: \"{message}\"")
+                    print(f"Expected HMAC : {expected.getHexString(add_spacing=8)}")
+                    print(f"Context HMAC  : {result.getHexString(add_spacing=8)}")
+                    self.assertEqual(result.getHexString(), expected.getHexString())
+                    message_bytes = IntegerHandler.fromString(message, False, len(message) * 8).getValue().to_bytes(len(message), "big")
+                    self.assertTrue(context.verifyMac(message_bytes, bytes.fromhex(expected.getHexString())))
+                self.assertFalse(context.verifyMac(b"tampered", bytes.fromhex(expected.getHexString())))
+
+
 if __name__ == '__main__':
     print("- - - - - - - - - - - -")
     print("Testing HMAC Implementations Against Known Values")
@@ -114,6 +114,47 @@ class SHA3_UnitTest(unittest.TestCase):
 
         for test in sha512_tests:
             test.runTest(self, sha512, 512)
+
+    def test_word_path_matches_integer_handler_path(self):
+        '''
+        This method tests that processing blocks as plain integer words gives the same hashes as the IntegerHandler path
+        '''
+
+        print("Testing Word Path Against IntegerHandler Path")
+        inputs = [("", 0), ("616263", 3), ("55"*130, 130), ("ABC", 4)]
+        for word_hash, handler_hash in [(SHA1(), SHA1(use_words=False)), (SHA224(), SHA224(use_words=False)), (SHA256(), SHA256(use_words=False)),
+                                        (SHA384(), SHA384(use_words=False)), (SHA512(), SHA512(use_words=False)),
+                                        (SHA512_224(), SHA512_224(use_words=False)), (SHA512_256(), SHA512_256(use_words=False))]:
+            for input, bytes in inputs:
+                word_result = word_hash.hashAHexString(input, bytes)
+                handler_result = handler_hash.hashAHexString(input, bytes)
+                print(f"{type(word_hash).__name__} \"{input[:20]}\", {bytes} bytes")
+                print(f"Word path           : {word_result.getHexString(add_spacing=8)}")
+                print(f"IntegerHandler path : {handler_result.getHexString(add_spacing=8)}")
+                self.assertEqual(word_result.getHexString(), handler_result.getHexString())
+            self.assertEqual(word_hash.hashAString("abc").getHexString(), handler_hash.hashAString("abc").getHexString())
+
+    def test_incremental_hasher(self):
+        '''
+        This method tests that the incremental hasher gives the same hashes as hashAHexString when the message is split across several updates
+        '''
+
+        print("Testing Incremental Hasher")
+        message = bytes(range(0, 256)) * 3
+        for hash in [SHA1(), SHA224(), SHA256(), SHA384(), SHA512(), SHA512_224(), SHA512_256()]:
+            expected = hash.hashAHexString(message.hex(), len(message)).getHexString()
+            hasher = hash.createHasher(message[:3])
+            hasher.update(message[3:130])
+            prefix_hasher = hasher.copy()
+            hasher.update(message[130:])
+            print(f"{type(hash).__name__}")
+            print(f"Expected hash : {expected}")
+            print(f"Actual hash   : {hasher.hexdigest()}")
+            self.assertEqual(hasher.hexdigest(), expected)
+            self.assertEqual(hasher.digest(), bytes.fromhex(expected))
+
+            prefix_hasher.update(message[130:])
+            self.assertEqual(prefix_hasher.hexdigest(), expected)
    
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
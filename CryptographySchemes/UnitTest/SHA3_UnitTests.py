@@ -439,5 +439,102 @@ class SHA3_UnitTest(unittest.TestCase):
         self.assertEqual(result.getHexString(),handler_expected.getHexString()[:digest_length_hex])
 
 
+    def test_keccak_lanes_matches_state_array(self):
+        '''
+        This function tests that the lane oriented keccak f gives the same result as the bit oriented state array
+        '''
+
+        print("Testing Keccak Lanes Against State Array")
+        handler_before = SHA3_ValueHandler.fromHexString("A3 1F 5C 07 E9 42" * 33 + "D3 02")
+        expected = Keccak.keccak_f(handler_before)
+        lanes = Keccak_Lanes.keccak_f(Keccak_Lanes.lanesFromBitArray(handler_before.bit_array))
+        result = SHA3_ValueHandler(Keccak_Lanes.bitArrayFromLanes(lanes))
+        print(f"expected : {expected.getHexString()}")
+        print(f"lanes    : {result.getHexString()}")
+
+        self.assertEqual(result, expected)
+
+    def test_sponge_use_lanes(self):
+        '''
+        This function tests that the sha3 and shake sponges give identical digests with and without the lane oriented keccak f
+        '''
+
+        print("Testing Sponge With And Without Lanes")
+        bit_array_input = [1,1,0,0,1,0,1,0,0,0,0,1,1,0,1,0,1,1,0,1,1,1,1,0,1,0,0,1,1,0] * 40
+        for sha3 in [SHA3_224(), SHA3_512()]:
+            lanes_result = sha3.hashBitArray(bit_array_input)
+            input_handler = SHA3_ValueHandler(bit_array_input).concatenate(SHA3_ValueHandler([0,1]))
+            state_array_result = sha3.sponge(input_handler, use_lanes=False)
+            print(f"{sha3.function_name} lanes       : {lanes_result.getHexString()}")
+            print(f"{sha3.function_name} state array : {state_array_result.getHexString()}")
+            self.assertEqual(lanes_result, state_array_result)
+
+        shake = SHAKE_128()
+        digest_length = 1600
+        lanes_result = shake.hashBitArray(bit_array_input, digest_length)
+        input_handler = SHA3_ValueHandler(bit_array_input).concatenate(SHA3_ValueHandler([1,1,1,1]))
+        state_array_result = shake.sponge(input_handler, digest_length, use_lanes=False)
+        print(f"Shake-128 lanes       : {lanes_result.getHexString()}")
+        print(f"Shake-128 state array : {state_array_result.getHexString()}")
+        self.assertEqual(lanes_result, state_array_result)
+
+
+    def test_sha3_hasher_update(self):
+        '''
+        This function tests that the incremental sha3 hasher matches the one shot hash when the message is split across several updates
+        '''
+
+        print("Testing Incremental SHA3 Hasher")
+        message = bytes(range(0, 256)) * 2
+        for sha3 in [SHA3_224(), SHA3_256(), SHA3_384(), SHA3_512()]:
+            expected = sha3.hashHex(message.hex()).getHexString()
+            hasher = sha3.createHasher(message[:5])
+            hasher.update(message[5:200])
+            prefix_hasher = hasher.copy()
+            hasher.update(message[200:])
+            print(f"{sha3.function_name} expected : {expected}")
+            print(f"{sha3.function_name} digest   : {hasher.hexdigest()}")
+            self.assertEqual(hasher.hexdigest(), expected)
+            self.assertEqual(hasher.digest(), bytes.fromhex(expected))
+
+            prefix_hasher.update(message[200:])
+            self.assertEqual(prefix_hasher.hexdigest(), expected)
+
+    def test_shake_hasher_update(self):
+        '''
+        This function tests that the incremental shake hasher matches the one shot hash when the message is split across several updates
+        '''
+
+        print("Testing Incremental SHAKE Hasher")
+        message = bytes(range(0, 256)) * 2
+        digest_length = 300
+        for shake in [SHAKE_128(), SHAKE_256()]:
+            expected = shake.hashHex(message.hex(), digest_length * 8).getHexString()
+            hasher = shake.createHasher()
+            for i in range(0, len(message), 100):
+                hasher.update(message[i:i + 100])
+            print(f"{shake.function_name} expected : {expected}")
+            print(f"{shake.function_name} digest   : {hasher.hexdigest(digest_length)}")
+            self.assertEqual(hasher.hexdigest(digest_length), expected)
+
+
+    def test_shake_reader(self):
+        '''
+        This function tests that reading shake output in pieces of varying sizes matches a single digest of the full length
+        '''
+
+        print("Testing SHAKE Reader")
+        message = bytes(range(0, 200))
+        for shake in [SHAKE_128(), SHAKE_256()]:
+            expected = shake.createHasher(message).digest(1000)
+            reader = shake.createHasher(message).reader()
+            result = b""
+            for read_length in [0, 1, 167, 168, 200, 64, 400]:
+                result += reader.read(read_length)
+            print(f"{shake.function_name} expected : {expected.hex().upper()}")
+            print(f"{shake.function_name} read     : {result.hex().upper()}")
+            self.assertEqual(result, expected)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,4 +1,5 @@
 import unittest
+import io
 from CryptographySchemes.SymmetricEncryptionAlgorithms.TripleDataEncryptionStandard import*
 from HelperFunctions.IntegerHandler import *
 
@@ -294,6 +295,84 @@ class TDES_UnitTest(unittest.TestCase):
         print(f"Expected Plain Text  : {expected_results}")
         print(f"Decrypted Text       : {result_hex}")
 
+    def test_tdes_cbc_3stream(self):
+        '''
+        This method tests that streaming encryption and decryption in Cypher Block Chaining (CBC) mode carries the
+        initialization vector between chunks, using chunks of one and three blocks
+        according to https://github.com/coruus/nist-testvectors/blob/master/csrc.nist.gov/groups/ST/toolkit/documents/Examples/TDES_ModesA_All.txt
+        '''
+
+        plain_text       = bytes.fromhex("6BC1BEE2 2E409F96 E93D7E11 7393172A AE2D8A57 1E03AC9C 9EB76FAC 45AF8E51".replace(" ",""))
+        expected_results = bytes.fromhex("2079C3D5 3AA763E1 93B79E25 69AB5262 51657048 1F25B50F 73C0BDA8 5C8E0DA7".replace(" ",""))
+
+        key = "01234567 89ABCDEF 23456789 ABCDEF01 456789AB CDEF0123".replace(" ","")
+        initialization_vector = "F69F2445DF4F9B17"
+
+        tdes = TDES_CBC(key=key, is_hex_key=True)
+        for chunk_size in [8, 24]:
+            encrypted_stream = io.BytesIO()
+            decrypted_stream = io.BytesIO()
+            tdes.encryptStream(io.BytesIO(plain_text), encrypted_stream, initialization_vector, chunk_size)
+            tdes.decryptStream(io.BytesIO(encrypted_stream.getvalue()), decrypted_stream, initialization_vector, chunk_size)
+            print(f"Testing Stream Encryption With Triple Data Encryption Standard In Cypher Block Chaining (CBC) Mode With {chunk_size} Byte Chunks")
+            print(f"Plain Text           : {plain_text.hex().upper()}")
+            print(f"Expected Cypher Text : {expected_results.hex().upper()}")
+            print(f"Encrypted Text       : {encrypted_stream.getvalue().hex().upper()}")
+            print(f"Decrypted Text       : {decrypted_stream.getvalue().hex().upper()}")
+            self.assertEqual(expected_results, encrypted_stream.getvalue())
+            self.assertEqual(plain_text, decrypted_stream.getvalue())
+
+    def test_tdes_ctr_3stream(self):
+        '''
+        This method tests that streaming encryption and decryption in Counter (CTR) mode advances the counter between
+        chunks and handles a partial final block
+        according to https://github.com/coruus/nist-testvectors/blob/master/csrc.nist.gov/groups/ST/toolkit/documents/Examples/TDES_ModesA_All.txt
+        '''
+
+        plain_text       = bytes.fromhex("6BC1BEE2 2E409F96 E93D7E11 7393172A AE2D8A57 1E03AC9C 9EB76FAC 45AF".replace(" ",""))
+        expected_results = bytes.fromhex("078BB74E 59CE7ED6 19AA11D2 5004FB65 A03CEDF1 BA0B09BA A3BC81B8 F69C".replace(" ",""))
+
+        key = "01234567 89ABCDEF 23456789 ABCDEF01 456789AB CDEF0123".replace(" ","")
+        initialization_vector = "F69F2445DF4F9B17"
+
+        tdes = TDES_CTR(key=key, is_hex_key=True)
+        for chunk_size in [8, 16]:
+            encrypted_stream = io.BytesIO()
+            decrypted_stream = io.BytesIO()
+            tdes.encryptStream(io.BytesIO(plain_text), encrypted_stream, initialization_vector, chunk_size)
+            tdes.decryptStream(io.BytesIO(encrypted_stream.getvalue()), decrypted_stream, initialization_vector, chunk_size)
+            print(f"Testing Stream Encryption With Triple Data Encryption Standard In Counter (CTR) Mode With {chunk_size} Byte Chunks")
+            print(f"Plain Text           : {plain_text.hex().upper()}")
+            print(f"Expected Cypher Text : {expected_results.hex().upper()}")
+            print(f"Encrypted Text       : {encrypted_stream.getvalue().hex().upper()}")
+            print(f"Decrypted Text       : {decrypted_stream.getvalue().hex().upper()}")
+            self.assertEqual(expected_results, encrypted_stream.getvalue())
+            self.assertEqual(plain_text, decrypted_stream.getvalue())
+
+    def test_tdes_fused_block(self):
+        '''
+        This method tests that the fused encrypt-decrypt-encrypt block matches running the three des stages one after the other
+        according to https://csrc.nist.gov/CSRC/media/Projects/Cryptographic-Standards-and-Guidelines/documents/examples/TDES_Core.pdf
+        '''
+
+        key = "0123456789ABCDEF23456789ABCDEF010123456789ABCDEF"
+        plain_text = 0x6BC1BEE22E409F96
+        expected_result = 0x06EDE3D82884090A
+
+        tdes = TripleDataEncryptionStandard(hex_key=key)
+        encrypted = tdes.encryptBlockValue(plain_text)
+        staged = tdes.des_3.encryptHexMessage(tdes.des_2.decryptHexMessage(tdes.des_1.encryptHexMessage(f"{plain_text:016X}")))
+        decrypted = tdes.decryptBlockValue(encrypted)
+        print("Testing The Fused Triple Data Encryption Standard Block")
+        print(f"Plain Text           : {plain_text:016X}")
+        print(f"Expected Cypher Text : {expected_result:016X}")
+        print(f"Encrypted Text       : {encrypted:016X}")
+        print(f"Staged Cypher Text   : {staged}")
+        print(f"Decrypted Text       : {decrypted:016X}")
+        self.assertEqual(expected_result, encrypted)
+        self.assertEqual(f"{expected_result:016X}", staged)
+        self.assertEqual(plain_text, decrypted)
+
 if __name__ == '__main__':
     print("Testing TDES With Block Cypher Modes Of Operation")
     print("https://nvlpubs.nist.gov/nistpubs/Legacy/SP/nistspecialpublication800-38a.pdf")
@@ -0,0 +1,62 @@
+def readChunk(source, buffer:memoryview) -> int:
+    '''
+    This method fills a buffer from a binary stream using readinto, repeating short reads until the buffer is full or the stream ends
+
+    Parameters :
+        source : binary stream
+            The stream being read, which must support readinto
+        buffer : memoryview
+            The reusable buffer to be filled
+
+    Returns :
+        length : int
+            The number of bytes read, which is less than the buffer length only at the end of the stream
+    '''
+
+    length = 0
+    while length < len(buffer):
+        read_length = source.readinto(buffer[length:])
+        if not read_length:
+            break
+        length += read_length
+    return length
+
+def processStream(source, destination, chunk_size:int, block_bytes:int, process_chunk, state) -> int:
+    '''
+    This method runs a block cypher mode over a binary stream one chunk at a time, using a single reusable read buffer
+
+    Every chunk apart from the last is a whole number of blocks, so padding is only ever applied to the final chunk,
+    and the mode's chaining state (initialization vector, feedback register or counter) is carried between chunks
+
+    Parameters :
+        source : binary stream
+            The stream being read, which must support readinto
+        destination : binary stream
+            The stream the result is written to
+        chunk_size : int
+            The number of bytes to process at a time, rounded down to a whole number of blocks
+        block_bytes : int
+            The block size of the cypher in bytes
+        process_chunk : function
+            Takes a chunk and the current state and returns the result for the chunk and the next state
+        state : any
+            The chaining state before the first chunk
+
+    Returns :
+        length : int
+            The number of bytes written to the destination
+    '''
+
+    chunk_size = max(block_bytes, chunk_size - chunk_size % block_bytes)
+    buffer = memoryview(bytearray(chunk_size))
+    written_length = 0
+    while True:
+        length = readChunk(source, buffer)
+        if length == 0:
+            break
+        result, state = process_chunk(buffer[:length], state)
+        destination.write(result)
+        written_length += len(result)
+        if length < chunk_size:
+            break
+    return written_length